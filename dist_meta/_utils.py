@@ -28,13 +28,22 @@ Private utility functions.
 
 # stdlib
 import functools
+import hashlib
+import json
 import os
 import pathlib
 import re
-from typing import Callable, Iterator, Tuple, TypeVar
+import stat
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Iterator, List, NamedTuple, Optional, Tuple, TypeVar
 
 # 3rd party
 from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
 from packaging.utils import InvalidWheelFilename, canonicalize_name
 from packaging.version import Version
 
@@ -43,21 +52,200 @@ _escaped_name_re = re.compile(r"^[\w\d._]*$", re.UNICODE)
 SHOULD_CACHE = int(os.environ.get("DIST_META_CACHE", 1))
 
 _C = TypeVar("_C", bound=Callable)
+_T = TypeVar("_T")
+_K = TypeVar("_K")
 
 
-def _cache(func: _C) -> _C:
-	if SHOULD_CACHE:
-		return functools.lru_cache()(func)  # type: ignore[return-value]
-	else:  # pragma: no cover
-		return func
+class CacheInfo(NamedTuple):
+	"""
+	Statistics for one of ``dist_meta``'s caches.
 
+	The fields are the same as those returned by ``cache_info()`` for a :func:`functools.lru_cache`.
 
-@_cache
+	.. versionadded:: 0.10.0
+	"""
+
+	#: The number of lookups which were answered from the cache.
+	hits: int
+
+	#: The number of lookups which were not in the cache.
+	misses: int
+
+	#: The maximum number of entries in the cache, or :py:obj:`None` if it is unbounded.
+	maxsize: Optional[int]
+
+	#: The current number of entries in the cache.
+	currsize: int
+
+
+# Every cache in dist_meta by name, each with cache_info(), cache_clear() and cache_resize() methods.
+# Managed by the public dist_meta.cache module.
+_caches: Dict[str, Any] = {}
+
+
+class _DisabledCache:
+	# Registered in place of each cache when caching is disabled with DIST_META_CACHE=0.
+
+	def cache_info(self) -> CacheInfo:
+		return CacheInfo(0, 0, 0, 0)
+
+	def cache_clear(self) -> None:
+		pass
+
+	def cache_resize(self, maxsize: Optional[int]) -> None:
+		pass
+
+
+class _LRUCacheHandle:
+	"""
+	The registry entry for a function cached with :func:`functools.lru_cache`.
+
+	:param func: The cached function.
+	"""
+
+	__slots__ = ("func", )
+
+	def __init__(self, func: Any):
+		self.func = func
+
+	def cache_info(self) -> CacheInfo:
+		return CacheInfo(*self.func.cache_info())
+
+	def cache_clear(self) -> None:
+		self.func.cache_clear()
+
+	def cache_resize(self, maxsize: Optional[int]) -> None:
+		# An lru_cache's size is fixed, so it is replaced, discarding the existing entries.
+		# The new cache is rebound everywhere the old one was imported within dist_meta,
+		# so cache hits don't go through an extra layer of indirection.
+
+		old, new = self.func, functools.lru_cache(maxsize=maxsize)(self.func.__wrapped__)
+
+		for module_name, module in list(sys.modules.items()):
+			if module is None or not (module_name == "dist_meta" or module_name.startswith("dist_meta.")):
+				continue
+
+			for attr, value in list(vars(module).items()):
+				if value is old:
+					setattr(module, attr, new)
+
+		self.func = new
+
+
+def _cache(name: str, maxsize: Optional[int] = None) -> Callable[[_C], _C]:
+	# A functools.lru_cache registered as ``name``, which can be resized at runtime.
+
+	def decorator(func: _C) -> _C:
+		if not SHOULD_CACHE:  # pragma: no cover
+			_caches[name] = _DisabledCache()
+			return func
+
+		cached = functools.lru_cache(maxsize=maxsize)(func)
+		_caches[name] = _LRUCacheHandle(cached)
+		return cached  # type: ignore[return-value]
+
+	return decorator
+
+
+class _LRUDict(Generic[_K, _T]):
+	"""
+	A thread-safe least-recently-used mapping, which records hit and miss statistics.
+
+	:param maxsize: The maximum number of entries, or :py:obj:`None` for no limit.
+	"""
+
+	def __init__(self, maxsize: Optional[int]):
+		self.maxsize = maxsize
+		self._entries: "OrderedDict[_K, _T]" = OrderedDict()
+		self._lock = threading.Lock()
+		self._hits = self._misses = 0
+
+	def get(self, key: _K, is_valid: Optional[Callable[[_T], bool]] = None) -> Optional[_T]:
+		"""
+		Returns the value for ``key``, or :py:obj:`None` if it is missing or ``is_valid`` returns :py:obj:`False`.
+		"""
+
+		with self._lock:
+			value = self._entries.get(key)
+
+			if value is None or (is_valid is not None and not is_valid(value)):
+				self._misses += 1
+				return None
+
+			self._hits += 1
+			self._entries.move_to_end(key)
+			return value
+
+	def __setitem__(self, key: _K, value: _T) -> None:
+		with self._lock:
+			self._entries[key] = value
+			self._entries.move_to_end(key)
+			self._trim()
+
+	def _trim(self) -> None:
+		if self.maxsize is not None:
+			while len(self._entries) > max(self.maxsize, 0):
+				self._entries.popitem(last=False)
+
+	def cache_info(self) -> CacheInfo:
+		with self._lock:
+			return CacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
+
+	def cache_clear(self) -> None:
+		with self._lock:
+			self._entries.clear()
+			self._hits = self._misses = 0
+
+	def cache_resize(self, maxsize: Optional[int]) -> None:
+		with self._lock:
+			self.maxsize = maxsize
+			self._trim()
+
+
+class _ContentCache(_LRUDict[bytes, _T]):
+	"""
+	A least-recently-used cache for functions of a single, potentially large, string.
+
+	Entries are keyed on a digest of the string rather than the string itself,
+	so the text is not kept alive by the cache.
+	Cached values are shared between callers, so ``func`` should return immutable objects other than :py:obj:`None`.
+	"""
+
+	def __init__(self, func: Callable[[str], _T], maxsize: Optional[int]):
+		super().__init__(maxsize)
+		self._func = func
+		functools.update_wrapper(self, func)
+
+	def __call__(self, text: str) -> _T:
+		key = hashlib.blake2b(text.encode("UTF-8", "surrogatepass"), digest_size=16).digest()
+
+		value = self.get(key)
+		if value is None:
+			value = self[key] = self._func(text)
+
+		return value
+
+
+def _content_cache(name: str, maxsize: Optional[int]) -> Callable[[Callable[[str], _T]], Callable[[str], _T]]:
+	# Like _cache, but for functions of file contents.
+
+	def decorator(func: Callable[[str], _T]) -> Callable[[str], _T]:
+		if not SHOULD_CACHE:  # pragma: no cover
+			_caches[name] = _DisabledCache()
+			return func
+
+		cache = _caches[name] = _ContentCache(func, maxsize)
+		return cache
+
+	return decorator
+
+
+@_cache("canonicalize_name")
 def _canonicalize(name: str) -> str:
 	return canonicalize_name(name)
 
 
-@_cache
+@_cache("parse_wheel_filename")
 def _parse_wheel_filename(filename: pathlib.PurePath) -> Tuple[str, Version]:
 	# From https://github.com/pypa/packaging
 	# This software is made available under the terms of *either* of the licenses
@@ -96,6 +284,65 @@ def _iter_dist_infos(basedir: PathPlus) -> Iterator[os.DirEntry]:
 			yield subdir
 
 
-@_cache
+def _list_dist_infos(basedir: PathPlus) -> List[str]:
+	if not basedir.is_dir():
+		return []
+
+	# Names starting with a tilde are temporary directories created by pip
+	return [subdir.name for subdir in _iter_dist_infos(basedir) if subdir.name[0] != '~']
+
+
+def _dir_signature(path: PathLike) -> Optional[Tuple[int, int]]:
+	"""
+	Returns the ``(mtime_ns, inode)`` of the directory ``path``, or :py:obj:`None` if it is not a directory.
+
+	The modification time of a directory changes whenever an entry is added, removed or renamed.
+	"""
+
+	try:
+		st = os.stat(path)
+	except OSError:
+		return None
+
+	if not stat.S_ISDIR(st.st_mode):
+		return None
+
+	return st.st_mtime_ns, st.st_ino
+
+
+def _is_racy(mtime_ns: int) -> bool:
+	# Changes made within the same timestamp granularity as a scan may not be reflected in the mtime.
+	# Don't trust signatures which are too recent (c.f. git's "racy clean" problem).
+	return time.time_ns() - mtime_ns < 2_000_000_000
+
+
+def _read_json(filename: PathLike) -> Optional[Dict[str, Any]]:
+	try:
+		with open(filename, encoding="UTF-8") as fp:
+			data = json.load(fp)
+	except (OSError, ValueError):
+		return None
+
+	if not isinstance(data, dict):
+		return None
+
+	return data
+
+
+def _write_json(filename: PathLike, data: Dict[str, Any]) -> None:
+	# Write to a temporary file and move into place, so concurrent readers never see a partial file.
+	filename = os.fspath(filename)
+	fd, tmp_filename = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(filename)), suffix=".tmp")
+
+	try:
+		with os.fdopen(fd, 'w', encoding="UTF-8") as fp:
+			json.dump(data, fp, separators=(',', ':'))
+		os.replace(tmp_filename, filename)
+	except BaseException:
+		os.unlink(tmp_filename)
+		raise
+
+
+@_cache("parse_version")
 def _parse_version(version: str) -> Version:
 	return Version(version)
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+#
+#  _zip.py
+"""
+Zip file support for reading wheel metadata.
+"""
+#
+#  Copyright © 2021 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#  EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+#  MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+#  IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+#  DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+#  OR OTHER DEALINGS IN THE SOFTWARE.
+#
+
+# stdlib
+import bisect
+import inspect
+import mmap
+import struct
+import zipfile
+from binascii import crc32
+from typing import List, Union
+
+# 3rd party
+import handy_archives
+
+__all__ = ("DistInfoZipFile", )
+
+# The layout of central directory records; see APPNOTE.TXT section 4.3.12
+_CD_STRUCT = struct.Struct(zipfile.structCentralDir)
+_CD_SIZE = _CD_STRUCT.size  # 46
+_CD_SIGNATURE = zipfile.stringCentralDir
+_CD_LENGTHS = struct.Struct("<3H")  # filename, extra field and comment lengths
+_CD_LENGTHS_OFFSET = 28
+_CD_HEADER_OFFSET = struct.Struct("<L")  # relative offset of local header
+_CD_HEADER_OFFSET_OFFSET = 42
+_UTF8_FLAG = 0x800
+
+_DIST_INFO_SUFFIX = b".dist-info"
+
+# Python 3.12+ records where each member's data must end, to reject overlapping members (zip bombs).
+_HAS_END_OFFSET = hasattr(zipfile.ZipInfo, "_end_offset")
+
+# Python 3.12+ passes the CRC of the raw filename, for the Info-ZIP Unicode Path extra field.
+_DECODE_EXTRA_TAKES_CRC = len(inspect.signature(zipfile.ZipInfo._decodeExtra).parameters) > 1
+
+
+class DistInfoZipFile(handy_archives.ZipFile):
+	"""
+	A :class:`handy_archives.ZipFile` which only reads the central directory entries
+	for members of top-level ``*.dist-info`` directories.
+
+	Opening a wheel with :class:`zipfile.ZipFile` creates a :class:`zipfile.ZipInfo` for every member,
+	which for wheels with many files takes longer than reading the metadata itself.
+	Here the central directory is scanned without decoding the records of other members,
+	so those members are absent from :meth:`~zipfile.ZipFile.namelist` and cannot be read.
+
+	Only reading is supported.
+	"""  # noqa: D400
+
+	def _RealGetContents(self) -> None:  # noqa: MAN002
+		fp = self.fp
+		try:
+			endrec = zipfile._EndRecData(fp)  # type: ignore[attr-defined]
+		except OSError:
+			raise zipfile.BadZipFile("File is not a zip file")
+		if not endrec:
+			raise zipfile.BadZipFile("File is not a zip file")
+
+		size_cd = endrec[zipfile._ECD_SIZE]  # type: ignore[attr-defined]
+		offset_cd = endrec[zipfile._ECD_OFFSET]  # type: ignore[attr-defined]
+		self._comment = endrec[zipfile._ECD_COMMENT]  # type: ignore[attr-defined]
+
+		# "concat" is zero, unless zip was concatenated to another file
+		concat = endrec[zipfile._ECD_LOCATION] - size_cd - offset_cd  # type: ignore[attr-defined]
+		if endrec[zipfile._ECD_SIGNATURE] == zipfile.stringEndArchive64:  # type: ignore[attr-defined]
+			concat -= (zipfile.sizeEndCentDir64 + zipfile.sizeEndCentDir64Locator)  # type: ignore[attr-defined]
+
+		self.start_dir = offset_cd + concat
+		if self.start_dir < 0:
+			raise zipfile.BadZipFile("Bad offset for central directory")
+
+		try:
+			mapped = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)  # type: ignore[union-attr]
+		except (AttributeError, OSError, ValueError):
+			# Not a real file (e.g. io.BytesIO), or the platform can't map it.
+			fp.seek(self.start_dir, 0)  # type: ignore[union-attr]
+			self._scan_central_directory(fp.read(size_cd), 0, size_cd, concat)  # type: ignore[union-attr]
+		else:
+			with mapped:
+				if self.start_dir + size_cd > len(mapped):
+					raise zipfile.BadZipFile("Truncated central directory")
+				self._scan_central_directory(mapped, self.start_dir, size_cd, concat)
+
+	def _scan_central_directory(self, data: Union[bytes, mmap.mmap], start: int, size: int, concat: int) -> None:
+		"""
+		Create :class:`zipfile.ZipInfo` objects for the ``*.dist-info`` members in the central directory.
+
+		:param data: A buffer containing the central directory.
+		:param start: The offset of the central directory in ``data``.
+		:param size: The size of the central directory.
+		:param concat: The offset of the start of the zip file in the underlying file.
+		"""
+
+		metadata_encoding = getattr(self, "metadata_encoding", None) or "cp437"
+		pos = start
+		end = start + size
+		header_offsets: List[int] = []
+
+		while pos < end:
+			if pos + _CD_SIZE > end:
+				raise zipfile.BadZipFile("Truncated central directory")
+			if data[pos:pos + 4] != _CD_SIGNATURE:
+				raise zipfile.BadZipFile("Bad magic number for central directory")
+
+			filename_length, extra_length, comment_length = _CD_LENGTHS.unpack_from(data, pos + _CD_LENGTHS_OFFSET)
+			filename_start = pos + _CD_SIZE
+			next_pos = filename_start + filename_length + extra_length + comment_length
+
+			raw_filename = data[filename_start:filename_start + filename_length]
+			slash = raw_filename.find(b'/')
+
+			if slash == -1 or not raw_filename[:slash].endswith(_DIST_INFO_SUFFIX):
+				# Not in a top-level *.dist-info directory
+				if _HAS_END_OFFSET:
+					header_offset = _CD_HEADER_OFFSET.unpack_from(data, pos + _CD_HEADER_OFFSET_OFFSET)[0]
+					if header_offset == 0xFFFFFFFF:  # pragma: no cover
+						# Stored in the ZIP64 extra field
+						header_offset = self._decode_zip64_header_offset(data, pos)
+					header_offsets.append(header_offset + concat)
+				pos = next_pos
+				continue
+
+			centdir = _CD_STRUCT.unpack_from(data, pos)
+			flags = centdir[5]
+			if flags & _UTF8_FLAG:
+				filename = raw_filename.decode("UTF-8")
+			else:
+				filename = raw_filename.decode(metadata_encoding)
+
+			# The rest is as zipfile.ZipFile._RealGetContents
+			x = zipfile.ZipInfo(filename)
+			extra_start = filename_start + filename_length
+			x.extra = bytes(data[extra_start:extra_start + extra_length])
+			x.comment = bytes(data[extra_start + extra_length:next_pos])
+			x.header_offset = centdir[18]
+			(
+					x.create_version,
+					x.create_system,
+					x.extract_version,
+					x.reserved,
+					x.flag_bits,
+					x.compress_type,
+					t,
+					d,
+					x.CRC,
+					x.compress_size,
+					x.file_size,
+					) = centdir[1:12]
+			if x.extract_version > zipfile.MAX_EXTRACT_VERSION:  # type: ignore[attr-defined]
+				raise NotImplementedError("zip file version %.1f" % (x.extract_version / 10))
+			x.volume, x.internal_attr, x.external_attr = centdir[15:18]
+			# Convert date/time code to (year, month, day, hour, min, sec)
+			x._raw_time = t  # type: ignore[attr-defined]
+			x.date_time = ((d >> 9) + 1980, (d >> 5) & 0xF, d & 0x1F, t >> 11, (t >> 5) & 0x3F, (t & 0x1F) * 2)
+
+			if _DECODE_EXTRA_TAKES_CRC:  # pragma: no cover (<py312)
+				x._decodeExtra(crc32(raw_filename))  # type: ignore[attr-defined]
+			else:  # pragma: no cover (py312+)
+				x._decodeExtra()  # type: ignore[attr-defined]
+
+			x.header_offset = x.header_offset + concat
+			self.filelist.append(x)
+			self.NameToInfo[x.filename] = x
+			header_offsets.append(x.header_offset)
+
+			pos = next_pos
+
+		if _HAS_END_OFFSET:  # pragma: no cover (<py312)
+			self._set_end_offsets(header_offsets)
+
+	def _set_end_offsets(self, header_offsets: List[int]) -> None:
+		"""
+		Set the offset at which each member's data must end, as :meth:`zipfile.ZipFile._RealGetContents` does.
+
+		Each member ends where the next member's local header starts, or at the central directory.
+		Members sharing a local header overlap, and so are given no room at all.
+
+		:param header_offsets: The local header offsets of every member in the archive,
+			including those not in a ``*.dist-info`` directory.
+		"""
+
+		header_offsets.sort()
+
+		for zinfo in self.filelist:
+			idx = bisect.bisect_right(header_offsets, zinfo.header_offset)
+			if idx > 1 and header_offsets[idx - 2] == zinfo.header_offset:
+				zinfo._end_offset = zinfo.header_offset  # type: ignore[attr-defined]
+			elif idx < len(header_offsets):
+				zinfo._end_offset = header_offsets[idx]  # type: ignore[attr-defined]
+			else:
+				zinfo._end_offset = self.start_dir  # type: ignore[attr-defined]
+
+	@staticmethod
+	def _decode_zip64_header_offset(data: Union[bytes, mmap.mmap], pos: int) -> int:  # pragma: no cover
+		"""
+		Returns the local header offset of the central directory record at ``pos``,
+		for a member whose offset is stored in the ZIP64 extra field.
+
+		:param data: A buffer containing the central directory.
+		:param pos: The offset of the record in ``data``.
+		"""
+
+		centdir = _CD_STRUCT.unpack_from(data, pos)
+		filename_length, extra_length = centdir[12:14]
+		extra_start = pos + _CD_SIZE + filename_length
+
+		x = zipfile.ZipInfo()
+		x.extra = bytes(data[extra_start:extra_start + extra_length])
+		x.header_offset = centdir[18]
+		x.compress_size, x.file_size = centdir[10:12]
+		x.volume = centdir[15]
+
+		if _DECODE_EXTRA_TAKES_CRC:
+			filename_start = pos + _CD_SIZE
+			x._decodeExtra(crc32(data[filename_start:filename_start + filename_length]))  # type: ignore[attr-defined]
+		else:
+			x._decodeExtra()  # type: ignore[attr-defined]
+
+		return x.header_offset
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+#
+#  cache.py
+"""
+Inspect and control the caches used by ``dist_meta``.
+
+.. versionadded:: 0.10.0
+
+Each cache is identified by name:
+
+* ``canonicalize_name`` -- normalised distribution names.
+* ``parse_version`` -- parsed :class:`packaging.version.Version` objects.
+* ``parse_wheel_filename`` -- the name and version parsed from wheel filenames.
+* ``record.digests`` -- decoded hash digests from ``RECORD`` files.
+* ``entry_points.loads`` -- parsed ``entry_points.txt`` files, keyed on a digest of their contents.
+* ``entry_points.values`` -- parsed entry point values.
+* ``entry_points.index`` -- the :class:`~.EntryPointIndex` for each search path.
+
+Caching can be disabled entirely by setting the ``DIST_META_CACHE`` environment variable to ``0``
+before ``dist_meta`` is imported. The caches are still listed, but always report being empty
+with a ``maxsize`` of ``0``, and clearing or resizing them has no effect.
+"""
+#
+#  Copyright © 2021 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#  EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+#  MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+#  IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+#  DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+#  OR OTHER DEALINGS IN THE SOFTWARE.
+#
+
+# stdlib
+from typing import Dict, List, Optional
+
+# this package
+# Imported so the caches they define are registered before any are looked up.
+import dist_meta.entry_points  # noqa: F401
+import dist_meta.record  # noqa: F401
+from dist_meta._utils import SHOULD_CACHE, CacheInfo, _caches
+
+__all__ = ("CacheInfo", "enabled", "list_caches", "cache_info", "all_cache_info", "clear", "resize")
+
+#: Whether caching is enabled, which is controlled by the ``DIST_META_CACHE`` environment variable.
+enabled: bool = bool(SHOULD_CACHE)
+
+
+def _get_cache(name: str):  # noqa: MAN002
+	try:
+		return _caches[name]
+	except KeyError:
+		raise ValueError(f"Unknown cache {name!r}") from None
+
+
+def list_caches() -> List[str]:
+	"""
+	Returns the names of the caches used by ``dist_meta``, in alphabetical order.
+	"""
+
+	return sorted(_caches)
+
+
+def cache_info(name: str) -> CacheInfo:
+	"""
+	Returns the hit, miss and size statistics for the cache called ``name``.
+
+	:param name:
+
+	:raises ValueError: If there is no cache called ``name``.
+	"""
+
+	return _get_cache(name).cache_info()
+
+
+def all_cache_info() -> Dict[str, CacheInfo]:
+	"""
+	Returns a mapping of cache names to their hit, miss and size statistics.
+	"""
+
+	return {name: _caches[name].cache_info() for name in list_caches()}
+
+
+def clear(name: Optional[str] = None) -> None:
+	"""
+	Remove all entries from the cache called ``name``, and reset its statistics.
+
+	:param name: The cache to clear.
+	:default name: all caches
+
+	:raises ValueError: If there is no cache called ``name``.
+	"""
+
+	if name is None:
+		for cache in _caches.values():
+			cache.cache_clear()
+	else:
+		_get_cache(name).cache_clear()
+
+
+def resize(name: str, maxsize: Optional[int]) -> None:
+	"""
+	Change the maximum number of entries in the cache called ``name``.
+
+	Depending on the cache, resizing either keeps the most recently used entries that still fit,
+	or clears the cache.
+
+	Caches backed by :func:`functools.lru_cache` are replaced with a new cache of the requested size
+	throughout ``dist_meta``. References to the cached function held elsewhere continue to use the old cache.
+
+	:param name:
+	:param maxsize: The new maximum size, or :py:obj:`None` for no limit.
+
+	:raises ValueError: If there is no cache called ``name``, or if ``maxsize`` is negative.
+	"""
+
+	if maxsize is not None and maxsize < 0:
+		raise ValueError(f"'maxsize' must be a non-negative integer or None, not {maxsize!r}")
+
+	_get_cache(name).cache_resize(maxsize)
@@ -38,13 +38,17 @@ Distributions must have a ``*.dist-info`` directory (as defined by :pep:`566`) t
 # stdlib
 import abc
 import collections
-import functools
+import io
+import os
 import posixpath
 import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import suppress
 from csv import reader as csv_reader
+from itertools import takewhile
 from operator import itemgetter
 from typing import (
+		IO,
 		TYPE_CHECKING,
 		Any,
 		Callable,
@@ -53,10 +57,12 @@ from typing import (
 		Iterator,
 		List,
 		Mapping,
+		NamedTuple,
 		Optional,
 		Tuple,
 		Type,
-		TypeVar
+		TypeVar,
+		Union
 		)
 
 # 3rd party
@@ -68,9 +74,19 @@ from packaging.version import Version
 
 # this package
 from dist_meta import metadata, wheel
-from dist_meta._utils import _canonicalize, _iter_dist_infos, _parse_version, _parse_wheel_filename
+from dist_meta._utils import (
+		_canonicalize,
+		_dir_signature,
+		_is_racy,
+		_list_dist_infos,
+		_parse_version,
+		_parse_wheel_filename,
+		_read_json,
+		_write_json
+		)
+from dist_meta._zip import DistInfoZipFile
 from dist_meta.metadata_mapping import MetadataMapping
-from dist_meta.record import FileHash, RecordEntry
+from dist_meta.record import RecordEntry, RecordTable, _parse_record_rows
 
 _tuplegetter = lambda index, doc: property(itemgetter(index), doc=doc)
 
@@ -83,16 +99,21 @@ __all__ = (
 		"get_distribution",
 		"iter_distributions",
 		"packages_distributions",
+		"DistributionIndex",
 		"DistributionType",
 		"Distribution",
 		"WheelDistribution",
+		"LazyWheelDistribution",
 		"DistributionNotFoundError",
+		"WheelMetadata",
+		"iter_wheel_metadata",
 		"_DT",
 		)
 
 _DT = TypeVar("_DT", bound="DistributionType")
 _D = TypeVar("_D", bound="Distribution")
 _WD = TypeVar("_WD", bound="WheelDistribution")
+_LWD = TypeVar("_LWD", bound="LazyWheelDistribution")
 
 
 class DistributionType(abc.ABC):
@@ -229,12 +250,19 @@ class DistributionType(abc.ABC):
 
 		return {}
 
-	def get_metadata(self) -> MetadataMapping:
+	def get_metadata(self, *, headers_only: bool = False) -> MetadataMapping:
 		"""
 		Returns the content of the ``*.dist-info/METADATA`` file.
+
+		:param headers_only: If :py:obj:`True`, only the header fields are parsed,
+			and the long description is not included in the returned mapping.
+
+		.. versionchanged:: 0.10.0
+
+			Added the ``headers_only`` argument.
 		"""
 
-		return metadata.loads(self.read_file("METADATA"))
+		return metadata.loads(self.read_file("METADATA"), headers_only=headers_only)
 
 	def get_wheel(self) -> Optional[MetadataMapping]:
 		"""
@@ -258,22 +286,45 @@ class DistributionType(abc.ABC):
 		"""
 
 		if self.has_file("RECORD"):
-			content = self.read_file("RECORD").splitlines()
-			output = []
-
-			for line in csv_reader(content):
-				name, hash_, size_str, *_ = line
-				entry = RecordEntry(
-						name.strip(),
-						hash=FileHash.from_string(hash_) if hash_ else None,
-						size=int(size_str) if size_str else None,
-						)
-				output.append(entry)
-
-			return output
+			return list(self.iter_record())
+		else:
+			return None
+
+	def get_record_table(self) -> Optional[RecordTable]:
+		"""
+		Returns the content of the ``*.dist-info/RECORD`` file as a :class:`~.RecordTable`,
+		or :py:obj:`None` if the file does not exist.
+
+		The :class:`~.RecordTable` stores the entries in compact parallel arrays,
+		which uses considerably less memory than :meth:`~.DistributionType.get_record`
+		when the record is kept around.
+
+		.. versionadded:: 0.10.0
+		"""  # noqa: D400
+
+		if self.has_file("RECORD"):
+			return RecordTable._from_rows(csv_reader(self.read_file("RECORD").splitlines()))
 		else:
 			return None
 
+	def iter_record(self) -> Iterator[RecordEntry]:
+		"""
+		Returns an iterator over the parsed content of the ``*.dist-info/RECORD`` file.
+
+		Unlike :meth:`~.DistributionType.get_record`, entries are parsed as they are requested,
+		so large ``RECORD`` files can be processed without holding every entry in memory.
+
+		:returns: A :class:`dist_meta.record.RecordEntry` object for each line in the record
+			(i.e. each file in the distribution).
+			This includes files in the ``*.dist-info`` directory.
+
+		:raises FileNotFoundError: if the file does not exist.
+
+		.. versionadded:: 0.10.0
+		"""
+
+		yield from _parse_record_rows(csv_reader(self.read_file("RECORD").splitlines()))
+
 	def __repr__(self) -> str:
 		"""
 		Returns a string representation of the :class:`~.DistributionType`.
@@ -366,32 +417,60 @@ class Distribution(DistributionType, Tuple[str, Version, PathPlus]):
 
 		return (self.path / filename).is_file()
 
-	def get_record(self) -> Optional[List[RecordEntry]]:
+	def get_metadata(self, *, headers_only: bool = False) -> MetadataMapping:
 		"""
-		Returns the parsed content of the ``*.dist-info/RECORD`` file, or :py:obj:`None` if the file does not exist.
+		Returns the content of the ``*.dist-info/METADATA`` file.
+
+		:param headers_only: If :py:obj:`True`, only the header fields are read and parsed,
+			and the long description is not included in the returned mapping.
+
+		.. versionchanged:: 0.10.0
+
+			Added the ``headers_only`` argument.
+		"""
+
+		if not headers_only:
+			return super().get_metadata()
+
+		# Stop reading at the blank line separating the header from the body.
+		with (self.path / "METADATA").open() as fp:
+			header = ''.join(takewhile(lambda line: line != '\n', fp))
+
+		return metadata.loads(header, headers_only=True)
+
+	def get_record_table(self) -> Optional[RecordTable]:
+		"""
+		Returns the content of the ``*.dist-info/RECORD`` file as a :class:`~.RecordTable`,
+		or :py:obj:`None` if the file does not exist.
+
+		.. versionadded:: 0.10.0
+		"""  # noqa: D400
+
+		record_file = self.path / "RECORD"
+
+		if not record_file.is_file():
+			return None
+
+		with record_file.open() as fp:
+			return RecordTable._from_rows(csv_reader(fp), distro=self)
+
+	def iter_record(self) -> Iterator[RecordEntry]:
+		"""
+		Returns an iterator over the parsed content of the ``*.dist-info/RECORD`` file.
+
+		The file is read line by line as entries are requested.
 
 		:returns: A :class:`dist_meta.record.RecordEntry` object for each line in the record
 			(i.e. each file in the distribution).
 			This includes files in the ``*.dist-info`` directory.
+
+		:raises FileNotFoundError: if the file does not exist.
+
+		.. versionadded:: 0.10.0
 		"""
 
-		if self.has_file("RECORD"):
-			content = self.read_file("RECORD").splitlines()
-			output = []
-
-			for line in csv_reader(content):
-				name, hash_, size_str, *_ = line
-				entry = RecordEntry(
-						name.strip(),
-						hash=FileHash.from_string(hash_) if hash_ else None,
-						size=int(size_str) if size_str else None,
-						distro=self,
-						)
-				output.append(entry)
-
-			return output
-		else:
-			return None
+		with (self.path / "RECORD").open() as fp:
+			yield from _parse_record_rows(csv_reader(fp), distro=self)
 
 
 class WheelDistribution(DistributionType, Tuple[str, Version, PathPlus, handy_archives.ZipFile]):
@@ -437,19 +516,66 @@ class WheelDistribution(DistributionType, Tuple[str, Version, PathPlus, handy_ar
 		return tuple.__new__(cls, (name, version, path, wheel_zip))
 
 	@classmethod
-	def from_path(cls: Type[_WD], path: PathLike, **kwargs) -> _WD:
+	def from_path(cls: Type[_WD], path: PathLike, *, metadata_only: bool = False, **kwargs) -> _WD:
 		r"""
 		Construct a :class:`~.WheelDistribution` from a filesystem path to the ``.whl`` file.
 
 		:param path:
+		:param metadata_only: Only read the zip file's central directory entries for the ``*.dist-info`` directory.
+			This is considerably faster for wheels containing many files,
+			but the other files in the wheel cannot be accessed through :attr:`~.WheelDistribution.wheel_zip`.
 		:param \*\*kwargs: Additional keyword arguments passed to :class:`zipfile.ZipFile`.
 
 		:rtype: :class:`~.WheelDistribution`
+
+		.. versionchanged:: 0.10.0
+
+			Added the ``metadata_only`` argument.
 		"""
 
 		path = PathPlus(path)
 		name, version, *_ = _parse_wheel_filename(path)
-		wheel_zip = handy_archives.ZipFile(path, 'r', **kwargs)
+
+		if metadata_only:
+			wheel_zip: handy_archives.ZipFile = DistInfoZipFile(path, 'r', **kwargs)
+		else:
+			wheel_zip = handy_archives.ZipFile(path, 'r', **kwargs)
+
+		return cls(name, version, path, wheel_zip)
+
+	@classmethod
+	def from_file(
+			cls: Type[_WD],
+			fileobj: IO[bytes],
+			filename: PathLike,
+			*,
+			metadata_only: bool = False,
+			**kwargs,
+			) -> _WD:
+		r"""
+		Construct a :class:`~.WheelDistribution` from an open, seekable file-like object.
+
+		Only the parts of the file which are needed are read,
+		so ``fileobj`` may fetch data on demand, such as a :class:`~.remote.RangeReader`.
+
+		:param fileobj:
+		:param filename: The filename of the wheel, which is used to determine the name and version
+			of the distribution and for :attr:`~.WheelDistribution.path`.
+		:param metadata_only: Only read the zip file's central directory entries for the ``*.dist-info`` directory.
+		:param \*\*kwargs: Additional keyword arguments passed to :class:`zipfile.ZipFile`.
+
+		:rtype: :class:`~.WheelDistribution`
+
+		.. versionadded:: 0.10.0
+		"""
+
+		path = PathPlus(filename)
+		name, version, *_ = _parse_wheel_filename(path)
+
+		if metadata_only:
+			wheel_zip: handy_archives.ZipFile = DistInfoZipFile(fileobj, 'r', **kwargs)
+		else:
+			wheel_zip = handy_archives.ZipFile(fileobj, 'r', **kwargs)
 
 		return cls(name, version, path, wheel_zip)
 
@@ -458,6 +584,7 @@ class WheelDistribution(DistributionType, Tuple[str, Version, PathPlus, handy_ar
 
 	def __exit__(self, exc_type, exc_val, exc_tb) -> None:
 		self.wheel_zip.close()
+		self.__dict__.pop("_dist_info_path", None)
 
 	def read_file(self, filename: str) -> str:
 		"""
@@ -466,16 +593,7 @@ class WheelDistribution(DistributionType, Tuple[str, Version, PathPlus, handy_ar
 		:param filename:
 		"""
 
-		dist_info = f"{self.name}-{self.version}.dist-info"
-		try:
-			return self.wheel_zip.read_text(posixpath.join(dist_info, filename))
-		except FileNotFoundError as fnf_e:
-			try:
-				dist_info = _get_dist_info_path(self)
-			except _NoDistInfoFound:
-				raise fnf_e
-
-			return self.wheel_zip.read_text(posixpath.join(dist_info, filename))
+		return self.wheel_zip.read_text(_get_member_name(self, filename))
 
 	def has_file(self, filename: str) -> bool:
 		"""
@@ -484,17 +602,12 @@ class WheelDistribution(DistributionType, Tuple[str, Version, PathPlus, handy_ar
 		:param filename:
 		"""
 
-		dist_info = f"{self.name}-{self.version}.dist-info"
-
-		if posixpath.join(dist_info, filename) in self.wheel_zip.namelist():
-			return True
+		try:
+			_get_member_name(self, filename)
+		except FileNotFoundError:
+			return False
 		else:
-			try:
-				dist_info = _get_dist_info_path(self)
-			except _NoDistInfoFound:
-				return False
-			else:
-				return posixpath.join(dist_info, filename) in self.wheel_zip.namelist()
+			return True
 
 	def get_wheel(self) -> MetadataMapping:
 		"""
@@ -516,48 +629,233 @@ class WheelDistribution(DistributionType, Tuple[str, Version, PathPlus, handy_ar
 		:raises FileNotFoundError: if the file does not exist.
 		"""
 
-		content = self.read_file("RECORD").splitlines()
-		output = []
+		return list(self.iter_record())
 
-		for line in csv_reader(content):
-			name, hash_, size_str, *_ = line
-			entry = RecordEntry(
-					name,
-					hash=FileHash.from_string(hash_) if hash_ else None,
-					size=int(size_str) if size_str else None,
-					)
-			output.append(entry)
+	def get_record_table(self) -> RecordTable:
+		"""
+		Returns the content of the ``*.dist-info/RECORD`` file as a :class:`~.RecordTable`.
+
+		:raises FileNotFoundError: if the file does not exist.
+
+		.. versionadded:: 0.10.0
+		"""
+
+		with self.wheel_zip.open(_get_member_name(self, "RECORD")) as raw_fp:
+			return RecordTable._from_rows(csv_reader(io.TextIOWrapper(raw_fp, encoding="UTF-8")))
 
-		return output
+	def iter_record(self) -> Iterator[RecordEntry]:
+		"""
+		Returns an iterator over the parsed content of the ``*.dist-info/RECORD`` file.
+
+		The file is decompressed and parsed as entries are requested.
+
+		:returns: A :class:`dist_meta.record.RecordEntry` object for each line in the record
+			(i.e. each file in the distribution).
+			This includes files in the ``*.dist-info`` directory.
+
+		:raises FileNotFoundError: if the file does not exist.
+
+		.. versionadded:: 0.10.0
+		"""
+
+		with self.wheel_zip.open(_get_member_name(self, "RECORD")) as raw_fp:
+			yield from _parse_record_rows(csv_reader(io.TextIOWrapper(raw_fp, encoding="UTF-8")))
 
 
-def iter_distributions(path: Optional[Iterable[PathLike]] = None) -> Iterator[Distribution]:
+class LazyWheelDistribution(DistributionType, Tuple[str, Version, PathPlus]):
+	"""
+	Represents a Python distribution in :pep:`wheel <427>` form,
+	where the ``METADATA`` file is also available as a separate file alongside the wheel.
+
+	The ``METADATA`` file is read from ``<wheel filename>.metadata``
+	(as served by package indexes which implement :pep:`658`) if that file exists.
+	The wheel itself is only opened when other files are requested,
+	so reading just the metadata of many wheels never opens the archives.
+
+	A :class:`~.LazyWheelDistribution` can be used as a contextmanager,
+	which will close the underlying :class:`zipfile.ZipFile` (if it was opened) when exiting
+	the :keyword:`with` block.
+
+	:param name: The name of the distribution.
+
+	.. versionadded:: 0.10.0
+	"""  # noqa: D400
+
+	#: The name of the distribution. No normalization is performed.
+	name: str
+
+	#: The version number of the distribution.
+	version: Version
+
+	#: The path to the ``.whl`` file.
+	path: PathPlus
+
+	__slots__ = ()
+	_fields = ("name", "version", "path")
+
+	def __new__(  # noqa: PRM002
+		cls: Type[_LWD],
+		name: str,
+		version: Version,
+		path: PathPlus,
+	) -> _LWD:
+		"""
+		Construct a new :class:`~.LazyWheelDistribution` object.
+
+		:rtype: :class:`~.LazyWheelDistribution`
+		"""
+
+		# If this is super().__new__ it breaks on PyPy
+		return tuple.__new__(cls, (name, version, path))
+
+	@classmethod
+	def from_path(cls: Type[_LWD], path: PathLike) -> _LWD:
+		"""
+		Construct a :class:`~.LazyWheelDistribution` from a filesystem path to the ``.whl`` file.
+
+		The wheel does not need to exist if only the ``METADATA`` file will be read.
+
+		:param path:
+
+		:rtype: :class:`~.LazyWheelDistribution`
+		"""
+
+		path = PathPlus(path)
+		name, version, *_ = _parse_wheel_filename(path)
+		return cls(name, version, path)
+
+	@property
+	def metadata_path(self) -> PathPlus:
+		"""
+		The path to the standalone ``METADATA`` file, ``<wheel filename>.metadata``.
+		"""
+
+		return self.path.with_name(f"{self.path.name}.metadata")
+
+	@property
+	def wheel_zip(self) -> handy_archives.ZipFile:
+		"""
+		The opened zip file. The wheel is opened the first time this is accessed.
+		"""
+
+		instance_dict = self.__dict__
+
+		if "_wheel_zip" not in instance_dict:
+			instance_dict["_wheel_zip"] = handy_archives.ZipFile(self.path, 'r')
+
+		return instance_dict["_wheel_zip"]
+
+	def __enter__(self: _LWD) -> _LWD:
+		return self
+
+	def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+		wheel_zip = self.__dict__.pop("_wheel_zip", None)
+		if wheel_zip is not None:
+			wheel_zip.close()
+		self.__dict__.pop("_dist_info_path", None)
+
+	def read_file(self, filename: str) -> str:
+		"""
+		Read a file from the ``*.dist-info`` directory and return its content.
+
+		``METADATA`` is read from :attr:`~.LazyWheelDistribution.metadata_path` if it exists.
+
+		:param filename:
+		"""
+
+		if filename == "METADATA":
+			with suppress(FileNotFoundError):
+				return self.metadata_path.read_text()
+
+		return self.wheel_zip.read_text(_get_member_name(self, filename))
+
+	def has_file(self, filename: str) -> bool:
+		"""
+		Returns whether the ``*.dist-info`` directory contains a file named ``filename``.
+
+		:param filename:
+		"""
+
+		if filename == "METADATA" and self.metadata_path.is_file():
+			return True
+
+		try:
+			_get_member_name(self, filename)
+		except FileNotFoundError:
+			return False
+		else:
+			return True
+
+	# These only rely on ``wheel_zip``, ``name`` and ``version``.
+	get_wheel = WheelDistribution.get_wheel
+	get_record = WheelDistribution.get_record
+	get_record_table = WheelDistribution.get_record_table
+	iter_record = WheelDistribution.iter_record
+
+
+def iter_distributions(
+		path: Optional[Iterable[PathLike]] = None,
+		*,
+		index_file: Optional[PathLike] = None,
+		workers: Optional[int] = None,
+		) -> Iterator[Distribution]:
 	"""
 	Returns an iterator over installed distributions on ``path``.
 
-	:param path: The directories entries to search for distributions in.
+	:param path: The directories entries to search for distributions in,
+		or a :class:`~.DistributionIndex` to take the distributions from.
 	:default path: :py:data:`sys.path`
+	:param index_file: The path to a file in which to persist the names of the ``*.dist-info``
+		directories found in each entry on ``path``.
+		Directories which have not been modified since the index was written are not rescanned.
+	:param workers: If greater than ``1``, the entries on ``path`` are scanned concurrently
+		using a pool of this many threads. This can speed up scanning directories on network filesystems.
+		Distributions are still returned in the order of ``path``.
+
+	.. versionchanged:: 0.10.0
+
+		* Added the ``index_file`` and ``workers`` arguments.
+		* ``path`` may be a :class:`~.DistributionIndex`.
 	"""
 
+	if isinstance(path, DistributionIndex):
+		yield from path._distributions.values()
+		return
+
 	if path is None:  # pragma: no cover
 		path = sys.path
 
+	folders = list(map(PathPlus, path))
+
+	index: Optional[_DistInfoIndex] = None
+	list_dist_infos: Callable[[PathPlus], List[str]] = _list_dist_infos
+
+	if index_file is not None:
+		index = _DistInfoIndex(index_file)
+		list_dist_infos = index.list_dist_infos
+
+	listings: Iterable[List[str]]
+
+	if workers is not None and workers > 1:
+		with ThreadPoolExecutor(max_workers=workers) as executor:
+			listings = list(executor.map(list_dist_infos, folders))
+	elif index is not None:
+		listings = list(map(list_dist_infos, folders))
+	else:
+		listings = map(list_dist_infos, folders)
+
+	if index is not None:
+		index.save()
+
 	# Distributions found earlier in path will shadow those with the same name found later.
 	# If these distributions used different module names, it may actually be possible to import both,
 	# but in most cases this shadowing will be correct.
 	distro_names_seen = set()
 
-	for folder in map(PathPlus, path):
-		if not folder.is_dir():
-			continue
+	for folder, dist_info_names in zip(folders, listings):
+		for dist_info_name in dist_info_names:
 
-		for subdir in _iter_dist_infos(folder):
-
-			if subdir.name[0] == '~':
-				# Temporary directory created by pip
-				continue
-
-			distro = Distribution.from_path(subdir)
+			distro = Distribution.from_path(folder / dist_info_name)
 
 			normalized_name = _canonicalize(distro.name)
 
@@ -572,24 +870,222 @@ def iter_distributions(path: Optional[Iterable[PathLike]] = None) -> Iterator[Di
 def get_distribution(
 		name: str,
 		path: Optional[Iterable[PathLike]] = None,
+		*,
+		index_file: Optional[PathLike] = None,
 		) -> Distribution:
 	"""
 	Returns a :class:`~.Distribution` instance for the distribution with the given name.
 
 	:param name:
-	:param path: The directories entries to search for distributions in.
+	:param path: The directories entries to search for distributions in,
+		or a :class:`~.DistributionIndex` to look the distribution up in.
 	:default path: :py:data:`sys.path`
+	:param index_file: The path to a file in which to persist the names of the ``*.dist-info``
+		directories found in each entry on ``path``. See :func:`~.iter_distributions`.
 
 	:rtype:
+
+	.. versionchanged:: 0.10.0
+
+		* Added the ``index_file`` argument.
+		* ``path`` may be a :class:`~.DistributionIndex`.
 	"""
 
-	for distro in iter_distributions(path=path):
+	if isinstance(path, DistributionIndex):
+		return path.get_distribution(name)
+
+	for distro in iter_distributions(path=path, index_file=index_file):
 		if _canonicalize(distro.name) == _canonicalize(name):
 			return distro
 
 	raise DistributionNotFoundError(name)
 
 
+class DistributionIndex(Mapping[str, Distribution]):
+	"""
+	A mapping of normalized distribution names to the installed distributions on ``path``,
+	built with a single pass over ``path``.
+
+	Keys are normalized as per :pep:`503`, and lookups normalize the requested name,
+	so ``index["Foo.Bar"]`` and ``index["foo-bar"]`` return the same :class:`~.Distribution`.
+	The same shadowing rules as :func:`~.iter_distributions` apply.
+
+	The index can be passed as the ``path`` argument to :func:`~.get_distribution`,
+	:func:`~.iter_distributions`, :func:`~.packages_distributions`
+	and :func:`dist_meta.entry_points.get_entry_points` to avoid rescanning ``path``.
+
+	:param path: The directories entries to search for distributions in.
+	:default path: :py:data:`sys.path`
+	:param index_file: The path to a file in which to persist the names of the ``*.dist-info``
+		directories found in each entry on ``path``. See :func:`~.iter_distributions`.
+	:param workers: If greater than ``1``, the entries on ``path`` are scanned concurrently
+		using a pool of this many threads. See :func:`~.iter_distributions`.
+
+	.. versionadded:: 0.10.0
+	"""  # noqa: D400
+
+	def __init__(
+			self,
+			path: Optional[Iterable[PathLike]] = None,
+			*,
+			index_file: Optional[PathLike] = None,
+			workers: Optional[int] = None,
+			):
+		distros = iter_distributions(path=path, index_file=index_file, workers=workers)
+		self._distributions: Dict[str, Distribution] = {_canonicalize(distro.name): distro for distro in distros}
+
+	def __getitem__(self, name: str) -> Distribution:
+		"""
+		Returns the distribution with the given name.
+
+		:param name:
+
+		:raises KeyError: If no such distribution is installed.
+		"""
+
+		try:
+			return self._distributions[_canonicalize(name)]
+		except KeyError:
+			raise KeyError(name) from None
+
+	def __contains__(self, name: object) -> bool:
+		"""
+		Returns whether a distribution with the given name is installed.
+
+		:param name:
+		"""
+
+		if not isinstance(name, str):
+			return False
+
+		return _canonicalize(name) in self._distributions
+
+	def __iter__(self) -> Iterator[str]:
+		"""
+		Returns an iterator over the normalized names of the distributions, in the order they were found.
+		"""
+
+		return iter(self._distributions)
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of distributions in the index.
+		"""
+
+		return len(self._distributions)
+
+	def get_distribution(self, name: str) -> Distribution:
+		"""
+		Returns the :class:`~.Distribution` with the given name.
+
+		:param name:
+
+		:raises DistributionNotFoundError: If no such distribution is installed.
+		"""
+
+		try:
+			return self[name]
+		except KeyError:
+			raise DistributionNotFoundError(name) from None
+
+	def __repr__(self) -> str:
+		"""
+		Returns a string representation of the :class:`~.DistributionIndex`.
+		"""
+
+		return f"<{self.__class__.__name__}({len(self)} distributions)>"
+
+
+class _DistInfoIndex:
+	"""
+	Persistent index of the ``*.dist-info`` directories in each directory on ``sys.path``.
+
+	Entries are keyed by the absolute path of the directory,
+	and are only valid while the directory's modification time and inode are unchanged.
+
+	:param filename: The file the index is stored in.
+	"""
+
+	_format_version = 1
+
+	def __init__(self, filename: PathLike):
+		self.filename = PathPlus(filename)
+		self.changed = False
+
+		self.directories: Dict[str, List] = self._load(self.filename)
+
+	@classmethod
+	def _load(cls, filename: PathPlus) -> Dict[str, List]:
+		"""
+		Returns the directory entries stored in ``filename``.
+
+		A missing, outdated or malformed index is treated as empty, and so is rebuilt by rescanning.
+
+		:param filename:
+		"""
+
+		data = _read_json(filename)
+		if data is None or data.get("version") != cls._format_version:
+			return {}
+
+		directories = data.get("directories")
+		if not isinstance(directories, dict):
+			return {}
+
+		for entry in directories.values():
+			if not (
+					isinstance(entry, list) and len(entry) == 3 and isinstance(entry[0], int)
+					and isinstance(entry[1], int) and isinstance(entry[2], list)
+					and all(isinstance(name, str) for name in entry[2])
+					):
+				return {}
+
+		return directories
+
+	def list_dist_infos(self, folder: PathPlus) -> List[str]:
+		"""
+		Returns the names of the ``*.dist-info`` directories in ``folder``, rescanning it only if it has changed.
+
+		:param folder:
+		"""
+
+		signature = _dir_signature(folder)
+		if signature is None:
+			return []
+
+		key = os.path.abspath(folder)
+		mtime_ns, inode = signature
+		cached = self.directories.get(key)
+
+		if cached is not None and cached[0] == mtime_ns and cached[1] == inode:
+			return cached[2]
+
+		dist_info_names = _list_dist_infos(folder)
+
+		if not _is_racy(mtime_ns):
+			self.directories[key] = [mtime_ns, inode, dist_info_names]
+			self.changed = True
+		elif self.directories.pop(key, None) is not None:
+			self.changed = True
+
+		return dist_info_names
+
+	def save(self) -> None:
+		"""
+		Write the index to disk, if it has changed.
+
+		Failure to write the index (e.g. on a read-only filesystem) is not an error.
+		"""
+
+		if not self.changed:
+			return
+
+		with suppress(OSError):
+			_write_json(self.filename, {"version": self._format_version, "directories": self.directories})
+
+		self.changed = False
+
+
 class DistributionNotFoundError(ValueError):
 	"""
 	Raised when a distribution cannot be located.
@@ -600,24 +1096,76 @@ class _NoDistInfoFound(Exception):
 	pass
 
 
-@functools.lru_cache()
-def _get_dist_info_path(dist: WheelDistribution) -> str:
+def _get_member_name(dist: Union[WheelDistribution, LazyWheelDistribution], filename: str) -> str:
+	"""
+	Returns the name of the zip file member for ``filename`` in the wheel's ``*.dist-info`` directory.
+
+	:param dist:
+	:param filename:
+
+	:raises FileNotFoundError: If the file does not exist.
+	"""
+
+	# This is a function rather than a method so that it is available to classes
+	# which borrow :meth:`WheelDistribution.read_file` and :meth:`WheelDistribution.has_file`.
+
+	# ZipFile.NameToInfo is a dict of the members, built once when the central directory is read.
+	# namelist() would build a new list on every call, and membership tests against it are linear.
+	members = dist.wheel_zip.NameToInfo
+
+	member = posixpath.join(f"{dist.name}-{dist.version}.dist-info", filename)
+
+	if member in members:
+		return member
+
+	try:
+		dist_info = _get_dist_info_path(dist)
+	except _NoDistInfoFound:
+		raise FileNotFoundError(member) from None
+
+	actual_member = posixpath.join(dist_info, filename)
+	if actual_member in members:
+		return actual_member
+
+	raise FileNotFoundError(member)
+
+
+def _get_dist_info_path(dist: Union[WheelDistribution, LazyWheelDistribution]) -> str:
 	"""
 	Find the name of the dist-info directory, case insensitive and allowing unnormalised versions.
 
+	The result is stored on ``dist`` itself, so it is released along with the distribution
+	rather than keeping the distribution (and its open zip file) alive in a global cache.
+
 	:param dist:
 
 	:raises _NoDistInfoFound: If no dist-info directory is found, or the version/name don't match.
 	"""
 
+	instance_dict = getattr(dist, "__dict__", None)
+
+	if instance_dict is not None and "_dist_info_path" in instance_dict:
+		return instance_dict["_dist_info_path"]
+
+	dist_info = _find_dist_info_path(dist)
+
+	if instance_dict is not None:
+		instance_dict["_dist_info_path"] = dist_info
+
+	return dist_info
+
+
+def _find_dist_info_path(dist: Union[WheelDistribution, LazyWheelDistribution]) -> str:
 	casefolded_dist_name = dist.name.casefold()
 
-	for filename in dist.wheel_zip.namelist():
-		if ".dist-info" in filename:
+	# Only consider each top-level directory once, rather than once per member.
+	top_level_dirs = dict.fromkeys(filename.split('/', 1)[0] for filename in dist.wheel_zip.NameToInfo)
+
+	for dist_info_dir in top_level_dirs:
+		if ".dist-info" in dist_info_dir:
 			# Might be the directory we're looking for
 			with suppress(Exception):
 				# Ignore parsing errors
-				dist_info_dir = filename.split('/', 1)[0]
 
 				# pylint: disable=dotted-import-in-loop,loop-invariant-statement
 				distro_name_version, extension = posixpath.splitext(dist_info_dir)
@@ -637,6 +1185,134 @@ def _get_dist_info_path(dist: WheelDistribution) -> str:
 	raise _NoDistInfoFound
 
 
+class WheelMetadata(NamedTuple):
+	"""
+	The metadata extracted from a wheel by :func:`~.iter_wheel_metadata`.
+
+	Documents which were not requested are :py:obj:`None`, as is ``entry_points``
+	if the wheel has no ``entry_points.txt`` file.
+
+	.. versionadded:: 0.10.0
+	"""
+
+	#: The path to the ``.whl`` file.
+	path: PathPlus
+
+	#: The name of the distribution, from the wheel's filename.
+	name: Optional[str]
+
+	#: The version of the distribution, from the wheel's filename.
+	version: Optional[Version]
+
+	#: The parsed ``METADATA`` file.
+	metadata: Optional[MetadataMapping]
+
+	#: The parsed ``WHEEL`` file.
+	wheel: Optional[MetadataMapping]
+
+	#: The parsed ``entry_points.txt`` file.
+	entry_points: Optional[Dict[str, Dict[str, str]]]
+
+	#: The parsed ``RECORD`` file.
+	record: Optional[RecordTable]
+
+	#: If the wheel could not be read, a description of the error. Otherwise :py:obj:`None`.
+	error: Optional[str] = None
+
+
+_WHEEL_DOCUMENTS = frozenset({"metadata", "wheel", "entry_points", "record"})
+
+
+def _extract_wheel_metadata(filename: str, include: Tuple[str, ...]) -> WheelMetadata:
+	"""
+	Read the requested documents from the wheel ``filename``.
+
+	This runs in worker processes, so must be a module-level function which returns a picklable object.
+
+	:param filename:
+	:param include:
+	"""
+
+	path = PathPlus(filename)
+	name: Optional[str] = None
+	version: Optional[Version] = None
+
+	try:
+		name, version, *_ = _parse_wheel_filename(path)
+
+		with WheelDistribution.from_path(path, metadata_only=True) as wd:
+			return WheelMetadata(
+					path,
+					name,
+					version,
+					metadata=wd.get_metadata() if "metadata" in include else None,
+					wheel=wd.get_wheel() if "wheel" in include else None,
+					entry_points=wd.get_entry_points() if "entry_points" in include else None,
+					record=wd.get_record_table() if "record" in include else None,
+					)
+
+	except Exception as e:  # pylint: disable=broad-except
+		return WheelMetadata(path, name, version, None, None, None, None, error=f"{type(e).__name__}: {e}")
+
+
+def iter_wheel_metadata(
+		paths: Iterable[PathLike],
+		*,
+		workers: int = 1,
+		include: Iterable[str] = ("metadata", "wheel", "entry_points", "record"),
+		executor: Optional[Executor] = None,
+		) -> Iterator[WheelMetadata]:
+	"""
+	Extract metadata from many wheels, optionally in parallel across several processes.
+
+	Each wheel is opened with :meth:`WheelDistribution.from_path(..., metadata_only=True) <.WheelDistribution.from_path>`
+	and the requested documents are parsed in a worker process.
+	Wheels which cannot be read do not stop the batch;
+	instead the corresponding result has its :attr:`~.WheelMetadata.error` attribute set.
+
+	:param paths: The ``.whl`` files to read.
+	:param workers: The number of processes to read wheels in.
+		If ``1`` the wheels are read in the current process.
+	:param include: The documents to extract.
+		Any of ``'metadata'``, ``'wheel'``, ``'entry_points'`` and ``'record'``.
+	:param executor: An existing :class:`concurrent.futures.Executor` to read wheels with, overriding ``workers``.
+
+	:raises ValueError: if an unknown document is requested.
+
+	:returns: An iterator of :class:`~.WheelMetadata` objects, in the same order as ``paths``.
+
+	.. versionadded:: 0.10.0
+	"""
+
+	include = tuple(include)
+
+	unknown = set(include) - _WHEEL_DOCUMENTS
+	if unknown:
+		raise ValueError(f"Unknown document(s): {', '.join(sorted(unknown))}")
+
+	filenames = [os.fspath(path) for path in paths]
+	return _iter_wheel_metadata(filenames, include, workers, executor)
+
+
+def _iter_wheel_metadata(
+		filenames: List[str],
+		include: Tuple[str, ...],
+		workers: int,
+		executor: Optional[Executor],
+		) -> Iterator[WheelMetadata]:
+	# Separate generator so iter_wheel_metadata validates its arguments when called, not on the first next().
+
+	includes = [include] * len(filenames)
+
+	if executor is not None:
+		yield from executor.map(_extract_wheel_metadata, filenames, includes, chunksize=16)
+	elif workers > 1:
+		with ProcessPoolExecutor(max_workers=workers) as pool:
+			yield from pool.map(_extract_wheel_metadata, filenames, includes, chunksize=16)
+	else:
+		yield from map(_extract_wheel_metadata, filenames, includes)
+
+
 def packages_distributions(path: Optional[Iterable[PathLike]] = None) -> Mapping[str, List[str]]:
 	"""
 	Returns a mapping of top-level packages to a list of distributions which provide them.
@@ -644,7 +1320,8 @@ def packages_distributions(path: Optional[Iterable[PathLike]] = None) -> Mapping
 	The same top-level package may be provided by multiple distributions,
 	especially in the case of namespace packages.
 
-	:param path: The directories entries to search for distributions in.
+	:param path: The directories entries to search for distributions in,
+		or a :class:`~.DistributionIndex` to take the distributions from.
 	:default path: :py:data:`sys.path`
 
 	.. versionadded:: 0.7.0
@@ -666,11 +1343,13 @@ def packages_distributions(path: Optional[Iterable[PathLike]] = None) -> Mapping
 	pkg_to_dist = collections.defaultdict(set)
 
 	for dist in iter_distributions(path):
-		dist_name = dist.get_metadata()["Name"]
+		if not dist.has_file("RECORD"):
+			continue
+
+		dist_name = dist.get_metadata(headers_only=True)["Name"]
 		assert dist_name is not None
-		record = dist.get_record() or ()
 
-		for file in record:
+		for file in dist.iter_record():
 			if file.suffix == ".py":
 
 				if ".." in file.parts:
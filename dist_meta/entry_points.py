@@ -41,9 +41,26 @@ Parser and emitter for ``entry_points.txt``.
 
 # stdlib
 import importlib
+import os
 import re
+import sys
+from contextlib import suppress
 from itertools import groupby
-from typing import Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple, TypeVar, Union
+from typing import (
+		Any,
+		Dict,
+		Iterable,
+		Iterator,
+		List,
+		Mapping,
+		NamedTuple,
+		Optional,
+		Sequence,
+		Tuple,
+		Type,
+		TypeVar,
+		Union
+		)
 
 # 3rd party
 from domdf_python_tools.paths import PathPlus
@@ -52,7 +69,19 @@ from domdf_python_tools.typing import PathLike
 from domdf_python_tools.utils import divide
 
 # this package
-from dist_meta._utils import _cache
+from dist_meta._utils import (
+		SHOULD_CACHE,
+		_DisabledCache,
+		_LRUDict,
+		_cache,
+		_caches,
+		_content_cache,
+		_dir_signature,
+		_is_racy,
+		_parse_version,
+		_read_json,
+		_write_json
+		)
 from dist_meta.distributions import Distribution
 
 __all__ = (
@@ -65,9 +94,12 @@ __all__ = (
 		"get_entry_points",
 		"get_all_entry_points",
 		"EntryPoint",
+		"EntryPointIndex",
+		"validate",
 		)
 
 _EP = TypeVar("_EP", bound="EntryPoint")
+_EPI = TypeVar("_EPI", bound="EntryPointIndex")
 
 #: Type hint for a lazily evaluated iterator of entry points.
 EntryPointIterator = Iterator[Tuple[str, Iterator[Tuple[str, str]]]]
@@ -126,7 +158,12 @@ def lazy_load(filename: PathLike) -> EntryPointIterator:
 	return lazy_loads(filename.read_text())
 
 
-@_cache
+@_content_cache("entry_points.loads", maxsize=256)
+def _loads_frozen(rawtext: str) -> Tuple[Tuple[str, Tuple[Tuple[str, str], ...]], ...]:
+	# Immutable, as the result is shared between all callers with the same text.
+	return tuple((group, tuple(values)) for group, values in lazy_loads(rawtext))
+
+
 def loads(rawtext: str) -> EntryPointMap:
 	"""
 	Parse the entry points from the given text.
@@ -143,10 +180,20 @@ def loads(rawtext: str) -> EntryPointMap:
 
 			for name, epstr in distro.get_entry_points().get("console_scripts", {}).items():
 				EntryPoint(name, epstr)
+
+	.. versionchanged:: 0.10.0
+
+		The parsed entry points are cached in a bounded cache keyed on a digest of the text,
+		and each call returns a new dictionary.
+		``loads.cache_info()`` and ``loads.cache_clear()`` now act on that cache.
 	"""
 
-	eps = lazy_loads(rawtext)
-	return {k: dict(v) for k, v in eps}
+	return {group: dict(values) for group, values in _loads_frozen(rawtext)}
+
+
+# loads() itself used to be wrapped in functools.lru_cache
+loads.cache_info = _caches["entry_points.loads"].cache_info  # type: ignore[attr-defined]
+loads.cache_clear = _caches["entry_points.loads"].cache_clear  # type: ignore[attr-defined]
 
 
 def load(filename: PathLike) -> EntryPointMap:
@@ -219,51 +266,351 @@ def dump(
 def get_entry_points(
 		group: str,
 		path: Optional[Iterable[PathLike]] = None,
+		*,
+		snapshot_file: Optional[PathLike] = None,
 		) -> Iterator["EntryPoint"]:
 	"""
 	Returns an iterator over :class:`entrypoints.EntryPoint` objects in the given group.
 
 	:param group:
-	:param path: The directories entries to search for distributions in.
+	:param path: The directories entries to search for distributions in,
+		or a :class:`~.DistributionIndex` to take the distributions from.
 	:default path: :py:data:`sys.path`
-	"""
-
-	# this package
-	from dist_meta.distributions import iter_distributions
+	:param snapshot_file: The path to a file in which to persist the entry points between processes.
+		See :meth:`EntryPointIndex.save <.EntryPointIndex.save>`.
 
-	for distro in iter_distributions(path=path):
+	.. versionchanged:: 0.10.0
 
-		eps = distro.get_entry_points()
+		* The entry points are taken from a cached :class:`~.EntryPointIndex`,
+		  which is rebuilt when a directory on ``path`` or an ``entry_points.txt`` file changes.
+		* The :attr:`~.Distribution.path` of each entry point's :attr:`~.EntryPoint.distro`
+		  is now absolute, rather than relative to the directory on ``path`` it was found in.
+		* Added the ``snapshot_file`` argument.
+	"""
 
-		if group in eps:
-			for name, epstr in eps[group].items():
-				yield EntryPoint(name, epstr, group=group, distro=distro)
+	return _get_index(path, snapshot_file).get_entry_points(group)
 
 
-def get_all_entry_points(path: Optional[Iterable[PathLike]] = None) -> Dict[str, List["EntryPoint"]]:
+def get_all_entry_points(
+		path: Optional[Iterable[PathLike]] = None,
+		*,
+		snapshot_file: Optional[PathLike] = None,
+		) -> Dict[str, List["EntryPoint"]]:
 	"""
 	Returns a mapping of entry point groups to entry points for all installed distributions.
 
-	:param path: The directories entries to search for distributions in.
+	:param path: The directories entries to search for distributions in,
+		or a :class:`~.DistributionIndex` to take the distributions from.
 	:default path: :py:data:`sys.path`
+	:param snapshot_file: The path to a file in which to persist the entry points between processes.
+		See :meth:`EntryPointIndex.save <.EntryPointIndex.save>`.
+
+	.. versionchanged:: 0.10.0
+
+		* The entry points are taken from a cached :class:`~.EntryPointIndex`,
+		  which is rebuilt when a directory on ``path`` or an ``entry_points.txt`` file changes.
+		* The :attr:`~.Distribution.path` of each entry point's :attr:`~.EntryPoint.distro`
+		  is now absolute, rather than relative to the directory on ``path`` it was found in.
+		* Added the ``snapshot_file`` argument.
 	"""
 
-	# this package
-	from dist_meta.distributions import iter_distributions
+	return _get_index(path, snapshot_file).get_all_entry_points()
+
+
+class EntryPointIndex(Mapping[str, List["EntryPoint"]]):
+	"""
+	A mapping of entry point groups to the entry points in that group
+	for all installed distributions, built with a single pass over ``path``.
+
+	Each distribution's ``entry_points.txt`` file is parsed once,
+	after which entry points can be looked up by group without touching the filesystem.
 
-	grouped_eps: Dict[str, List[EntryPoint]] = {}
+	:func:`~.get_entry_points` and :func:`~.get_all_entry_points` use a cached :class:`~.EntryPointIndex`
+	for each ``path``, which is rebuilt when any of the directories on ``path`` is modified
+	(e.g. when a distribution is installed or removed), or when any ``entry_points.txt`` file is modified.
 
-	for distro in iter_distributions(path=path):
+	:param path: The directories entries to search for distributions in,
+		or a :class:`~.DistributionIndex` to take the distributions from.
+		Directories are made absolute, so the :attr:`~.Distribution.path` of each entry point's
+		:attr:`~.EntryPoint.distro` is absolute.
+	:default path: :py:data:`sys.path`
+
+	.. versionadded:: 0.10.0
+	"""  # noqa: D400
+
+	_format_version = 1
+
+	def __init__(self, path: Optional[Iterable[PathLike]] = None):
+		# this package
+		from dist_meta.distributions import DistributionIndex, iter_distributions
+
+		if path is None:
+			path = sys.path
+
+		if isinstance(path, DistributionIndex):
+			self._folders: Optional[List[str]] = None
+			self._signature: Optional[Tuple] = None
+		else:
+			self._folders = [os.path.abspath(folder) for folder in path]
+			self._signature = tuple(_dir_signature(folder) for folder in self._folders)
+			path = self._folders
+
+		self._groups: Dict[str, List[EntryPoint]] = {}
+
+		# The distributions which provide entry points, for writing snapshots.
+		self._sources: List[Tuple[Distribution, Optional[List[int]], EntryPointMap]] = []
+
+		for distro in iter_distributions(path=path):
+			try:
+				st = os.stat(distro.path / "entry_points.txt")
+			except OSError:
+				continue
+
+			self._add_distribution(distro, [st.st_mtime_ns, st.st_ino], distro.get_entry_points())
 
-		eps = distro.get_entry_points()
+	def _add_distribution(
+			self,
+			distro: Distribution,
+			file_signature: Optional[List[int]],
+			eps: EntryPointMap,
+			) -> None:
+		self._sources.append((distro, file_signature, eps))
 
 		for group_name in eps:
-			group = grouped_eps.setdefault(group_name, [])
+			group = self._groups.setdefault(group_name, [])
 
 			for name, epstr in eps[group_name].items():  # pylint: disable=use-list-copy
 				group.append(EntryPoint(name, epstr, group_name, distro))
 
-	return grouped_eps
+	def save(self, filename: PathLike) -> None:
+		"""
+		Write a snapshot of the index to ``filename``, from which it can be loaded by another process.
+
+		The snapshot records the entry points of each distribution, the path and
+		modification time of each distribution's ``entry_points.txt`` file, and the modification time
+		of each directory on ``path``. It is only considered valid while none of those have changed.
+
+		Pass the same filename as the ``snapshot_file`` argument of :func:`~.get_entry_points`
+		or :func:`~.get_all_entry_points` to use the snapshot; they will also write it if it is out of date.
+		The snapshot file should not be placed in one of the directories on ``path``,
+		as writing it would change the directory's modification time. A sibling of ``site-packages`` works well.
+
+		:param filename:
+
+		:raises ValueError: If the index was constructed from a :class:`~.DistributionIndex`.
+		"""
+
+		if self._folders is None or self._signature is None:
+			raise ValueError("Cannot save an EntryPointIndex constructed from a DistributionIndex.")
+
+		data: Dict[str, Any] = {
+				"version": self._format_version,
+				"folders": [[folder, *(sig or ())] for folder, sig in zip(self._folders, self._signature)],
+				"distributions": [
+						[distro.name, str(distro.version), os.fspath(distro.path), file_signature, eps]
+						for distro, file_signature, eps in self._sources
+						],
+				}
+
+		_write_json(filename, data)
+
+	@classmethod
+	def _from_snapshot(cls: Type[_EPI], filename: PathLike, folders: Sequence[str]) -> Optional[_EPI]:
+		"""
+		Load an index from a snapshot written by :meth:`~.EntryPointIndex.save`.
+
+		Returns :py:obj:`None` if the snapshot does not exist, is for a different ``path``, is out of date, or is malformed.
+
+		:param filename:
+		:param folders: The absolute paths of the directories to search for distributions in.
+		"""
+
+		data = _read_json(filename)
+		if data is None or data.get("version") != cls._format_version:
+			return None
+
+		signature = tuple(_dir_signature(folder) for folder in folders)
+
+		try:
+			snapshot_folders = data["folders"]
+			if [entry[0] for entry in snapshot_folders] != list(folders):
+				return None
+			if [tuple(entry[1:]) or None for entry in snapshot_folders] != list(signature):
+				return None
+
+			self = cls.__new__(cls)
+			self._folders = list(folders)
+			self._signature = signature
+			self._groups = {}
+			self._sources = []
+
+			for name, version, dist_info_path, file_signature, eps in data["distributions"]:
+				if not _is_file_current(dist_info_path, file_signature):
+					return None
+				if not isinstance(name, str) or not _is_entry_point_map(eps):
+					return None
+
+				distro = Distribution(name, _parse_version(version), PathPlus(dist_info_path))
+				self._add_distribution(distro, file_signature, eps)
+
+		except (KeyError, TypeError, ValueError):
+			# The snapshot is malformed, so treat it as out of date.
+			return None
+
+		return self
+
+	def __getitem__(self, group: str) -> List["EntryPoint"]:
+		"""
+		Returns the entry points in the given group.
+
+		:param group:
+
+		:raises KeyError: If no installed distribution provides entry points in the group.
+		"""
+
+		return list(self._groups[group])
+
+	def __iter__(self) -> Iterator[str]:
+		"""
+		Returns an iterator over the entry point groups.
+		"""
+
+		return iter(self._groups)
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of entry point groups.
+		"""
+
+		return len(self._groups)
+
+	def __repr__(self) -> str:
+		"""
+		Returns a string representation of the :class:`~.EntryPointIndex`.
+		"""
+
+		return f"<{self.__class__.__name__}({len(self)} groups)>"
+
+	def get_entry_points(self, group: str) -> Iterator["EntryPoint"]:
+		"""
+		Returns an iterator over the :class:`~.EntryPoint` objects in the given group.
+
+		:param group:
+		"""
+
+		return iter(self._groups.get(group, ()))
+
+	def get_all_entry_points(self) -> Dict[str, List["EntryPoint"]]:
+		"""
+		Returns a mapping of entry point groups to entry points.
+		"""
+
+		return {group: list(eps) for group, eps in self._groups.items()}
+
+	def _is_current(self, folders: Sequence[str]) -> bool:
+		"""
+		Returns whether none of the directories the index was built from have changed since.
+
+		:param folders: The absolute paths of the directories the index was built from.
+		"""
+
+		if self._signature is None:
+			return False
+
+		signature = tuple(_dir_signature(folder) for folder in folders)
+		if signature != self._signature:
+			return False
+
+		# Changes in the same timestamp granularity as the scan may not be reflected in the mtime.
+		if any(sig is not None and _is_racy(sig[0]) for sig in signature):
+			return False
+
+		# Catch entry_points.txt files which have been modified in place.
+		return all(_is_file_current(distro.path, file_signature) for distro, file_signature, _ in self._sources)
+
+
+def _is_entry_point_map(eps: object) -> bool:
+	"""
+	Returns whether ``eps`` is a mapping of entry point groups to mappings of names to objects.
+
+	:param eps:
+	"""
+
+	if not isinstance(eps, dict):
+		return False
+
+	# Keys are always strings in JSON
+	for group in eps.values():
+		if not isinstance(group, dict) or not all(isinstance(epstr, str) for epstr in group.values()):
+			return False
+
+	return True
+
+
+def _is_file_current(dist_info_path: PathLike, file_signature: Optional[List[int]]) -> bool:
+	"""
+	Returns whether the ``entry_points.txt`` file in ``dist_info_path`` still has the given ``[mtime_ns, inode]``.
+
+	:param dist_info_path:
+	:param file_signature:
+	"""
+
+	try:
+		st = os.stat(os.path.join(dist_info_path, "entry_points.txt"))
+	except OSError:
+		return False
+
+	return [st.st_mtime_ns, st.st_ino] == file_signature and not _is_racy(st.st_mtime_ns)
+
+
+_index_cache: _LRUDict[Tuple[str, ...], EntryPointIndex] = _LRUDict(maxsize=16)
+
+if SHOULD_CACHE:
+	_caches["entry_points.index"] = _index_cache
+else:  # pragma: no cover
+	_caches["entry_points.index"] = _DisabledCache()
+
+
+def _get_index(path: Optional[Iterable[PathLike]], snapshot_file: Optional[PathLike] = None) -> EntryPointIndex:
+	"""
+	Returns an :class:`~.EntryPointIndex` for ``path``, reusing a cached index if ``path`` has not changed.
+
+	:param path:
+	:param snapshot_file: A file to load the index from, and to write it to if it is out of date.
+	"""
+
+	# this package
+	from dist_meta.distributions import DistributionIndex
+
+	if isinstance(path, DistributionIndex):
+		return EntryPointIndex(path)
+
+	if path is None:
+		path = sys.path
+
+	folders = tuple(os.path.abspath(folder) for folder in path)
+
+	if SHOULD_CACHE:
+		index = _index_cache.get(folders, is_valid=lambda index: index._is_current(folders))
+		if index is not None:
+			return index
+
+	index = None
+	if snapshot_file is not None:
+		index = EntryPointIndex._from_snapshot(snapshot_file, folders)
+
+	if index is None:
+		index = EntryPointIndex(folders)
+
+		# Don't write a snapshot which may have missed changes made during the scan.
+		if snapshot_file is not None and index._is_current(folders):
+			with suppress(OSError):
+				index.save(snapshot_file)
+
+	if SHOULD_CACHE:
+		_index_cache[folders] = index
+
+	return index
 
 
 _entry_point_pattern = re.compile(
@@ -278,6 +625,57 @@ $
 		)
 
 
+class _ParsedValue(NamedTuple):
+	module: str
+	attr: Optional[str]
+	extras: Tuple[str, ...]
+
+
+@_cache("entry_points.values", maxsize=4096)
+def _parse_entry_point(value: str) -> Optional[_ParsedValue]:
+	# Returns None if the value is malformed.
+	# Shared between EntryPoint objects with the same value, so must stay immutable.
+
+	match = _entry_point_pattern.match(value)
+	if not match:
+		return None
+
+	module_name, object_name, extras = match.group("modulename", "objectname", "extras")
+
+	if extras is None:
+		return _ParsedValue(module_name, object_name, ())
+	else:
+		return _ParsedValue(module_name, object_name, tuple(re.split(r",\s*", extras)))
+
+
+def validate(entry_points: Iterable["EntryPoint"]) -> None:
+	"""
+	Check that the values of the given entry points are well-formed.
+
+	Unlike accessing :meth:`EntryPoint.load() <.EntryPoint.load>` or the other properties of each
+	entry point in turn, all malformed entry points are reported together.
+
+	:param entry_points:
+
+	:raises ValueError: If any of the entry points are malformed.
+
+	.. versionadded:: 0.10.0
+	"""
+
+	malformed = [ep for ep in entry_points if _parse_entry_point(ep.value) is None]
+
+	if malformed:
+		lines = [f"{len(malformed)} malformed entry point(s):"]
+
+		for ep in malformed:
+			if ep.group is None:
+				lines.append(f"  {ep.name} = {ep.value!r}")
+			else:
+				lines.append(f"  [{ep.group}] {ep.name} = {ep.value!r}")
+
+		raise ValueError('\n'.join(lines))
+
+
 class EntryPoint(NamedTuple):
 	"""
 	Represents a single entry point.
@@ -295,6 +693,14 @@ class EntryPoint(NamedTuple):
 	#: The distribution the entry point belongs to.
 	distro: Optional["Distribution"] = None
 
+	def _parsed(self) -> _ParsedValue:
+		# The value is parsed once and the result shared by all entry points with that value.
+		parsed = _parse_entry_point(self.value)
+		if parsed is None:
+			raise ValueError(f"Malformed entry point {self.value!r}")
+
+		return parsed
+
 	def load(self) -> object:
 		"""
 		Load the object referred to by this entry point.
@@ -303,11 +709,7 @@ class EntryPoint(NamedTuple):
 		Otherwise, return the named object.
 		"""
 
-		match = _entry_point_pattern.match(self.value)
-		if not match:
-			raise ValueError(f"Malformed entry point {self.value!r}")
-
-		module_name, object_name = match.group("modulename", "objectname")
+		module_name, object_name, _ = self._parsed()
 		obj = importlib.import_module(module_name)
 
 		if object_name:
@@ -322,16 +724,7 @@ class EntryPoint(NamedTuple):
 		Returns the list of extras associated with the entry point.
 		"""
 
-		match = _entry_point_pattern.match(self.value)
-		if not match:
-			raise ValueError(f"Malformed entry point {self.value!r}")
-
-		extras = match.group("extras")
-
-		if extras is not None:
-			return re.split(r',\s*', extras)
-
-		return []
+		return list(self._parsed().extras)
 
 	@property
 	def module(self) -> str:
@@ -341,11 +734,7 @@ class EntryPoint(NamedTuple):
 
 		# TODO: proper xref
 
-		match = _entry_point_pattern.match(self.value)
-		if not match:
-			raise ValueError(f"Malformed entry point {self.value!r}")
-
-		return match.group("modulename")
+		return self._parsed().module
 
 	@property
 	def attr(self) -> str:
@@ -359,11 +748,7 @@ class EntryPoint(NamedTuple):
 
 		# TODO: proper xref
 
-		match = _entry_point_pattern.match(self.value)
-		if not match:
-			raise ValueError(f"Malformed entry point {self.value!r}")
-
-		return match.group("objectname")
+		return self._parsed().attr  # type: ignore[return-value]
 
 	@classmethod
 	def from_mapping(
@@ -0,0 +1,568 @@
+#!/usr/bin/env python3
+#
+#  integrity.py
+"""
+Verify the files of installed distributions against their ``RECORD`` files.
+"""
+#
+#  Copyright © 2021 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#  EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+#  MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+#  IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+#  DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+#  OR OTHER DEALINGS IN THE SOFTWARE.
+#
+
+# stdlib
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import suppress
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, TypeVar, Union
+
+# 3rd party
+from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+# this package
+from dist_meta._utils import _canonicalize, _is_racy, _read_json, _write_json
+from dist_meta.distributions import Distribution
+from dist_meta.record import FileHash, RecordEntry, _hash_file
+
+__all__ = (
+		"FileError",
+		"HashMismatch",
+		"MissingFile",
+		"SizeMismatch",
+		"VerificationCache",
+		"VerificationReport",
+		"verify_distribution",
+		"verify_distributions",
+		"verify_record",
+		)
+
+_MODES = ("hash", "size", "size-then-hash")
+
+_VC = TypeVar("_VC", bound="VerificationCache")
+
+
+class HashMismatch(NamedTuple):
+	"""
+	A file whose content does not match the hash given in ``RECORD``.
+
+	.. versionadded:: 0.10.0
+	"""
+
+	#: The ``RECORD`` entry for the file.
+	entry: RecordEntry
+
+	#: The hash given in ``RECORD``.
+	expected: FileHash
+
+	#: The hash of the file on disk.
+	actual: FileHash
+
+
+class SizeMismatch(NamedTuple):
+	"""
+	A file whose size does not match the size given in ``RECORD``.
+
+	.. versionadded:: 0.10.0
+	"""
+
+	#: The ``RECORD`` entry for the file.
+	entry: RecordEntry
+
+	#: The size given in ``RECORD``, in bytes.
+	expected: int
+
+	#: The size of the file on disk, in bytes.
+	actual: int
+
+
+class MissingFile(NamedTuple):
+	"""
+	A file listed in ``RECORD`` which does not exist.
+
+	.. versionadded:: 0.10.0
+	"""
+
+	#: The ``RECORD`` entry for the file.
+	entry: RecordEntry
+
+
+class FileError(NamedTuple):
+	"""
+	A file listed in ``RECORD`` which could not be checked.
+
+	For example, the file may not be readable, or ``RECORD`` may give a hash which is malformed
+	or uses an algorithm which is not supported.
+
+	.. versionadded:: 0.10.0
+	"""
+
+	#: The ``RECORD`` entry for the file.
+	entry: RecordEntry
+
+	#: A description of the error.
+	error: str
+
+
+class VerificationReport(NamedTuple):
+	"""
+	The result of verifying a distribution's files against its ``RECORD`` file.
+
+	.. versionadded:: 0.10.0
+	"""
+
+	#: The number of ``RECORD`` entries which were checked.
+	checked: int
+
+	#: Files whose content does not match the hash in ``RECORD``.
+	hash_mismatches: List[HashMismatch]
+
+	#: Files whose size does not match the size in ``RECORD``.
+	size_mismatches: List[SizeMismatch]
+
+	#: Files listed in ``RECORD`` which do not exist.
+	missing: List[MissingFile]
+
+	#: Files listed in ``RECORD`` which could not be checked.
+	errors: List[FileError]
+
+	@property
+	def ok(self) -> bool:
+		"""
+		Returns whether every file matched its ``RECORD`` entry.
+		"""
+
+		return not (self.hash_mismatches or self.size_mismatches or self.missing or self.errors)
+
+
+class VerificationCache:
+	"""
+	An on-disk cache of the hashes of files which have previously been verified.
+
+	Hashes are keyed by each file's size, modification time and inode,
+	so files which have not changed since they were last hashed do not need to be read again.
+	The cached hashes for a distribution are discarded when its ``RECORD`` file changes.
+
+	Installed distributions are keyed by the directory they are installed in and their normalised name,
+	so upgrading a distribution replaces its entry rather than adding another.
+
+	The cache is written back to disk by :meth:`~.VerificationCache.save`,
+	or when the :keyword:`with` block is exited if used as a context manager.
+
+	:param filename: The file the cache is stored in. It is created if it does not exist.
+
+	.. versionadded:: 0.10.0
+	"""
+
+	_format_version = 2
+
+	def __init__(self, filename: PathLike):
+		self.filename = PathPlus(filename)
+		self.changed = False
+
+		data = _read_json(self.filename)
+		if data is None or data.get("version") != self._format_version:
+			self._distributions: Dict[str, Dict] = {}
+		else:
+			self._distributions = data["distributions"]
+
+	def _get_files(self, key: str, record_signature: Optional[List[int]]) -> Dict[str, List]:
+		"""
+		Returns the cached hashes for the distribution identified by ``key``, keyed by ``RECORD`` entry.
+
+		:param key:
+		:param record_signature: The ``[size, mtime_ns, inode]`` of the distribution's ``RECORD`` file.
+			If this differs from the cached value the cached hashes are discarded.
+		"""
+
+		cached = self._distributions.get(key)
+
+		if cached is None or cached["record"] != record_signature:
+			cached = self._distributions[key] = {"record": record_signature, "files": {}}
+			self.changed = True
+
+		return cached["files"]
+
+	def save(self) -> None:
+		"""
+		Write the cache to disk, if it has changed.
+
+		Failure to write the cache (e.g. on a read-only filesystem) is not an error.
+		"""
+
+		if not self.changed:
+			return
+
+		with suppress(OSError):
+			_write_json(self.filename, {"version": self._format_version, "distributions": self._distributions})
+
+		self.changed = False
+
+	def __enter__(self: _VC) -> _VC:
+		return self
+
+	def __exit__(self, exc_type, exc_val, exc_tb):  # noqa: MAN001
+		self.save()
+
+
+def _stat_signature(st: os.stat_result) -> List[int]:
+	return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+
+def _check_file(
+		filename: str,
+		algorithm: Optional[str],
+		expected_size: Optional[int],
+		) -> Union[Tuple[int, Optional[str]], str, None]:
+	"""
+	Returns the size of ``filename``, and its hash if ``algorithm`` is given.
+
+	This function only takes and returns builtin types, so it can be dispatched to a process pool.
+
+	:param filename:
+	:param algorithm: The name of the hash algorithm, or :py:obj:`None` to skip hashing the file.
+	:param expected_size: If given, the file is only hashed if it is this many bytes long.
+
+	:returns: A ``(size, hash)`` tuple, where ``hash`` is the :func:`~.base64.urlsafe_b64encode`'d digest
+		(or :py:obj:`None` if the file wasn't hashed); :py:obj:`None` if the file does not exist;
+		or a string describing the error if the file could not be checked.
+	"""
+
+	try:
+		if algorithm is None or expected_size is not None:
+			size = os.stat(filename).st_size
+			if algorithm is None or size != expected_size:
+				return size, None
+
+		the_hash, size = _hash_file(filename, algorithm)
+	except (FileNotFoundError, NotADirectoryError):
+		return None
+	except (OSError, ValueError) as e:
+		return f"{type(e).__name__}: {e}"
+
+	return size, FileHash.from_hash(the_hash).value
+
+
+def _iter_results(
+		filenames: List[str],
+		algorithms: List[Optional[str]],
+		sizes: List[Optional[int]],
+		workers: int,
+		executor: Optional[Executor],
+		) -> Iterator[Union[Tuple[int, Optional[str]], str, None]]:
+	if executor is not None:
+		yield from executor.map(_check_file, filenames, algorithms, sizes, chunksize=32)
+	elif workers > 1:
+		with ThreadPoolExecutor(max_workers=workers) as pool:
+			yield from pool.map(_check_file, filenames, algorithms, sizes)
+	else:
+		yield from map(_check_file, filenames, algorithms, sizes)
+
+
+def verify_record(
+		entries: Iterable[RecordEntry],
+		root: PathLike,
+		*,
+		workers: int = 1,
+		executor: Optional[Executor] = None,
+		mode: str = "hash",
+		cache: Optional[VerificationCache] = None,
+		) -> VerificationReport:
+	"""
+	Verify the files listed in a ``RECORD`` file against their hashes and sizes.
+
+	Each file is read once, in large chunks.
+	Entries without a hash are only checked for their existence and size.
+
+	``mode`` controls how thoroughly files are checked:
+
+	* ``'hash'`` -- every file with a hash in ``RECORD`` is hashed, and its size compared.
+	* ``'size'`` -- files are only checked with :func:`os.stat` and their sizes compared.
+	  This detects missing and truncated files very quickly, but not files which have been modified in place.
+	* ``'size-then-hash'`` -- as ``'hash'``, but files whose size does not match are not hashed.
+
+	:param entries: The ``RECORD`` entries, such as from :meth:`Distribution.get_record() <.DistributionType.get_record>`.
+	:param root: The directory the paths in ``RECORD`` are relative to;
+		for an installed distribution this is the parent of the ``*.dist-info`` directory.
+	:param workers: The number of threads to hash files with.
+		:mod:`hashlib` releases the :term:`GIL` while hashing, so files are hashed in parallel.
+	:param executor: An existing :class:`concurrent.futures.Executor` to hash files with, overriding ``workers``.
+		Pass a :class:`~concurrent.futures.ProcessPoolExecutor` to hash files in multiple processes.
+	:param mode: One of ``'hash'``, ``'size'`` or ``'size-then-hash'``.
+	:param cache: A cache of previously calculated hashes, which is used to skip hashing unchanged files.
+		Entries are keyed by ``root``.
+
+	:raises ValueError: if ``mode`` is not a valid mode.
+
+	.. versionadded:: 0.10.0
+	"""
+
+	job = _Job(entries, root, mode, cache, os.path.abspath(root), None)
+	return job.finish(_iter_results(*job.arguments(), workers, executor))
+
+
+def verify_distribution(
+		distro: Distribution,
+		*,
+		workers: int = 1,
+		executor: Optional[Executor] = None,
+		mode: str = "hash",
+		cache: Optional[VerificationCache] = None,
+		) -> VerificationReport:
+	"""
+	Verify the files of an installed distribution against its ``RECORD`` file.
+
+	:param distro:
+	:param workers: The number of threads to hash files with.
+	:param executor: An existing :class:`concurrent.futures.Executor` to hash files with, overriding ``workers``.
+	:param mode: One of ``'hash'``, ``'size'`` or ``'size-then-hash'``. See :func:`~.verify_record` for details.
+	:param cache: A cache of previously calculated hashes, which is used to skip hashing unchanged files.
+		The cached hashes for the distribution are discarded if its ``RECORD`` file has changed.
+
+	:raises FileNotFoundError: if the distribution has no ``RECORD`` file.
+	:raises ValueError: if ``mode`` is not a valid mode.
+
+	.. versionadded:: 0.10.0
+	"""
+
+	job = _Job.for_distribution(distro, mode, cache)
+	return job.finish(_iter_results(*job.arguments(), workers, executor))
+
+
+def verify_distributions(
+		distros: Iterable[Distribution],
+		*,
+		workers: int = 1,
+		executor: Optional[Executor] = None,
+		mode: str = "hash",
+		cache: Optional[VerificationCache] = None,
+		) -> Iterator[VerificationReport]:
+	"""
+	Verify the files of several installed distributions against their ``RECORD`` files.
+
+	The files of every distribution are queued for checking up front, so ``workers``
+	(or ``executor``) are kept busy across distributions rather than waiting for each one to finish.
+
+	:param distros:
+	:param workers: The number of threads to hash files with.
+	:param executor: An existing :class:`concurrent.futures.Executor` to hash files with, overriding ``workers``.
+	:param mode: One of ``'hash'``, ``'size'`` or ``'size-then-hash'``. See :func:`~.verify_record` for details.
+	:param cache: A cache of previously calculated hashes, which is used to skip hashing unchanged files.
+
+	:returns: An iterator over the report for each distribution, in the same order as ``distros``.
+		Each report is yielded as soon as its distribution's files have been checked.
+
+	:raises FileNotFoundError: if any of the distributions has no ``RECORD`` file.
+		This is raised before any files are checked.
+	:raises ValueError: if ``mode`` is not a valid mode.
+
+	.. versionadded:: 0.10.0
+	"""
+
+	jobs = [_Job.for_distribution(distro, mode, cache) for distro in distros]
+
+	filenames: List[str] = []
+	algorithms: List[Optional[str]] = []
+	sizes: List[Optional[int]] = []
+
+	for job in jobs:
+		job_filenames, job_algorithms, job_sizes = job.arguments()
+		filenames.extend(job_filenames)
+		algorithms.extend(job_algorithms)
+		sizes.extend(job_sizes)
+
+	return _iter_reports(jobs, _iter_results(filenames, algorithms, sizes, workers, executor))
+
+
+def _iter_reports(jobs: List["_Job"], results: Iterator) -> Iterator[VerificationReport]:
+	# Separate generator so verify_distributions reads every RECORD and validates ``mode`` when called,
+	# raising errors before any files are checked, rather than on the first next().
+	for job in jobs:
+		yield job.finish(islice(results, len(job.pending)))
+
+
+class _Job:
+	"""
+	The files of one ``RECORD`` file which are being verified.
+
+	:param entries:
+	:param root: The directory the paths in ``RECORD`` are relative to.
+	:param mode:
+	:param cache:
+	:param cache_key: The key for the distribution in ``cache``.
+	:param record_signature: The ``[size, mtime_ns, inode]`` of the ``RECORD`` file.
+	"""
+
+	def __init__(
+			self,
+			entries: Iterable[RecordEntry],
+			root: PathLike,
+			mode: str,
+			cache: Optional[VerificationCache],
+			cache_key: str,
+			record_signature: Optional[List[int]],
+			):
+		if mode not in _MODES:
+			raise ValueError(f"Unknown verification mode {mode!r}")
+
+		self.entries = entries = list(entries)
+		self.cache = cache
+		root = os.fspath(root)
+
+		self.filenames = filenames = [os.path.normpath(os.path.join(root, entry)) for entry in entries]
+
+		if mode == "size":
+			self.algorithms: List[Optional[str]] = [None] * len(entries)
+		else:
+			self.algorithms = [entry.hash.name if entry.hash else None for entry in entries]
+
+		if mode == "size-then-hash":
+			self.sizes: List[Optional[int]] = [entry.size for entry in entries]
+		else:
+			self.sizes = [None] * len(entries)
+
+		self.results: List[Union[Tuple[int, Optional[str]], str, None]] = [None] * len(entries)
+		self.pending: List[int] = []
+
+		# The stat of each file before it was hashed, which is what its hash is cached against.
+		self.stats: Dict[int, os.stat_result] = {}
+
+		for idx, (entry, algorithm) in enumerate(zip(entries, self.algorithms)):
+			if algorithm is None:
+				continue
+
+			try:
+				entry.hash.digest()  # type: ignore[union-attr]
+			except ValueError:
+				# Malformed base64 (binascii.Error); there is nothing to compare the file against.
+				self.results[idx] = f"Malformed hash in RECORD: {entry.hash.to_string()!r}"  # type: ignore[union-attr]
+
+		if cache is None or mode == "size":
+			self.pending.extend(idx for idx in range(len(entries)) if self.results[idx] is None)
+			return
+
+		self.cached_files = cache._get_files(cache_key, record_signature)
+
+		for idx, (entry, filename, algorithm) in enumerate(zip(entries, filenames, self.algorithms)):
+			if self.results[idx] is not None:
+				continue
+
+			if algorithm is None:
+				self.pending.append(idx)
+				continue
+
+			try:
+				st = os.stat(filename)
+			except OSError:
+				# Reported as missing, or as an error, by _check_file
+				self.pending.append(idx)
+				continue
+
+			cached = self.cached_files.get(entry.as_posix())
+
+			if self.sizes[idx] is not None and st.st_size != self.sizes[idx]:
+				self.results[idx] = (st.st_size, None)
+			elif cached is not None and cached[:3] == _stat_signature(st) and cached[3] == algorithm:
+				self.results[idx] = (st.st_size, cached[4])
+			else:
+				self.stats[idx] = st
+				self.pending.append(idx)
+
+	@classmethod
+	def for_distribution(cls, distro: Distribution, mode: str, cache: Optional[VerificationCache]) -> "_Job":
+		"""
+		Construct a job for the files of an installed distribution.
+
+		:param distro:
+		:param mode:
+		:param cache:
+		"""
+
+		record_file = distro.path / "RECORD"
+
+		try:
+			record_signature = _stat_signature(record_file.stat())
+		except FileNotFoundError:
+			raise FileNotFoundError(os.fspath(record_file)) from None
+
+		record = distro.get_record_table()
+		if record is None:
+			raise FileNotFoundError(os.fspath(record_file))
+
+		# Keyed by project rather than by *.dist-info directory, so an upgrade replaces the old entry.
+		cache_key = os.path.join(os.path.abspath(distro.path.parent), _canonicalize(distro.name))
+
+		return cls(record, distro.path.parent, mode, cache, cache_key, record_signature)
+
+	def arguments(self) -> Tuple[List[str], List[Optional[str]], List[Optional[int]]]:
+		"""
+		Returns the arguments to :func:`~._check_file` for each file which still needs checking.
+		"""
+
+		return (
+				[self.filenames[idx] for idx in self.pending],
+				[self.algorithms[idx] for idx in self.pending],
+				[self.sizes[idx] for idx in self.pending],
+				)
+
+	def finish(self, pending_results: Iterable[Union[Tuple[int, Optional[str]], str, None]]) -> VerificationReport:
+		"""
+		Construct the report from the results of :func:`~._check_file` for each file in :attr:`~.pending`.
+
+		:param pending_results:
+		"""
+
+		entries, cache = self.entries, self.cache
+
+		for idx, result in zip(self.pending, pending_results):
+			self.results[idx] = result
+
+			if cache is None or idx not in self.stats or not isinstance(result, tuple) or result[1] is None:
+				continue
+
+			st = self.stats[idx]
+			if result[0] == st.st_size and not _is_racy(st.st_mtime_ns):
+				self.cached_files[entries[idx].as_posix()] = [*_stat_signature(st), self.algorithms[idx], result[1]]
+				cache.changed = True
+
+		hash_mismatches: List[HashMismatch] = []
+		size_mismatches: List[SizeMismatch] = []
+		missing: List[MissingFile] = []
+		errors: List[FileError] = []
+
+		for entry, result in zip(entries, self.results):
+			if result is None:
+				missing.append(MissingFile(entry))
+				continue
+			elif isinstance(result, str):
+				errors.append(FileError(entry, result))
+				continue
+
+			size, value = result
+
+			if entry.size is not None and entry.size != size:
+				size_mismatches.append(SizeMismatch(entry, entry.size, size))
+
+			if entry.hash is not None and value is not None:
+				actual = FileHash(entry.hash.name, value)
+				if not entry.hash.matches(actual):
+					hash_mismatches.append(HashMismatch(entry, entry.hash, actual))
+
+		return VerificationReport(len(entries), hash_mismatches, size_mismatches, missing, errors)
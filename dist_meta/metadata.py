@@ -27,6 +27,8 @@ Parse and create ``*dist-info/METADATA`` files.
 #
 
 # stdlib
+import functools
+import re
 import sys
 from typing import List
 
@@ -36,13 +38,17 @@ from domdf_python_tools.typing import PathLike
 from domdf_python_tools.utils import divide
 
 # this package
-from dist_meta.metadata_mapping import MetadataEmitter, MetadataMapping
+from dist_meta.metadata_mapping import MetadataEmitter, MetadataMapping, _LazyValue
 
 __all__ = ("dump", "dumps", "load", "loads", "MissingFieldError")
 
 DELIMITER = "\n\n"
 NEWLINE_MARK = '\uf8ff'
 
+# Matches DELIMITER before line endings are normalised.
+_delimiter_re = re.compile(r"\r?\n\r?\n")
+_non_whitespace_re = re.compile(r"\S")
+
 
 def _clean_desc(lines: List[str], wsp: str) -> List[str]:
 	#  Adapted from inspect.cleandoc
@@ -76,32 +82,60 @@ def _clean_desc(lines: List[str], wsp: str) -> List[str]:
 	return lines
 
 
+def _unfold_description(field_value: str) -> str:
+	# Unwrap a description given as a (folded) field in the header
+	description_lines = field_value.split(NEWLINE_MARK)
+	description_lines = _clean_desc(description_lines, ' ')
+	description_lines = _clean_desc(description_lines, '\t')
+	description_lines = _clean_desc(description_lines, '|')
+
+	return '\n'.join(description_lines).strip() + '\n'
+
+
+def _normalise_body(body: str) -> str:
+	return body.replace("\r\n", '\n').strip() + '\n'
+
+
 class MissingFieldError(ValueError):
 	"""
 	Raised when a required field is missing.
 	"""
 
 
-def loads(rawtext: str) -> MetadataMapping:
+def loads(rawtext: str, *, headers_only: bool = False) -> MetadataMapping:
 	"""
 	Parse Python core metadata from the given string.
 
 	:param rawtext:
+	:param headers_only: If :py:obj:`True`, parsing stops at the end of the header,
+		and the long description is not included in the returned mapping.
+		This is considerably faster when only fields such as ``Name`` or ``Requires-Dist`` are required.
 
 	:returns: A mapping of the metadata fields, and the long description
+
+	.. versionchanged:: 0.10.0
+
+		* Added the ``headers_only`` argument.
+		* The long description is only dedented and normalised when it is first accessed.
 	"""
 
-	rawtext = rawtext.replace("\r\n", '\n')
+	# Locate the header/body delimiter before normalising line endings, so the body is never copied if not needed.
+	delimiter = _delimiter_re.search(rawtext)
+	body_start = len(rawtext)
 
-	if DELIMITER in rawtext:
-		rawtext, body = rawtext.split(DELIMITER, maxsplit=1)
+	if delimiter is not None:
+		if not headers_only:
+			body_start = delimiter.end()
+		header = rawtext[:delimiter.start()]
 	else:
-		body = ''
+		header = rawtext
+
+	header = header.replace("\r\n", '\n')
 
 	# unfold per RFC 5322 § 2.2.3
-	rawtext = rawtext.replace("\n\t", f"{NEWLINE_MARK}\t").replace("\n ", f"{NEWLINE_MARK} ")
+	header = header.replace("\n\t", f"{NEWLINE_MARK}\t").replace("\n ", f"{NEWLINE_MARK} ")
 
-	file_content: List[str] = rawtext.split('\n')
+	file_content: List[str] = header.split('\n')
 
 	fields: MetadataMapping = MetadataMapping()
 
@@ -114,24 +148,19 @@ def loads(rawtext: str) -> MetadataMapping:
 		# pylint: disable=loop-global-usage
 		if field_name.lower() != "description":
 			fields[field_name] = field_value.replace(NEWLINE_MARK, '').lstrip()
-		else:
-			# Unwrap
-			description_lines = field_value.split(NEWLINE_MARK)
-			description_lines = _clean_desc(description_lines, ' ')
-			description_lines = _clean_desc(description_lines, '\t')
-			description_lines = _clean_desc(description_lines, '|')
-			# pylint: enable=loop-global-usage
-
-			# pylint: disable=loop-invariant-statement
-			fields["Description"] = '\n'.join(description_lines).strip() + '\n'
-			# pylint: enable=loop-invariant-statement
-
-	if body.strip():
+		elif not headers_only:
+			fields.set_lazy("Description", functools.partial(_unfold_description, field_value))
+		# pylint: enable=loop-global-usage
+
+	# The body is only checked for content here; it is normalised when the description is accessed.
+	if _non_whitespace_re.search(rawtext, body_start):
 		if "Description" in fields:
 			msg = "A value was given for the 'Description' field but the body of the file is not empty."
 			raise ValueError(msg)
 		else:
-			fields["Description"] = body.strip() + '\n'
+			# Only the body is kept alive, not the whole file.
+			body = rawtext[body_start:]
+			fields._append("Description", _LazyValue(functools.partial(_normalise_body, body), raw=body))
 
 	for required_field in ["Metadata-Version", "Name", "Version"]:
 		if required_field not in fields:
@@ -140,17 +169,23 @@ def loads(rawtext: str) -> MetadataMapping:
 	return fields
 
 
-def load(filename: PathLike) -> MetadataMapping:
+def load(filename: PathLike, *, headers_only: bool = False) -> MetadataMapping:
 	"""
 	Parse Python core metadata from the given file.
 
 	:param filename:
+	:param headers_only: If :py:obj:`True`, parsing stops at the end of the header,
+		and the long description is not included in the returned mapping.
 
 	:returns: A mapping of the metadata fields, and the long description
+
+	.. versionchanged:: 0.10.0
+
+		Added the ``headers_only`` argument.
 	"""
 
 	filename = PathPlus(filename)
-	return loads(filename.read_text())
+	return loads(filename.read_text(), headers_only=headers_only)
 
 
 def dumps(fields: MetadataMapping) -> str:
@@ -221,7 +256,15 @@ def dumps(fields: MetadataMapping) -> str:
 	output.add_single("Description-Content-Type")
 
 	if "Description" in fields:
-		output.add_body(fields["Description"])
+		raw_body = fields._peek_raw("Description")
+
+		if raw_body is not None:
+			# The description has never been accessed, so write the body from the source file without normalising it.
+			# The emitter strips trailing whitespace and "\r" from each line, and collapses trailing blank lines.
+			output.add_body(raw_body.lstrip())
+		else:
+			# Avoid storing the computed description on the mapping if it has not already been accessed.
+			output.add_body(fields._peek("Description"))  # type: ignore[arg-type]
 
 	return str(output)
 
@@ -40,7 +40,7 @@
 #
 
 # stdlib
-from typing import Iterator, List, MutableMapping, Optional, Tuple, TypeVar, Union, cast, overload
+from typing import Callable, Dict, Iterator, List, MutableMapping, Optional, Tuple, TypeVar, Union, cast, overload
 
 # 3rd party
 from domdf_python_tools.stringlist import DelimitedList, StringList
@@ -50,6 +50,24 @@ __all__ = ("MetadataMapping", "MetadataEmitter")
 _T = TypeVar("_T")
 
 
+class _LazyValue:
+	"""
+	A field value which is only computed when it is first accessed.
+
+	:param factory: A callable which takes no arguments and returns the value.
+	:param raw: The source text the value is computed from, if it can be written out as-is.
+	"""
+
+	__slots__ = ("factory", "raw")
+
+	def __init__(self, factory: Callable[[], str], raw: Optional[str] = None):
+		self.factory = factory
+		self.raw = raw
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__}({self.factory!r})>"
+
+
 class MetadataMapping(MutableMapping[str, str]):
 	"""
 	Provides a :class:`~collections.abc.MutableMapping` interface to a list of fields,
@@ -64,10 +82,45 @@ class MetadataMapping(MutableMapping[str, str]):
 	Some fields do in fact appear multiple times,
 	and for those fields you must use the :meth:`~.MetadataMapping.get_all` method
 	to obtain all values for that field.
+
+	.. versionchanged:: 0.10.0
+
+		* Values may be computed lazily. See :meth:`~.MetadataMapping.set_lazy`.
+		* Lookups by field name no longer scan the whole list of fields.
 	"""  # noqa: D400
 
 	def __init__(self):
-		self._fields: List[Tuple[str, str]] = []
+		self._fields: List[Tuple[str, Union[str, _LazyValue]]] = []
+
+		# Mapping of lowercased field names to their positions in ``_fields``, in insertion order.
+		self._index: Dict[str, List[int]] = {}
+
+	def _positions(self, name: str) -> List[int]:
+		return self._index.get(name.lower(), [])
+
+	def _append(self, name: str, val: Union[str, _LazyValue]) -> None:
+		self._index.setdefault(name.lower(), []).append(len(self._fields))
+		self._fields.append((name, val))
+
+	def _resolve(self, index: int) -> str:
+		"""
+		Returns the value of the field at ``index``, computing and storing it first if it is lazy.
+
+		:param index:
+		"""
+
+		key, val = self._fields[index]
+
+		if isinstance(val, _LazyValue):
+			val = val.factory()
+			self._fields[index] = (key, val)
+
+		return val
+
+	def _resolve_all(self) -> None:
+		for i, (key, val) in enumerate(self._fields):
+			if isinstance(val, _LazyValue):
+				self._fields[i] = (key, val.factory())
 
 	#
 	# MAPPING INTERFACE (partial)
@@ -96,10 +149,14 @@ class MetadataMapping(MutableMapping[str, str]):
 		:param name:
 		"""
 
-		if name not in self:
+		if not isinstance(name, str):
+			raise KeyError(name)
+
+		positions = self._positions(name)
+		if not positions:
 			raise KeyError(name)
 
-		return cast(str, self.get(name))
+		return self._resolve(positions[0])
 
 	def __setitem__(self, name: str, val: str) -> None:
 		"""
@@ -114,7 +171,57 @@ class MetadataMapping(MutableMapping[str, str]):
 		:param val:
 		"""
 
-		self._fields.append((name, val))
+		self._append(name, val)
+
+	def set_lazy(self, name: str, factory: Callable[[], str]) -> None:
+		"""
+		Set the value of a field to be computed by ``factory`` when it is first accessed.
+
+		The computed value is stored, so ``factory`` is called at most once.
+		As with :meth:`~.MetadataMapping.__setitem__`, this does not overwrite existing fields with the same name.
+
+		.. versionadded:: 0.10.0
+
+		:param name:
+		:param factory: A callable which takes no arguments and returns the value of the field.
+		"""
+
+		self._append(name, _LazyValue(factory))
+
+	def _peek(self, name: str) -> Optional[str]:
+		"""
+		Like :meth:`~.MetadataMapping.get`, but a lazy value is computed without being stored.
+
+		:param name:
+		"""
+
+		positions = self._positions(name)
+		if not positions:
+			return None
+
+		val = self._fields[positions[0]][1]
+		if isinstance(val, _LazyValue):
+			return val.factory()
+
+		return val
+
+	def _peek_raw(self, name: str) -> Optional[str]:
+		"""
+		Returns the source text of a lazy field which has not yet been computed,
+		or :py:obj:`None` if the field is missing, has been computed, or has no source text.
+
+		:param name:
+		"""
+
+		positions = self._positions(name)
+		if not positions:
+			return None
+
+		val = self._fields[positions[0]][1]
+		if isinstance(val, _LazyValue):
+			return val.raw
+
+		return None
 
 	def __delitem__(self, name: str) -> None:
 		"""
@@ -126,7 +233,15 @@ class MetadataMapping(MutableMapping[str, str]):
 		"""
 
 		name = name.lower()
-		self._fields = [(k, v) for k, v in self._fields if k.lower() != name]
+
+		if name not in self._index:
+			return
+
+		fields, self._fields, self._index = self._fields, [], {}
+
+		for key, val in fields:
+			if key.lower() != name:
+				self._append(key, val)
 
 	def __contains__(self, name: object) -> bool:
 		"""
@@ -138,13 +253,7 @@ class MetadataMapping(MutableMapping[str, str]):
 		if not isinstance(name, str):
 			return False
 
-		name = name.lower()
-
-		for k, v in self._fields:
-			if k.lower() == name:
-				return True
-
-		return False
+		return name.lower() in self._index
 
 	def __iter__(self) -> Iterator[str]:
 		"""
@@ -172,7 +281,8 @@ class MetadataMapping(MutableMapping[str, str]):
 		Any fields deleted and re-inserted are always appended to the field list.
 		"""
 
-		return [v for k, v in self._fields]
+		self._resolve_all()
+		return [cast(str, v) for k, v in self._fields]
 
 	def items(self) -> List[Tuple[str, str]]:  # type: ignore[override]
 		"""
@@ -182,7 +292,8 @@ class MetadataMapping(MutableMapping[str, str]):
 		Any fields deleted and re-inserted are always appended to the field list.
 		"""
 
-		return self._fields[:]
+		self._resolve_all()
+		return cast(List[Tuple[str, str]], self._fields[:])
 
 	@overload
 	def get(self, name: str) -> Optional[str]: ...
@@ -208,13 +319,11 @@ class MetadataMapping(MutableMapping[str, str]):
 		:param default:
 		"""
 
-		name = name.lower()
-
-		for key, val in self._fields:
-			if key.lower() == name:
-				return val
+		positions = self._positions(name)
+		if not positions:
+			return default
 
-		return default
+		return self._resolve(positions[0])
 
 	#
 	# Additional useful stuff
@@ -240,13 +349,11 @@ class MetadataMapping(MutableMapping[str, str]):
 		:param default:
 		"""
 
-		name = name.lower()
-		values = [val for key, val in self._fields if key.lower() == name]
-
-		if not values:
+		positions = self._positions(name)
+		if not positions:
 			return default
 
-		return values
+		return [self._resolve(i) for i in positions]
 
 	def __repr__(self) -> str:
 		"""
@@ -268,13 +375,12 @@ class MetadataMapping(MutableMapping[str, str]):
 		:raises KeyError: If no matching field was found.
 		"""
 
-		for i, (key, val) in enumerate(self._fields):
-			if key.lower() == name.lower():
-				self._fields[i] = (name, value)
-				break
-		else:
+		positions = self._positions(name)
+		if not positions:
 			raise KeyError(name)
 
+		self._fields[positions[0]] = (name, value)
+
 
 class MetadataEmitter(StringList):
 	"""
@@ -28,17 +28,40 @@ Classes to model parts of ``RECORD`` files.
 
 # stdlib
 import csv
+import hashlib
+import hmac
+import io
 import os
 import pathlib
 import posixpath
 import sys
+from array import array
 from base64 import urlsafe_b64decode, urlsafe_b64encode
-from typing import TYPE_CHECKING, NamedTuple, Optional, Type, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+		TYPE_CHECKING,
+		Dict,
+		Iterable,
+		Iterator,
+		List,
+		NamedTuple,
+		Optional,
+		Sequence,
+		Tuple,
+		Type,
+		TypeVar,
+		Union,
+		overload
+		)
 
 # 3rd party
+from domdf_python_tools.paths import PathPlus
 from domdf_python_tools.stringlist import DelimitedList
 from domdf_python_tools.typing import PathLike
 
+# this package
+from dist_meta._utils import _cache
+
 if TYPE_CHECKING:
 	# stdlib
 	from hashlib import _Hash
@@ -56,10 +79,14 @@ else:
 		except ImportError:
 			pass
 
-__all__ = ("FileHash", "RecordEntry")
+__all__ = ("FileHash", "RecordEntry", "RecordTable", "build", "dump", "dumps", "load", "loads")
 
 _RE = TypeVar("_RE", bound="RecordEntry")
 _FH = TypeVar("_FH", bound="FileHash")
+_RT = TypeVar("_RT", bound="RecordTable")
+
+# The size of the buffer files are read into when hashing them.
+_CHUNK_SIZE = 1024 * 1024
 
 
 class RecordEntry(pathlib.PurePosixPath):
@@ -196,24 +223,17 @@ class RecordEntry(pathlib.PurePosixPath):
 			parts.append(f"distro={self.distro!r}")
 		return f"{self.__class__.__name__}({parts:, })"
 
+	def __reduce__(self):  # noqa: MAN002
+		return self.__class__, (self.as_posix(), self.hash, self.size, self.distro)
+
 	def as_record_entry(self) -> str:
 		"""
 		Returns an entry for a ``RECORD`` file, in the form ``<name>,<hash>,<size>``.
 		"""
 
-		parts = [self.as_posix()]
-
-		if self.hash is not None:
-			parts.append(self.hash.to_string())
-		else:
-			parts.append('')
-
-		if self.size is not None:
-			parts.append(str(self.size))
-		else:
-			parts.append('')
-
-		return ','.join(parts)
+		hash_ = '' if self.hash is None else self.hash.to_string()
+		size = '' if self.size is None else self.size
+		return f"{self.as_posix()},{hash_},{size}"
 
 	@classmethod
 	def from_record_entry(
@@ -255,6 +275,48 @@ class RecordEntry(pathlib.PurePosixPath):
 				distro=distro,
 				)
 
+	@classmethod
+	def from_file(
+			cls: Type[_RE],
+			filename: PathLike,
+			root: Optional[PathLike] = None,
+			*,
+			algorithm: str = "sha256",
+			distro: Optional["Distribution"] = None,
+			) -> _RE:
+		"""
+		Construct a :class:`~.RecordEntry` for a file, calculating its hash and size.
+
+		The file is only read once, and is not read into memory all at once.
+
+		.. versionadded:: 0.10.0
+
+		:param filename: The file to hash.
+		:param root: The distribution root (e.g. the ``site-packages`` directory).
+			If given, the path of the entry is ``filename`` relative to ``root``,
+			and a relative ``filename`` is taken to be relative to ``root``.
+			Otherwise ``filename`` must be a relative path, which is used for the entry.
+		:param algorithm: The hash algorithm to use.
+		:param distro: The distribution the file belongs to.
+
+		:raises ValueError: if the hash algorithm is not supported by :mod:`hashlib`,
+			or if ``root`` is not given and ``filename`` is an absolute path.
+
+		:rtype: :class:`~.RecordEntry`
+		"""
+
+		if root is None:
+			path = filename
+		else:
+			filename = os.path.join(root, filename)
+			path = os.path.relpath(filename, root)
+
+		# Reject absolute paths before reading the whole file.
+		path = cls._coerce_path(path)
+
+		the_hash, size = _hash_file(filename, algorithm)
+		return cls(path, hash=FileHash.from_hash(the_hash), size=size, distro=distro)
+
 
 class FileHash(NamedTuple):
 	"""
@@ -294,7 +356,7 @@ class FileHash(NamedTuple):
 		This is a bytes object which may contain bytes in the whole range from 0 to 255.
 		"""
 
-		return urlsafe_b64decode(f"{self.value}==".encode("latin1"))
+		return _decode_digest(self.value)
 
 	def hexdigest(self) -> str:
 		"""
@@ -304,7 +366,45 @@ class FileHash(NamedTuple):
 		This may be used to exchange the value safely in email or other non-binary environments.
 		"""  # noqa: D400
 
-		return ''.join(f"{x:0{2}x}" for x in self.digest())
+		return self.digest().hex()
+
+	def matches(self, other: Union["FileHash", bytes, "_Hash"]) -> bool:
+		"""
+		Returns whether this hash matches ``other``.
+
+		The raw digests are compared, without converting either to a string.
+
+		:param other: Another :class:`~.FileHash`, a :mod:`hashlib` hash object, or the raw digest as :class:`bytes`.
+			For :class:`~.FileHash` and hash objects the hash algorithms must also match.
+
+		.. versionadded:: 0.10.0
+		"""
+
+		if isinstance(other, FileHash):
+			if other.name != self.name:
+				return False
+			other_digest = other.digest()
+		elif isinstance(other, (bytes, bytearray, memoryview)):
+			other_digest = bytes(other)
+		else:
+			if other.name != self.name:
+				return False
+			other_digest = other.digest()
+
+		return hmac.compare_digest(self.digest(), other_digest)
+
+	def verify_bytes(self, data: bytes) -> bool:
+		"""
+		Returns whether the hash of ``data`` matches this hash.
+
+		:param data:
+
+		:raises ValueError: if the hash algorithm is not supported by :mod:`hashlib`.
+
+		.. versionadded:: 0.10.0
+		"""
+
+		return self.matches(hashlib.new(self.name, data))
 
 	@classmethod
 	def from_hash(cls: Type[_FH], the_hash: "_Hash") -> _FH:
@@ -320,3 +420,449 @@ class FileHash(NamedTuple):
 		name = the_hash.name
 		value = urlsafe_b64encode(the_hash.digest()).decode("latin1").rstrip('=')
 		return cls(name, value)
+
+	@classmethod
+	def from_file(cls: Type[_FH], filename: PathLike, algorithm: str = "sha256") -> _FH:
+		"""
+		Construct a :class:`~.FileHash` object by hashing the file ``filename``.
+
+		The file is read in chunks rather than all at once.
+
+		.. versionadded:: 0.10.0
+
+		:param filename:
+		:param algorithm: The hash algorithm to use.
+
+		:raises ValueError: if the hash algorithm is not supported by :mod:`hashlib`.
+
+		:rtype: :class:`~.FileHash`
+		"""
+
+		return cls.from_hash(_hash_file(filename, algorithm)[0])
+
+
+def _hash_file(filename: PathLike, algorithm: str) -> Tuple["_Hash", int]:
+	"""
+	Hash the file ``filename`` in a single pass.
+
+	:param filename:
+	:param algorithm: The hash algorithm to use.
+
+	:returns: The hash object and the size of the file in bytes.
+	"""
+
+	with open(filename, "rb") as fp:
+		if sys.version_info >= (3, 11):  # pragma: no cover (<py311)
+			return hashlib.file_digest(fp, algorithm), fp.tell()
+		else:  # pragma: no cover (py311+)
+			the_hash = hashlib.new(algorithm)
+			buffer = bytearray(_CHUNK_SIZE)
+			view = memoryview(buffer)
+			size = 0
+
+			while True:
+				read = fp.readinto(buffer)
+				if not read:
+					break
+				the_hash.update(view[:read])
+				size += read
+
+			return the_hash, size
+
+
+@_cache("record.digests", maxsize=4096)
+def _decode_digest(value: str) -> bytes:
+	return urlsafe_b64decode(f"{value}==".encode("latin1"))
+
+
+class RecordTable(Sequence[RecordEntry]):
+	"""
+	A compact, column-oriented representation of the entries in a ``RECORD`` file.
+
+	Rather than one :class:`~.RecordEntry` object per file, the paths, hash algorithms,
+	raw digests and sizes are stored in parallel arrays.
+	:class:`~.RecordEntry` objects are only constructed when an item is requested,
+	so a :class:`~.RecordTable` uses a fraction of the memory of the equivalent list.
+
+	:param entries: The entries to populate the table with.
+	:param distro: The distribution the ``RECORD`` file belongs to.
+
+	.. versionadded:: 0.10.0
+	"""
+
+	__slots__ = (
+			"distro",
+			"_paths",
+			"_algorithms",
+			"_algorithm_ids",
+			"_digest_data",
+			"_digest_offsets",
+			"_sizes",
+			"_raw_values",
+			)
+
+	#: The distribution the file belongs to.
+	distro: Optional["Distribution"]
+
+	def __init__(
+			self,
+			entries: Iterable[RecordEntry] = (),
+			distro: Optional["Distribution"] = None,
+			):
+		self.distro = distro
+
+		self._paths: List[str] = []
+
+		# Hash algorithm names, indexed by the values in ``_algorithm_ids``. 0 means "no hash".
+		self._algorithms: List[str] = ['']
+		self._algorithm_ids = array('B')
+
+		# The digest of entry ``i`` is ``_digest_data[_digest_offsets[i]:_digest_offsets[i + 1]]``
+		self._digest_data = bytearray()
+		self._digest_offsets = array('Q', [0])
+
+		# -1 means "no size"
+		self._sizes = array('q')
+
+		# The hash values of entries whose digest couldn't be decoded, which are stored as-is.
+		self._raw_values: Dict[int, str] = {}
+
+		for entry in entries:
+			self._append(entry.as_posix(), entry.hash, entry.size)
+
+	@classmethod
+	def _from_rows(
+			cls: Type[_RT],
+			rows: Iterable[List[str]],
+			distro: Optional["Distribution"] = None,
+			) -> _RT:
+		"""
+		Construct a :class:`~.RecordTable` from rows of a ``RECORD`` file, as returned by :func:`csv.reader`.
+
+		:param rows:
+		:param distro: The distribution the ``RECORD`` file belongs to.
+		"""
+
+		table = cls(distro=distro)
+
+		for row in rows:
+			if not row:
+				# Blank line
+				continue
+
+			name, hash_, size_str, *_ = row
+			table._append(
+					name.strip(),
+					FileHash.from_string(hash_) if hash_ else None,
+					int(size_str) if size_str else None,
+					)
+
+		return table
+
+	def _append(
+			self,
+			path: str,
+			hash: Optional["FileHash"],  # noqa: A002  # pylint: disable=redefined-builtin
+			size: Optional[int],
+			) -> None:
+		if hash is None:
+			algorithm_id = 0
+			digest = b''
+		else:
+			try:
+				algorithm_id = self._algorithms.index(hash.name)
+			except ValueError:
+				algorithm_id = len(self._algorithms)
+				self._algorithms.append(hash.name)
+
+			try:
+				digest = hash.digest()
+			except ValueError:
+				# Malformed base64 (binascii.Error); keep the value so the rest of the table is still readable.
+				digest = b''
+				self._raw_values[len(self._paths)] = hash.value
+
+		self._paths.append(sys.intern(path))
+		self._algorithm_ids.append(algorithm_id)
+		self._digest_data += digest
+		self._digest_offsets.append(len(self._digest_data))
+		self._sizes.append(-1 if size is None else size)
+
+	def append(self, entry: RecordEntry) -> None:
+		"""
+		Add an entry to the end of the table.
+
+		:param entry:
+		"""
+
+		self._append(entry.as_posix(), entry.hash, entry.size)
+
+	def extend(self, entries: Iterable[RecordEntry]) -> None:
+		"""
+		Add several entries to the end of the table.
+
+		:param entries:
+		"""
+
+		for entry in entries:
+			self._append(entry.as_posix(), entry.hash, entry.size)
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of entries in the table.
+		"""
+
+		return len(self._paths)
+
+	def _entry(self, index: int) -> RecordEntry:
+		algorithm_id = self._algorithm_ids[index]
+
+		if algorithm_id:
+			value = self._raw_values.get(index)
+			if value is None:
+				digest = self._digest_data[self._digest_offsets[index]:self._digest_offsets[index + 1]]
+				value = urlsafe_b64encode(digest).decode("latin1").rstrip('=')
+			hash_: Optional[FileHash] = FileHash(self._algorithms[algorithm_id], value)
+		else:
+			hash_ = None
+
+		size = self._sizes[index]
+
+		return RecordEntry(
+				self._paths[index],
+				hash=hash_,
+				size=None if size == -1 else size,
+				distro=self.distro,
+				)
+
+	@overload
+	def __getitem__(self, index: int) -> RecordEntry: ...
+
+	@overload
+	def __getitem__(self, index: slice) -> List[RecordEntry]: ...
+
+	def __getitem__(self, index: Union[int, slice]) -> Union[RecordEntry, List[RecordEntry]]:
+		"""
+		Returns a :class:`~.RecordEntry` for the entry at ``index``, or a list of entries for a slice.
+
+		:param index:
+		"""
+
+		if isinstance(index, slice):
+			return [self._entry(i) for i in range(*index.indices(len(self)))]
+
+		if index < 0:
+			index += len(self)
+		if not 0 <= index < len(self):
+			raise IndexError("RecordTable index out of range")
+
+		return self._entry(index)
+
+	def __iter__(self) -> Iterator[RecordEntry]:
+		"""
+		Returns an iterator over :class:`~.RecordEntry` objects for the entries in the table.
+		"""
+
+		for index in range(len(self)):
+			yield self._entry(index)
+
+	def _iter_rows(self) -> Iterator[Tuple[str, str, str]]:
+		"""
+		Returns an iterator over the ``(path, hash, size)`` rows of the table,
+		formatted as they appear in a ``RECORD`` file.
+		"""  # noqa: D400
+
+		digest_data = self._digest_data
+		offsets = self._digest_offsets
+		raw_values = self._raw_values
+
+		for index, (path, algorithm_id, size) in enumerate(zip(self._paths, self._algorithm_ids, self._sizes)):
+			if algorithm_id:
+				if index in raw_values:
+					value = raw_values[index]
+				else:
+					value = urlsafe_b64encode(digest_data[offsets[index]:offsets[index + 1]]).decode("latin1").rstrip('=')
+				hash_ = f"{self._algorithms[algorithm_id]}={value}"
+			else:
+				hash_ = ''
+
+			yield path, hash_, '' if size == -1 else str(size)
+
+	def __repr__(self) -> str:
+		"""
+		Return a string representation of the :class:`~.RecordTable`.
+		"""
+
+		if self.distro is None:
+			return f"<{self.__class__.__name__}({len(self)} entries)>"
+		else:
+			return f"<{self.__class__.__name__}({len(self)} entries, distro={self.distro!r})>"
+
+
+def _parse_record_rows(
+		rows: Iterable[List[str]],
+		distro: Optional["Distribution"] = None,
+		) -> Iterator[RecordEntry]:
+	"""
+	Construct :class:`~.RecordEntry` objects from rows of a ``RECORD`` file, as returned by :func:`csv.reader`.
+
+	:param rows:
+	:param distro: The distribution the ``RECORD`` file belongs to.
+	"""
+
+	for row in rows:
+		if not row:
+			# Blank line
+			continue
+
+		name, hash_, size_str, *_ = row
+		yield RecordEntry(
+				name.strip(),
+				hash=FileHash.from_string(hash_) if hash_ else None,
+				size=int(size_str) if size_str else None,
+				distro=distro,
+				)
+
+
+def loads(rawtext: str) -> List[RecordEntry]:
+	"""
+	Parse a ``RECORD`` file from the given string.
+
+	.. versionadded:: 0.10.0
+
+	:param rawtext:
+
+	:returns: A :class:`~.RecordEntry` object for each line in the record.
+	"""
+
+	return list(_parse_record_rows(csv.reader(rawtext.splitlines())))
+
+
+def load(filename: PathLike) -> List[RecordEntry]:
+	"""
+	Parse a ``RECORD`` file from the given file.
+
+	.. versionadded:: 0.10.0
+
+	:param filename:
+
+	:returns: A :class:`~.RecordEntry` object for each line in the record.
+	"""
+
+	with open(filename, encoding="UTF-8", newline='') as fp:
+		return list(_parse_record_rows(csv.reader(fp)))
+
+
+def _write_rows(entries: Iterable[RecordEntry], fp: io.TextIOBase) -> None:
+	writer = csv.writer(fp, lineterminator='\n')
+
+	if isinstance(entries, RecordTable):
+		writer.writerows(entries._iter_rows())
+	else:
+		writer.writerows((
+				entry.as_posix(),
+				'' if entry.hash is None else entry.hash.to_string(),
+				'' if entry.size is None else entry.size,
+				) for entry in entries)
+
+
+def dumps(entries: Iterable[RecordEntry]) -> str:
+	"""
+	Construct a ``RECORD`` file from the given entries.
+
+	.. versionadded:: 0.10.0
+
+	:param entries: The entries in the record,
+		as a list of :class:`~.RecordEntry` objects or a :class:`~.RecordTable`.
+	"""
+
+	buffer = io.StringIO()
+	_write_rows(entries, buffer)
+	return buffer.getvalue()
+
+
+def dump(entries: Iterable[RecordEntry], filename: PathLike) -> int:
+	"""
+	Construct a ``RECORD`` file from the given entries, and write it to ``filename``.
+
+	.. versionadded:: 0.10.0
+
+	:param entries: The entries in the record,
+		as a list of :class:`~.RecordEntry` objects or a :class:`~.RecordTable`.
+	:param filename:
+
+	:returns: The number of characters written.
+	"""
+
+	with open(filename, 'w', encoding="UTF-8", newline='') as fp:
+		return fp.write(dumps(entries))
+
+
+# Files in the ``*.dist-info`` directory which cannot contain their own hash.
+_UNHASHED_FILES = frozenset({"RECORD", "RECORD.jws", "RECORD.p7s"})
+
+
+def build(
+		root_dir: PathLike,
+		*,
+		algorithm: str = "sha256",
+		workers: int = 1,
+		) -> List[RecordEntry]:
+	"""
+	Construct the entries of a ``RECORD`` file for the files in ``root_dir``.
+
+	``root_dir`` is typically the root of a wheel before it is archived.
+	The ``RECORD`` file (and its signature files, if present) in each top-level ``*.dist-info`` directory
+	is listed without a hash or size, as required by :pep:`376`,
+	and an entry is added for ``RECORD`` if the file does not yet exist.
+
+	.. versionadded:: 0.10.0
+
+	:param root_dir:
+	:param algorithm: The hash algorithm to use.
+	:param workers: The number of threads to hash files with.
+		:mod:`hashlib` releases the :term:`GIL` while hashing, so files are hashed in parallel.
+
+	:raises ValueError: if the hash algorithm is not supported by :mod:`hashlib`.
+
+	:returns: The entries, sorted by path.
+	"""
+
+	root_dir = PathPlus(root_dir)
+	paths: List[str] = []
+	unhashed: List[str] = []
+
+	for dirpath, dirnames, filenames in os.walk(root_dir):
+		dirnames.sort()
+		reldir = os.path.relpath(dirpath, root_dir)
+
+		for filename in sorted(filenames):
+			path = posixpath.normpath(pathlib.Path(reldir, filename).as_posix())
+
+			if filename in _UNHASHED_FILES and reldir.endswith(".dist-info") and os.sep not in reldir:
+				unhashed.append(path)
+			else:
+				paths.append(path)
+
+	for dist_info in sorted(d.name for d in root_dir.iterdir() if d.name.endswith(".dist-info") and d.is_dir()):
+		record_file = f"{dist_info}/RECORD"
+		if record_file not in unhashed:
+			unhashed.append(record_file)
+
+	filenames = [os.path.join(root_dir, path) for path in paths]
+	algorithms = [algorithm] * len(paths)
+
+	if workers > 1:
+		with ThreadPoolExecutor(max_workers=workers) as pool:
+			results = list(pool.map(_hash_file, filenames, algorithms))
+	else:
+		results = list(map(_hash_file, filenames, algorithms))
+
+	entries = [
+			RecordEntry(path, hash=FileHash.from_hash(the_hash), size=size)
+			for path, (the_hash, size) in zip(paths, results)
+			]
+	entries.extend(RecordEntry(path) for path in unhashed)
+	entries.sort(key=lambda entry: entry.as_posix())
+
+	return entries
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+#
+#  remote.py
+"""
+Read metadata from wheels without downloading them in full.
+"""
+#
+#  Copyright © 2021 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#  EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+#  MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+#  IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+#  DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+#  OR OTHER DEALINGS IN THE SOFTWARE.
+#
+
+# stdlib
+import io
+import posixpath
+import urllib.parse
+import urllib.request
+from typing import Callable, Dict, List, Mapping, Optional
+
+# this package
+from dist_meta.distributions import WheelDistribution
+
+__all__ = ("HTTPRangeReader", "RangeReader", "wheel_from_url")
+
+
+class RangeReader(io.RawIOBase):
+	"""
+	A read-only, seekable file-like object which fetches byte ranges on demand.
+
+	Data is fetched in blocks of ``block_size`` bytes, which are cached,
+	so the many small reads :mod:`zipfile` makes of a wheel's central directory and
+	local headers result in only a few calls to ``fetch``.
+	Adjacent missing blocks are fetched together.
+
+	:param fetch: A function which takes a start offset and a length, and returns that many bytes.
+	:param size: The total size of the file, in bytes.
+	:param block_size: The size of the blocks data is fetched in.
+
+	.. versionadded:: 0.10.0
+	"""
+
+	def __init__(self, fetch: Callable[[int, int], bytes], size: int, block_size: int = 64 * 1024):
+		super().__init__()
+		self._fetch = fetch
+		self._size = size
+		self._block_size = block_size
+		self._blocks: Dict[int, bytes] = {}
+		self._pos = 0
+
+	@property
+	def size(self) -> int:
+		"""
+		The total size of the file, in bytes.
+		"""
+
+		return self._size
+
+	def readable(self) -> bool:  # noqa: D102
+		return True
+
+	def seekable(self) -> bool:  # noqa: D102
+		return True
+
+	def tell(self) -> int:  # noqa: D102
+		self._checkClosed()  # type: ignore[attr-defined]
+		return self._pos
+
+	def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:  # noqa: D102
+		self._checkClosed()  # type: ignore[attr-defined]
+
+		if whence == io.SEEK_SET:
+			pos = offset
+		elif whence == io.SEEK_CUR:
+			pos = self._pos + offset
+		elif whence == io.SEEK_END:
+			pos = self._size + offset
+		else:
+			raise ValueError(f"Invalid whence ({whence!r})")
+
+		if pos < 0:
+			raise ValueError(f"Negative seek position {pos}")
+
+		self._pos = pos
+		return pos
+
+	def readinto(self, buffer) -> int:  # type: ignore[override]  # noqa: MAN001,D102
+		self._checkClosed()  # type: ignore[attr-defined]
+
+		length = min(len(buffer), self._size - self._pos)
+		if length <= 0:
+			return 0
+
+		buffer[:length] = self._read_range(self._pos, length)
+		self._pos += length
+		return length
+
+	def _read_range(self, start: int, length: int) -> bytes:
+		block_size = self._block_size
+		first_block = start // block_size
+		last_block = (start + length - 1) // block_size
+
+		missing: List[int] = [idx for idx in range(first_block, last_block + 1) if idx not in self._blocks]
+
+		while missing:
+			# Fetch each run of consecutive missing blocks with a single request.
+			run_length = 1
+			while run_length < len(missing) and missing[run_length] == missing[0] + run_length:
+				run_length += 1
+
+			run_start = missing[0] * block_size
+			run_end = min((missing[0] + run_length) * block_size, self._size)
+			data = self._fetch(run_start, run_end - run_start)
+
+			if len(data) != run_end - run_start:
+				raise OSError(f"Expected {run_end - run_start} bytes from offset {run_start}, got {len(data)}")
+
+			for offset in range(0, len(data), block_size):
+				self._blocks[missing[0] + offset // block_size] = data[offset:offset + block_size]
+
+			del missing[:run_length]
+
+		data = b''.join(self._blocks[idx] for idx in range(first_block, last_block + 1))
+		offset = start - first_block * block_size
+		return data[offset:offset + length]
+
+
+class HTTPRangeReader(RangeReader):
+	"""
+	A :class:`~.RangeReader` which fetches data from a URL using HTTP range requests.
+
+	:param url:
+	:param headers: Additional headers to send with each request, such as for authentication.
+	:param block_size: The size of the blocks data is fetched in.
+	:param timeout: The timeout for each request, in seconds.
+
+	:raises OSError: If the size of the file cannot be determined,
+		or the server does not support range requests.
+
+	.. versionadded:: 0.10.0
+	"""
+
+	def __init__(
+			self,
+			url: str,
+			headers: Optional[Mapping[str, str]] = None,
+			block_size: int = 64 * 1024,
+			timeout: Optional[float] = None,
+			):
+		self.url = url
+		self._headers = dict(headers or {})
+		self._timeout = timeout
+
+		request = urllib.request.Request(url, headers=self._headers, method="HEAD")
+		with urllib.request.urlopen(request, timeout=timeout) as response:  # nosec: B310
+			content_length = response.headers.get("Content-Length")
+
+		if content_length is None:
+			raise OSError(f"Unable to determine the size of {url!r}")
+
+		super().__init__(self._fetch_range, int(content_length), block_size)
+
+	def _fetch_range(self, start: int, length: int) -> bytes:
+		headers = {**self._headers, "Range": f"bytes={start}-{start + length - 1}"}
+		request = urllib.request.Request(self.url, headers=headers)
+
+		with urllib.request.urlopen(request, timeout=self._timeout) as response:  # nosec: B310
+			if response.status != 206:
+				raise OSError(f"The server does not support range requests for {self.url!r}")
+			return response.read()
+
+
+def wheel_from_url(
+		url: str,
+		*,
+		headers: Optional[Mapping[str, str]] = None,
+		metadata_only: bool = True,
+		) -> WheelDistribution:
+	"""
+	Open a wheel from a URL, downloading only the parts of the file which are needed.
+
+	The filename of the wheel is taken from the URL.
+
+	:param url:
+	:param headers: Additional headers to send with each request, such as for authentication.
+	:param metadata_only: Only read the zip file's central directory entries for the ``*.dist-info`` directory.
+		See :meth:`WheelDistribution.from_path() <.WheelDistribution.from_path>`.
+
+	.. versionadded:: 0.10.0
+	"""
+
+	filename = posixpath.basename(urllib.parse.unquote(urllib.parse.urlsplit(url).path))
+	return WheelDistribution.from_file(HTTPRangeReader(url, headers=headers), filename, metadata_only=metadata_only)
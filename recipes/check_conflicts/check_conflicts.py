@@ -90,7 +90,7 @@ def create_package_set_from_installed(path) -> Tuple[PackageSet, bool]:
 
 		try:
 			# TODO: extras?
-			raw_dependencies = dist.get_metadata().get_all("Requires-Dist", default=())
+			raw_dependencies = dist.get_metadata(headers_only=True).get_all("Requires-Dist", default=())
 			package_set[name] = PackageDetails(
 					version=dist.version,
 					dependencies=list(map(Requirement, raw_dependencies)),
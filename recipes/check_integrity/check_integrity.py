@@ -4,18 +4,24 @@ Check files match the checksums given in RECORD.
 
 # stdlib
 import sys
-import time
-from typing import Optional, Tuple
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Optional, Sequence, Tuple, Union
 
 # 3rd party
 import click
-from shippinglabel.checksum import get_sha256_hash
 
 # this package
 import dist_meta
+from dist_meta.integrity import VerificationCache, VerificationReport, verify_distributions
 
 
-def check_distribution(dist_name: str, path: Optional[Tuple[str, ...]] = None) -> int:
+def check_distribution(
+		dist_name: str,
+		path: Optional[Union[Tuple[str, ...], dist_meta.distributions.DistributionIndex]] = None,
+		executor: Optional[Executor] = None,
+		mode: str = "hash",
+		cache: Optional[VerificationCache] = None,
+		) -> int:
 	"""
 	Verify the integrity of the distribution named ``dist_name``.
 
@@ -23,74 +29,161 @@ def check_distribution(dist_name: str, path: Optional[Tuple[str, ...]] = None) -
 
 	:param dist_name:
 	:param path: A list of Python directories to find the distribution in. Akin to :py:obj:`sys.path`.
+		Alternatively, a :class:`~dist_meta.distributions.DistributionIndex` to look the distribution up in.
+	:param executor: The :class:`concurrent.futures.Executor` to hash files with.
+	:param mode: One of ``'hash'``, ``'size'`` or ``'size-then-hash'``.
+	:param cache: A cache of hashes from previous runs, used to skip hashing unchanged files.
 
 	:return: ``0`` if the distribution verifies successfully,
 		``1`` if it fails or files are missing.
 	"""
 
-	try:
-		dist = dist_meta.distributions.get_distribution(dist_name, path)
-	except dist_meta.distributions.DistributionNotFoundError:
-		print(f"No distribution named {dist_name!r}.")
-		return 1
-
-	record = dist.get_record()
-	if record is None:
-		# Missing file
-		print(f"Unable to verify integrity of {dist_name!r}: RECORD file not found.")
-		return 1
-
-	print(f"Verifying integrity of distribution {dist_name!r}", end='', flush=True)
-	has_errored = False
-
-	dist_basepath = dist.path
-	for entry in record:
-		time.sleep(.01)
-
-		# The absolute path to the file given in the RECORD entry.
-		the_filename = (dist_basepath.parent / entry).abspath()
-
-		if entry.hash:
-			# Not all files have a hash in RECORD
-			expected_hash = entry.hash.hexdigest()
-			actual_hash = get_sha256_hash(the_filename).hexdigest()
-
-			if expected_hash != actual_hash:
-				if not has_errored:
-					print()
-					has_errored = True
-
-				print(f"Hash mismatch: {entry}")
-				print(f"    Expected {expected_hash!r}")
-				print(f"    Got      {actual_hash!r}")
-
-	if has_errored:
-		print()
-		return 1
-	else:
+	return check_distributions([dist_name], path, executor, mode, cache)
+
+
+def check_distributions(
+		dist_names: Sequence[str],
+		path: Optional[Union[Tuple[str, ...], dist_meta.distributions.DistributionIndex]] = None,
+		executor: Optional[Executor] = None,
+		mode: str = "hash",
+		cache: Optional[VerificationCache] = None,
+		) -> int:
+	"""
+	Verify the integrity of the distributions named in ``dist_names``.
+
+	The files of every distribution are hashed in parallel with ``executor``,
+	and the results are printed in the order of ``dist_names``.
+
+	:param dist_names:
+	:param path: A list of Python directories to find the distributions in. Akin to :py:obj:`sys.path`.
+		Alternatively, a :class:`~dist_meta.distributions.DistributionIndex` to look the distributions up in.
+	:param executor: The :class:`concurrent.futures.Executor` to hash files with.
+	:param mode: One of ``'hash'``, ``'size'`` or ``'size-then-hash'``.
+	:param cache: A cache of hashes from previous runs, used to skip hashing unchanged files.
+
+	:return: ``0`` if all distributions verify successfully,
+		``1`` if any fail, are missing files, or cannot be found.
+	"""
+
+	# Either the distribution to verify, or the reason it can't be verified.
+	targets: List[Union[dist_meta.distributions.Distribution, str]] = []
+
+	for dist_name in dist_names:
+		try:
+			dist = dist_meta.distributions.get_distribution(dist_name, path)
+		except dist_meta.distributions.DistributionNotFoundError:
+			targets.append(f"No distribution named {dist_name!r}.")
+			continue
+
+		if not dist.has_file("RECORD"):
+			# Missing file
+			targets.append(f"Unable to verify integrity of {dist_name!r}: RECORD file not found.")
+		else:
+			targets.append(dist)
+
+	reports = verify_distributions(
+			[target for target in targets if not isinstance(target, str)],
+			executor=executor,
+			mode=mode,
+			cache=cache,
+			)
+
+	ret = 0
+
+	for dist_name, target in zip(dist_names, targets):
+		if isinstance(target, str):
+			print(target)
+			ret = 1
+			continue
+
+		print(f"Verifying integrity of distribution {dist_name!r}", end='', flush=True)
+		ret |= _print_report(next(reports))
+
+	return ret
+
+
+def _print_report(report: VerificationReport) -> int:
+	if report.ok:
 		print(" ✔️")
 		return 0
 
-
+	print()
+
+	for missing in report.missing:
+		print(f"Missing file: {missing.entry}")
+
+	for error in report.errors:
+		print(f"Unable to check file: {error.entry}")
+		print(f"    {error.error}")
+
+	for size_mismatch in report.size_mismatches:
+		print(f"Size mismatch: {size_mismatch.entry}")
+		print(f"    Expected {size_mismatch.expected} bytes")
+		print(f"    Got      {size_mismatch.actual} bytes")
+
+	for hash_mismatch in report.hash_mismatches:
+		print(f"Hash mismatch: {hash_mismatch.entry}")
+		print(f"    Expected {hash_mismatch.expected.hexdigest()!r}")
+		print(f"    Got      {hash_mismatch.actual.hexdigest()!r}")
+
+	print()
+	return 1
+
+
+@click.option(
+		"-c",
+		"--cache",
+		"cache_file",
+		type=click.STRING,
+		default=None,
+		help="A file to cache hashes in between runs. Unchanged files are not hashed again.",
+		)
+@click.option(
+		"-m",
+		"--mode",
+		type=click.Choice(["hash", "size", "size-then-hash"]),
+		default="hash",
+		help="Whether to hash files, only compare their sizes, or skip hashing files whose size is wrong.",
+		)
+@click.option("--processes", is_flag=True, default=False, help="Hash files in multiple processes, rather than threads.")
+@click.option("-j", "--jobs", type=click.INT, default=None, help="The number of files to hash in parallel.")
+@click.option("-a", "--all", "all_", is_flag=True, default=False, help="Verify every installed distribution.")
 @click.option("-p", "--path", required=False, multiple=True)
 @click.argument("name", nargs=-1, type=str)
 @click.command()
-def main(name: Tuple[str], path: Tuple[str, ...]):
+def main(
+		name: Tuple[str],
+		path: Tuple[str, ...],
+		all_: bool,
+		jobs: Optional[int],
+		processes: bool,
+		mode: str,
+		cache_file: Optional[str],
+		):
 	# Exit codes:
 	# 	0 if all distributions verify successfully,
 	# 	1 if any fail or are missing files
 	# 	2 if no arguments are passed
 
-	if not name:
+	if not name and not all_:
 		sys.exit(2)
 
 	if not path:
 		path = None
 
-	ret = 0
+	index = dist_meta.distributions.DistributionIndex(path)
+
+	if all_:
+		name = tuple(dist.name for dist in index.values())
+
+	executor_cls = ProcessPoolExecutor if processes else ThreadPoolExecutor
+	cache = VerificationCache(cache_file) if cache_file else None
+
+	with executor_cls(max_workers=jobs) as executor:
+		ret = check_distributions(name, index, executor, mode, cache)
 
-	for dist_name in name:
-		ret |= check_distribution(dist_name, path)
+	if cache is not None:
+		cache.save()
 
 	sys.exit(ret)
 
@@ -40,7 +40,7 @@ def main(
 	dist = dist_meta.distributions.get_distribution(name)
 
 	buf = StringList([f"{dist.name}=={dist.version}"])
-	raw_requirements = sorted(dist.get_metadata().get_all("Requires-Dist"))
+	raw_requirements = sorted(dist.get_metadata(headers_only=True).get_all("Requires-Dist"))
 	tree: List[Union[str, List[str], List[Union[str, List]]]] = []
 
 	if concise:
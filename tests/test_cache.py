@@ -0,0 +1,112 @@
+# stdlib
+import functools
+
+# 3rd party
+import pytest
+
+# this package
+from dist_meta import _utils, cache, distributions, entry_points
+
+requires_cache = pytest.mark.skipif(not cache.enabled, reason="Caching is disabled with DIST_META_CACHE=0")
+
+
+def test_list_caches():
+	assert cache.list_caches() == [
+			"canonicalize_name",
+			"entry_points.index",
+			"entry_points.loads",
+			"entry_points.values",
+			"parse_version",
+			"parse_wheel_filename",
+			"record.digests",
+			]
+
+
+@requires_cache
+def test_cache_info():
+	cache.clear("canonicalize_name")
+	assert cache.cache_info("canonicalize_name") == (0, 0, None, 0)
+
+	assert _utils._canonicalize("Foo_Bar") == "foo-bar"
+	assert _utils._canonicalize("Foo_Bar") == "foo-bar"
+	assert _utils._canonicalize("Baz") == "baz"
+
+	info = cache.cache_info("canonicalize_name")
+	assert isinstance(info, cache.CacheInfo)
+	assert info == cache.CacheInfo(hits=1, misses=2, maxsize=None, currsize=2)
+
+	all_info = cache.all_cache_info()
+	assert list(all_info) == cache.list_caches()
+	assert all_info["canonicalize_name"] == info
+
+	cache.clear("canonicalize_name")
+	assert cache.cache_info("canonicalize_name") == (0, 0, None, 0)
+
+
+def test_clear_all():
+	entry_points.loads("[group]\nname = module:attr\n")
+	_utils._canonicalize("Foo_Bar")
+
+	cache.clear()
+
+	for info in cache.all_cache_info().values():
+		assert info.currsize == 0
+
+
+@requires_cache
+def test_resize():
+	try:
+		original = _utils._canonicalize
+		cache.resize("canonicalize_name", 2)
+
+		# The new cache replaces the old one wherever it was imported.
+		assert _utils._canonicalize is not original
+		assert distributions._canonicalize is _utils._canonicalize
+		assert isinstance(_utils._canonicalize, functools._lru_cache_wrapper)
+
+		for name in ("a", "b", "c", "d"):
+			_utils._canonicalize(name)
+
+		assert cache.cache_info("canonicalize_name") == (0, 4, 2, 2)
+
+		cache.resize("entry_points.loads", 3)
+		for idx in range(5):
+			entry_points.loads(f"[group]\nname = module:attr{idx}\n")
+		assert cache.cache_info("entry_points.loads").currsize == 3
+
+		# Resizing the content cache keeps the most recent entries
+		cache.resize("entry_points.loads", 1)
+		info = cache.cache_info("entry_points.loads")
+		assert (info.maxsize, info.currsize) == (1, 1)
+		entry_points.loads("[group]\nname = module:attr4\n")
+		assert cache.cache_info("entry_points.loads").hits == info.hits + 1
+
+	finally:
+		cache.resize("canonicalize_name", None)
+		cache.resize("entry_points.loads", 256)
+
+
+def test_unknown_cache():
+	with pytest.raises(ValueError, match="Unknown cache 'foo'"):
+		cache.cache_info("foo")
+
+	with pytest.raises(ValueError, match="Unknown cache 'foo'"):
+		cache.clear("foo")
+
+	with pytest.raises(ValueError, match="Unknown cache 'foo'"):
+		cache.resize("foo", 10)
+
+
+def test_resize_negative():
+	with pytest.raises(ValueError, match="'maxsize' must be a non-negative integer or None, not -1"):
+		cache.resize("canonicalize_name", -1)
+
+
+@pytest.mark.skipif(cache.enabled, reason="Caching is enabled")
+def test_disabled():
+	_utils._canonicalize("Foo_Bar")
+	cache.resize("canonicalize_name", 10)
+	cache.clear("canonicalize_name")
+
+	for info in cache.all_cache_info().values():
+		assert info == cache.CacheInfo(hits=0, misses=0, maxsize=0, currsize=0)
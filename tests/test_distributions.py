@@ -1,11 +1,13 @@
 # stdlib
+import gc
 import os
 import platform
 import shutil
 import sys
+import weakref
 import zipfile
 from operator import itemgetter
-from typing import List, Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 
 # 3rd party
 import handy_archives
@@ -27,6 +29,11 @@ from dist_meta import _utils, distributions
 
 _wheels_glob = (PathPlus(__file__).parent / "wheels").glob("*.whl")
 
+_requires_end_offset = pytest.mark.skipif(
+		not hasattr(zipfile.ZipInfo, "_end_offset"),
+		reason="ZipInfo._end_offset requires Python 3.12+",
+		)
+
 
 @pytest.fixture(params=(param(w, key=lambda t: t[0].name) for w in _wheels_glob))
 def example_wheel(tmp_pathplus: PathPlus, request) -> PathPlus:
@@ -92,6 +99,20 @@ class TestDistribution:
 		(filename / "RECORD").unlink()
 		assert distro.get_record() is None
 
+	def test_get_metadata_headers_only(self, example_wheel: PathPlus, tmp_pathplus: PathPlus):
+		(tmp_pathplus / "site-packages").mkdir()
+		handy_archives.unpack_archive(example_wheel, tmp_pathplus / "site-packages")
+
+		filename: Optional[PathPlus] = first((tmp_pathplus / "site-packages").glob("*.dist-info"))
+		assert filename is not None
+
+		distro = distributions.Distribution.from_path(filename)
+		full = distro.get_metadata()
+		headers = distro.get_metadata(headers_only=True)
+
+		assert "Description" not in headers
+		assert headers.items() == [(k, v) for k, v in full.items() if k.lower() != "description"]
+
 	def test_from_path_pip_tmpdir(self):
 		msg = r"Directory path starts with a tilde \(~\). This may be a temporary directory created by pip."
 
@@ -125,6 +146,46 @@ class TestDistribution:
 			assert file.distro is distro
 			file.read_bytes()  # will fail if can't read
 
+	def test_iter_record(self, example_wheel: PathPlus, tmp_pathplus: PathPlus):
+		(tmp_pathplus / "site-packages").mkdir()
+		handy_archives.unpack_archive(example_wheel, tmp_pathplus / "site-packages")
+
+		filename: Optional[PathPlus] = first((tmp_pathplus / "site-packages").glob("*.dist-info"))
+		assert filename is not None
+
+		distro = distributions.Distribution.from_path(filename)
+		iterator = distro.iter_record()
+		first_entry = next(iterator)
+		assert first_entry.distro is distro
+
+		record = distro.get_record()
+		assert record is not None
+		assert [first_entry, *iterator] == record
+		assert [e.hash for e in distro.iter_record()] == [e.hash for e in record]
+		assert [e.size for e in distro.iter_record()] == [e.size for e in record]
+
+		(filename / "RECORD").unlink()
+
+		with pytest.raises(FileNotFoundError):
+			next(distro.iter_record())
+
+	def test_get_record_table(self, example_wheel: PathPlus, tmp_pathplus: PathPlus):
+		(tmp_pathplus / "site-packages").mkdir()
+		handy_archives.unpack_archive(example_wheel, tmp_pathplus / "site-packages")
+
+		filename: Optional[PathPlus] = first((tmp_pathplus / "site-packages").glob("*.dist-info"))
+		assert filename is not None
+
+		distro = distributions.Distribution.from_path(filename)
+		table = distro.get_record_table()
+		assert table is not None
+		assert table.distro is distro
+		assert list(table) == distro.get_record()
+		assert table[0].distro is distro
+
+		(filename / "RECORD").unlink()
+		assert distro.get_record_table() is None
+
 
 class TestWheelDistribution:
 	cls = distributions.WheelDistribution
@@ -154,6 +215,14 @@ class TestWheelDistribution:
 		assert isinstance(wd.wheel_zip, zipfile.ZipFile)
 		assert isinstance(wd.wheel_zip, handy_archives.ZipFile)
 
+	def test_get_metadata_headers_only(self, example_wheel: PathPlus):
+		distro = self.cls.from_path(example_wheel)
+		full = distro.get_metadata()
+		headers = distro.get_metadata(headers_only=True)
+
+		assert "Description" not in headers
+		assert headers.items() == [(k, v) for k, v in full.items() if k.lower() != "description"]
+
 	def test_get_record(self, example_wheel: PathPlus):
 
 		distro = self.cls.from_path(example_wheel)
@@ -177,6 +246,146 @@ class TestWheelDistribution:
 			with pytest.raises(ValueError, match="Cannot read files with 'self.distro = None'"):
 				file.read_bytes()
 
+	def test_iter_record(self, example_wheel: PathPlus):
+		distro = self.cls.from_path(example_wheel)
+
+		record = distro.get_record()
+		assert list(distro.iter_record()) == record
+		assert [e.hash for e in distro.iter_record()] == [e.hash for e in record]
+		assert [e.size for e in distro.iter_record()] == [e.size for e in record]
+
+	def test_get_record_table(self, example_wheel: PathPlus):
+		distro = self.cls.from_path(example_wheel)
+
+		record = distro.get_record()
+		table = distro.get_record_table()
+		assert len(table) == len(record)
+		assert list(table) == record
+		assert [e.hash for e in table] == [e.hash for e in record]
+		assert [e.size for e in table] == [e.size for e in record]
+
+	def test_iter_record_missing(self, tmp_pathplus: PathPlus):
+		with in_directory(tmp_pathplus):
+			with handy_archives.ZipFile("foo-1.2.3-py3-none-any.whl", 'w') as fake_wheel:
+				fake_wheel.writestr("foo-1.2.3.dist-info/WHEEL", '')
+
+		distro = self.cls.from_path(tmp_pathplus / "foo-1.2.3-py3-none-any.whl")
+
+		with pytest.raises(FileNotFoundError, match="^foo-1.2.3.dist-info/RECORD$"):
+			next(distro.iter_record())
+
+	def test_has_file_uses_index(self, tmp_pathplus: PathPlus, monkeypatch):
+		with in_directory(tmp_pathplus):
+			with handy_archives.ZipFile("foo-1.2.3-py3-none-any.whl", 'w') as fake_wheel:
+				fake_wheel.writestr("foo/__init__.py", '')
+				fake_wheel.writestr("Foo-1.2.3.0.dist-info/WHEEL", "Wheel-Version: 1.0\n")
+
+		distro = self.cls.from_path(tmp_pathplus / "foo-1.2.3-py3-none-any.whl")
+
+		def namelist():
+			raise AssertionError("namelist() should not be called")
+
+		monkeypatch.setattr(distro.wheel_zip, "namelist", namelist)
+
+		assert distro.has_file("WHEEL")
+		assert not distro.has_file("RECORD")
+		assert distro.read_file("WHEEL") == "Wheel-Version: 1.0\n"
+
+	def test_dist_info_path_not_pinned(self, tmp_pathplus: PathPlus):
+		with in_directory(tmp_pathplus):
+			with handy_archives.ZipFile("foo-1.2.3-py3-none-any.whl", 'w') as fake_wheel:
+				fake_wheel.writestr("Foo-1.2.3.0.dist-info/WHEEL", "Wheel-Version: 1.0\n")
+
+		distro = self.cls.from_path(tmp_pathplus / "foo-1.2.3-py3-none-any.whl")
+		assert distro.has_file("WHEEL")
+		assert distro.read_file("WHEEL") == "Wheel-Version: 1.0\n"
+
+		zip_ref = weakref.ref(distro.wheel_zip)
+		distro.wheel_zip.close()
+		del distro
+		gc.collect()
+		assert zip_ref() is None
+
+	def test_dist_info_path_released_on_exit(self, tmp_pathplus: PathPlus):
+		with in_directory(tmp_pathplus):
+			with handy_archives.ZipFile("foo-1.2.3-py3-none-any.whl", 'w') as fake_wheel:
+				fake_wheel.writestr("Foo-1.2.3.0.dist-info/WHEEL", "Wheel-Version: 1.0\n")
+
+		with self.cls.from_path(tmp_pathplus / "foo-1.2.3-py3-none-any.whl") as distro:
+			assert distro.has_file("WHEEL")
+			assert distro.__dict__["_dist_info_path"] == "Foo-1.2.3.0.dist-info"
+
+		assert "_dist_info_path" not in distro.__dict__
+
+	@pytest.mark.parametrize(
+			"filename",
+			[
+					"domdf_python_tools-2.9.1-py3-none-any.whl",
+					"Babel-2.9.1-py2.py3-none-any.whl",
+					"toml-0.10.2-py2.py3-none-any.whl",
+					],
+			)
+	def test_from_path_metadata_only(self, wheel_directory: PathPlus, filename: str):
+		full = self.cls.from_path(wheel_directory / filename)
+		partial = self.cls.from_path(wheel_directory / filename, metadata_only=True)
+
+		with full, partial:
+			assert isinstance(partial.wheel_zip, handy_archives.ZipFile)
+			assert partial.get_metadata() == full.get_metadata()
+			assert partial.get_wheel() == full.get_wheel()
+			assert partial.get_record() == full.get_record()
+			assert partial.has_file("WHEEL")
+			assert not partial.has_file("foo.txt")
+
+			dist_info_members = [
+					name for name in full.wheel_zip.namelist() if name.split('/', 1)[0].endswith(".dist-info")
+					]
+			assert partial.wheel_zip.namelist() == dist_info_members
+			assert len(partial.wheel_zip.namelist()) < len(full.wheel_zip.namelist())
+
+	@_requires_end_offset
+	def test_from_path_metadata_only_end_offset(self, wheel_directory: PathPlus):
+		filename = wheel_directory / "domdf_python_tools-2.9.1-py3-none-any.whl"
+
+		with zipfile.ZipFile(filename) as full, self.cls.from_path(filename, metadata_only=True) as partial:
+			for zinfo in partial.wheel_zip.infolist():
+				assert zinfo._end_offset == full.getinfo(zinfo.filename)._end_offset  # type: ignore[attr-defined]
+
+	@_requires_end_offset
+	def test_from_path_metadata_only_overlapping(self, tmp_pathplus: PathPlus):
+		with in_directory(tmp_pathplus):
+			with handy_archives.ZipFile("foo-1.2.3-py3-none-any.whl", 'w') as fake_wheel:
+				fake_wheel.writestr("foo/__init__.py", '')
+				fake_wheel.writestr("foo-1.2.3.dist-info/WHEEL", "Wheel-Version: 1.0\n")
+
+		with self.cls.from_path(tmp_pathplus / "foo-1.2.3-py3-none-any.whl", metadata_only=True) as wd:
+			wheel_zip = wd.wheel_zip
+			zinfo = wheel_zip.getinfo("foo-1.2.3.dist-info/WHEEL")
+
+			wheel_zip._set_end_offsets([0, zinfo.header_offset])
+			assert zinfo._end_offset == wheel_zip.start_dir
+
+			# Another member claims the same local header
+			wheel_zip._set_end_offsets([0, zinfo.header_offset, zinfo.header_offset])
+			assert zinfo._end_offset == zinfo.header_offset
+
+	def test_from_path_metadata_only_zip64(self, tmp_pathplus: PathPlus):
+		with in_directory(tmp_pathplus):
+			with handy_archives.ZipFile("foo-1.2.3-py3-none-any.whl", 'w', allowZip64=True) as fake_wheel:
+				for idx in range(70_000):
+					fake_wheel.writestr(f"foo/{idx}.py", '')
+				fake_wheel.writestr("foo-1.2.3.dist-info/WHEEL", "Wheel-Version: 1.0\n")
+
+		with self.cls.from_path(tmp_pathplus / "foo-1.2.3-py3-none-any.whl", metadata_only=True) as wd:
+			assert wd.wheel_zip.namelist() == ["foo-1.2.3.dist-info/WHEEL"]
+			assert wd.read_file("WHEEL") == "Wheel-Version: 1.0\n"
+
+	def test_from_path_metadata_only_not_zip(self, tmp_pathplus: PathPlus):
+		(tmp_pathplus / "foo-1.2.3-py3-none-any.whl").write_bytes(b"Not a zip file")
+
+		with pytest.raises(zipfile.BadZipFile, match="File is not a zip file"):
+			self.cls.from_path(tmp_pathplus / "foo-1.2.3-py3-none-any.whl", metadata_only=True)
+
 	def test_wheel_distribution_zip(
 			self,
 			wheel_directory: PathPlus,
@@ -454,6 +663,96 @@ def test_iter_distributions_pip_tmpdir(
 	advanced_data_regression.check(sorted(all_dists, key=itemgetter("name")))
 
 
+def _age_directories(directories: List[PathPlus], timestamp: int = 1_000_000_000) -> None:
+	# Directories modified in the last few seconds are never persisted in the index.
+	for directory in directories:
+		if directory.is_dir():
+			os.utime(directory, ns=(timestamp, timestamp))
+
+
+def test_iter_distributions_index_file(fake_virtualenv: List[PathPlus], tmp_pathplus: PathPlus):
+	index_file = tmp_pathplus / "dist-index.json"
+	_age_directories(fake_virtualenv)
+
+	cold = list(distributions.iter_distributions(path=fake_virtualenv))
+	assert list(distributions.iter_distributions(path=fake_virtualenv, index_file=index_file)) == cold
+	assert index_file.is_file()
+
+	index_data = index_file.load_json()
+	assert os.fspath(fake_virtualenv[0]) in index_data["directories"]
+	assert os.fspath(fake_virtualenv[2]) not in index_data["directories"]
+
+	# Served from the index
+	assert list(distributions.iter_distributions(path=fake_virtualenv, index_file=index_file)) == cold
+	assert distributions.get_distribution(
+			"domdf-python-tools",
+			path=fake_virtualenv,
+			index_file=index_file,
+			).version == Version("2.2.0")
+
+
+def test_iter_distributions_index_file_invalidated(fake_virtualenv: List[PathPlus], tmp_pathplus: PathPlus):
+	index_file = tmp_pathplus / "dist-index.json"
+	site_packages = fake_virtualenv[0]
+	_age_directories(fake_virtualenv)
+
+	names = {d.name for d in distributions.iter_distributions(path=fake_virtualenv, index_file=index_file)}
+	assert "alabaster" in names
+
+	shutil.rmtree(site_packages / "alabaster-0.7.12.dist-info")
+	_age_directories(fake_virtualenv, timestamp=2_000_000_000)
+
+	names = {d.name for d in distributions.iter_distributions(path=fake_virtualenv, index_file=index_file)}
+	assert "alabaster" not in names
+	assert list(distributions.iter_distributions(path=fake_virtualenv, index_file=index_file)) == list(
+			distributions.iter_distributions(path=fake_virtualenv)
+			)
+
+
+def test_iter_distributions_index_file_corrupt(fake_virtualenv: List[PathPlus], tmp_pathplus: PathPlus):
+	index_file = tmp_pathplus / "dist-index.json"
+	index_file.write_text("{not json")
+
+	cold = list(distributions.iter_distributions(path=fake_virtualenv))
+	assert list(distributions.iter_distributions(path=fake_virtualenv, index_file=index_file)) == cold
+
+
+@pytest.mark.parametrize(
+		"make_directories",
+		[
+				pytest.param(lambda key, mtime_ns, inode: None, id="missing"),
+				pytest.param(lambda key, mtime_ns, inode: [], id="not_a_dict"),
+				pytest.param(lambda key, mtime_ns, inode: {key: None}, id="null_entry"),
+				pytest.param(lambda key, mtime_ns, inode: {key: [mtime_ns, inode]}, id="short_entry"),
+				pytest.param(lambda key, mtime_ns, inode: {key: [str(mtime_ns), inode, []]}, id="bad_mtime"),
+				pytest.param(lambda key, mtime_ns, inode: {key: [mtime_ns, inode, "foo"]}, id="names_not_a_list"),
+				pytest.param(lambda key, mtime_ns, inode: {key: [mtime_ns, inode, [None]]}, id="bad_name"),
+				]
+		)
+def test_iter_distributions_index_file_malformed(
+		fake_virtualenv: List[PathPlus],
+		tmp_pathplus: PathPlus,
+		make_directories: Callable[[str, int, int], object],
+		):
+	index_file = tmp_pathplus / "dist-index.json"
+	site_packages = fake_virtualenv[0]
+	_age_directories(fake_virtualenv)
+
+	# Entries match the directory's signature, so would otherwise be used as they are
+	st = site_packages.stat()
+	data = {"version": distributions._DistInfoIndex._format_version}
+	directories = make_directories(os.path.abspath(site_packages), st.st_mtime_ns, st.st_ino)
+	if directories is not None:
+		data["directories"] = directories
+	index_file.dump_json(data)
+
+	cold = list(distributions.iter_distributions(path=fake_virtualenv))
+	assert list(distributions.iter_distributions(path=fake_virtualenv, index_file=index_file)) == cold
+
+	# The index was rebuilt
+	assert os.path.abspath(site_packages) in index_file.load_json()["directories"]
+
+
 @pytest.mark.parametrize(
 		"name, expected",
 		[
@@ -484,6 +783,50 @@ def test_get_distribution_not_found(fake_virtualenv: List[PathPlus]):
 		distributions.get_distribution("sphinxcontrib_jsmath", path=fake_virtualenv)
 
 
+@pytest.mark.parametrize("workers", [None, 1, 2, 8])
+def test_iter_distributions_workers(fake_virtualenv: List[PathPlus], tmp_pathplus: PathPlus, workers: int):
+	path = [*fake_virtualenv, tmp_pathplus / "does-not-exist", *fake_virtualenv]
+	expected = list(distributions.iter_distributions(path=path))
+
+	assert list(distributions.iter_distributions(path=path, workers=workers)) == expected
+
+	index_file = tmp_pathplus / "dist-index.json"
+	assert list(distributions.iter_distributions(path=path, workers=workers, index_file=index_file)) == expected
+	assert list(distributions.DistributionIndex(path, workers=workers).values()) == expected
+
+
+def test_distribution_index(fake_virtualenv: List[PathPlus]):
+	index = distributions.DistributionIndex(path=fake_virtualenv)
+
+	assert list(index.values()) == list(distributions.iter_distributions(path=fake_virtualenv))
+	assert len(index) == len(list(distributions.iter_distributions(path=fake_virtualenv)))
+	assert "sphinxcontrib-applehelp" in list(index)
+	assert repr(index) == f"<DistributionIndex({len(index)} distributions)>"
+
+	for name in ("sphinxcontrib_applehelp", "sphinxcontrib-applehelp", "sphinxcontrib.applehelp"):
+		assert name in index
+		assert index[name].name == "sphinxcontrib_applehelp"
+		assert index.get_distribution(name).name == "sphinxcontrib_applehelp"
+		assert distributions.get_distribution(name, path=index).name == "sphinxcontrib_applehelp"
+
+	# Shadowing
+	assert index["domdf-python-tools"].version == Version("2.2.0")
+
+	assert "sphinxcontrib_jsmath" not in index
+	assert 123 not in index
+
+	with pytest.raises(KeyError, match="sphinxcontrib_jsmath"):
+		index["sphinxcontrib_jsmath"]  # pylint: disable=pointless-statement
+
+	with pytest.raises(distributions.DistributionNotFoundError, match="sphinxcontrib_jsmath"):
+		index.get_distribution("sphinxcontrib_jsmath")
+
+	with pytest.raises(distributions.DistributionNotFoundError, match="sphinxcontrib_jsmath"):
+		distributions.get_distribution("sphinxcontrib_jsmath", path=index)
+
+	assert list(distributions.iter_distributions(path=index)) == list(index.values())
+
+
 def test_parse_wheel_filename_errors():
 	with pytest.raises(InvalidWheelFilename, match=r"Invalid wheel filename \(extension must be '.whl'\): .*"):
 		_utils._parse_wheel_filename(PathPlus("my_project-0.1.2.tar.gz"))
@@ -646,3 +989,109 @@ def test_packages_distributions(advanced_data_regression: AdvancedDataRegression
 
 	data = distributions.packages_distributions()
 	advanced_data_regression.check({k: list(v) for k, v in data.items()})
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_iter_wheel_metadata(wheel_directory: PathPlus, tmp_pathplus: PathPlus, workers: int):
+	(tmp_pathplus / "broken-1.0.0-py3-none-any.whl").write_bytes(b"Not a zip file")
+
+	paths = [
+			wheel_directory / "domdf_python_tools-2.9.1-py3-none-any.whl",
+			tmp_pathplus / "broken-1.0.0-py3-none-any.whl",
+			wheel_directory / "Jinja2-3.0.1-py3-none-any.whl",
+			]
+
+	results = list(distributions.iter_wheel_metadata(paths, workers=workers))
+	assert [result.path for result in results] == paths
+
+	domdf_python_tools, broken, jinja2 = results
+
+	with distributions.WheelDistribution.from_path(paths[0]) as wd:
+		assert domdf_python_tools.error is None
+		assert domdf_python_tools.name == "domdf_python_tools"
+		assert domdf_python_tools.version == Version("2.9.1")
+		assert domdf_python_tools.metadata == wd.get_metadata()
+		assert domdf_python_tools.wheel == wd.get_wheel()
+		assert domdf_python_tools.entry_points == wd.get_entry_points()
+		assert list(domdf_python_tools.record) == wd.get_record()  # type: ignore[arg-type]
+		assert [e.hash for e in domdf_python_tools.record] == [e.hash for e in wd.get_record()]  # type: ignore[union-attr]
+
+	assert broken.name == "broken"
+	assert broken.version == Version("1.0.0")
+	assert broken.metadata is None
+	assert broken.record is None
+	assert broken.error == "BadZipFile: File is not a zip file"
+
+	assert jinja2.error is None
+	assert jinja2.metadata["Name"] == "Jinja2"  # type: ignore[index]
+	assert jinja2.entry_points == {"babel.extractors": {"jinja2": "jinja2.ext:babel_extract [i18n]"}}
+
+
+def test_iter_wheel_metadata_include(wheel_directory: PathPlus):
+	path = wheel_directory / "domdf_python_tools-2.9.1-py3-none-any.whl"
+
+	(result, ) = distributions.iter_wheel_metadata([path], include=["metadata"])
+	assert result.metadata is not None
+	assert result.wheel is None
+	assert result.entry_points is None
+	assert result.record is None
+
+	with pytest.raises(ValueError, match="Unknown document[(]s[)]: foo"):
+		distributions.iter_wheel_metadata([path], include=["metadata", "foo"])
+
+
+class TestLazyWheelDistribution:
+
+	@pytest.fixture()
+	def wheel_and_sidecar(self, wheel_directory: PathPlus, tmp_pathplus: PathPlus) -> PathPlus:
+		filename = tmp_pathplus / "domdf_python_tools-2.9.1-py3-none-any.whl"
+		shutil.copy2(wheel_directory / filename.name, filename)
+
+		with distributions.WheelDistribution.from_path(filename) as wd:
+			metadata = wd.read_file("METADATA")
+
+		(tmp_pathplus / f"{filename.name}.metadata").write_text(metadata.replace("Summary: ", "Summary: (sidecar) "))
+		return filename
+
+	def test_metadata_from_sidecar(self, wheel_and_sidecar: PathPlus):
+		distro = distributions.LazyWheelDistribution.from_path(wheel_and_sidecar)
+		assert distro.name == "domdf_python_tools"
+		assert distro.version == Version("2.9.1")
+		assert distro.metadata_path == wheel_and_sidecar.with_name(f"{wheel_and_sidecar.name}.metadata")
+		assert repr(distro) == "<LazyWheelDistribution('domdf_python_tools', <Version('2.9.1')>)>"
+
+		assert distro.has_file("METADATA")
+		assert distro.get_metadata()["Summary"].startswith("(sidecar) ")
+		assert distro.get_metadata(headers_only=True)["Summary"].startswith("(sidecar) ")
+
+		# The wheel itself was never opened.
+		assert "_wheel_zip" not in distro.__dict__
+
+	def test_sidecar_only(self, wheel_and_sidecar: PathPlus):
+		wheel_and_sidecar.unlink()
+
+		distro = distributions.LazyWheelDistribution.from_path(wheel_and_sidecar)
+		assert distro.get_metadata()["Name"] == "domdf-python-tools"
+
+		with pytest.raises(FileNotFoundError):
+			distro.get_wheel()
+
+	def test_other_files_from_zip(self, wheel_and_sidecar: PathPlus):
+		with distributions.WheelDistribution.from_path(wheel_and_sidecar) as wd:
+			expected_wheel = wd.get_wheel()
+			expected_record = wd.get_record()
+			expected_metadata = wd.get_metadata()
+
+		with distributions.LazyWheelDistribution.from_path(wheel_and_sidecar) as distro:
+			assert distro.get_wheel() == expected_wheel
+			assert distro.get_record() == expected_record
+			assert list(distro.get_record_table()) == expected_record
+			assert distro.has_file("RECORD")
+			assert not distro.has_file("foo.txt")
+			assert "_wheel_zip" in distro.__dict__
+
+			# Falls back to the wheel if the sidecar file is removed.
+			distro.metadata_path.unlink()
+			assert distro.get_metadata() == expected_metadata
+
+		assert "_wheel_zip" not in distro.__dict__
@@ -1,9 +1,10 @@
 # stdlib
+import os
 from configparser import ConfigParser
 from io import StringIO
 from operator import attrgetter, itemgetter
 from textwrap import dedent
-from typing import Dict, Iterator, List, Sequence, Union
+from typing import Callable, Dict, Iterator, List, Sequence, Union
 
 # 3rd party
 import pytest
@@ -11,10 +12,12 @@ from coincidence.regressions import AdvancedDataRegressionFixture, AdvancedFileR
 from domdf_python_tools.paths import PathPlus
 
 # this package
-from dist_meta import entry_points
+from dist_meta import _utils, distributions, entry_points
 
 expected_load_output = {"console_scripts": {"py.test": "pytest:console_main", "pytest": "pytest:console_main"}}
 
+requires_cache = pytest.mark.skipif(not _utils.SHOULD_CACHE, reason="Caching is disabled with DIST_META_CACHE=0")
+
 
 @pytest.fixture()
 def example_metadata() -> str:
@@ -40,6 +43,55 @@ def test_loads(advanced_data_regression: AdvancedDataRegressionFixture):
 		assert cp.options(section) == list(expected_load_output[section].keys())
 
 
+def test_loads_returns_new_dicts():
+	text = "[console_scripts]\npytest = pytest:console_main\n"
+
+	first = entry_points.loads(text)
+	first["console_scripts"]["foo"] = "foo:main"
+	first["gui_scripts"] = {}
+
+	assert entry_points.loads(text) == {"console_scripts": {"pytest": "pytest:console_main"}}
+	assert entry_points.loads(text) is not entry_points.loads(text)
+
+
+@requires_cache
+def test_loads_cache():
+	entry_points._loads_frozen.cache_clear()  # type: ignore[attr-defined]
+	text = "[console_scripts]\npytest = pytest:console_main\n"
+
+	for _ in range(4):
+		assert entry_points.loads(text) == {"console_scripts": {"pytest": "pytest:console_main"}}
+
+	info = entry_points._loads_frozen.cache_info()  # type: ignore[attr-defined]
+	assert (info.hits, info.misses, info.currsize) == (3, 1, 1)
+
+
+def test_loads_cache_attributes():
+	entry_points.loads.cache_clear()  # type: ignore[attr-defined]
+	text = "[console_scripts]\npytest = pytest:console_main\n"
+
+	entry_points.loads(text)
+	entry_points.loads(text)
+
+	info = entry_points.loads.cache_info()  # type: ignore[attr-defined]
+	assert info == _utils._caches["entry_points.loads"].cache_info()
+	if _utils.SHOULD_CACHE:
+		assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+	else:
+		assert info.currsize == 0
+
+
+@requires_cache
+def test_loads_cache_bounded(monkeypatch):
+	monkeypatch.setattr(entry_points._loads_frozen, "maxsize", 2)
+	entry_points._loads_frozen.cache_clear()  # type: ignore[attr-defined]
+
+	for idx in range(5):
+		assert entry_points.loads(f"[group]\nname = module:attr{idx}\n") == {"group": {"name": f"module:attr{idx}"}}
+
+	assert entry_points._loads_frozen.cache_info().currsize == 2  # type: ignore[attr-defined]
+
+
 def test_load(tmp_pathplus: PathPlus):
 	(tmp_pathplus / "entry_points.txt").write_lines([
 			"[console_scripts]",
@@ -330,6 +382,39 @@ def test_entry_point_class_malformed(value: str):
 		attrgetter("attr")(ep)
 
 
+def test_entry_point_class_extras_not_shared():
+	ep = entry_points.EntryPoint(name="pytest", value="pytest:console_main [cli, extra]")
+
+	extras = ep.extras
+	assert extras == ["cli", "extra"]
+	extras.append("other")
+	assert ep.extras == ["cli", "extra"]
+
+
+def test_validate():
+	good = [
+			entry_points.EntryPoint("pytest", "pytest:console_main [cli]", "console_scripts"),
+			entry_points.EntryPoint("foo", "foo.bar"),
+			]
+	entry_points.validate(good)
+	entry_points.validate([])
+
+	bad = [
+			*good,
+			entry_points.EntryPoint("bar", "foo-bar", "console_scripts"),
+			entry_points.EntryPoint("baz", ":main"),
+			]
+
+	with pytest.raises(ValueError) as excinfo:
+		entry_points.validate(bad)
+
+	assert str(excinfo.value).splitlines() == [
+			"2 malformed entry point(s):",
+			"  [console_scripts] bar = 'foo-bar'",
+			"  baz = ':main'",
+			]
+
+
 def test_get_entry_points(
 		fake_virtualenv: List[PathPlus],
 		tmp_pathplus: PathPlus,
@@ -352,6 +437,184 @@ def test_get_entry_points(
 	advanced_data_regression.check(sorted(all_eps, key=itemgetter("name")))
 
 
+def test_entry_point_index(fake_virtualenv: List[PathPlus]):
+	index = entry_points.EntryPointIndex(fake_virtualenv)
+
+	assert index.get_all_entry_points() == entry_points.get_all_entry_points(path=fake_virtualenv)
+	assert list(index.get_entry_points("console_scripts")) == index["console_scripts"]
+	assert "console_scripts" in index
+	assert "foo" not in index
+	assert list(index.get_entry_points("foo")) == []
+	assert len(index) == len(list(index))
+	assert repr(index) == f"<EntryPointIndex({len(index)} groups)>"
+
+	with pytest.raises(KeyError, match="^'foo'$"):
+		index["foo"]
+
+	# Returned lists are copies
+	index["console_scripts"].clear()
+	index.get_all_entry_points()["console_scripts"].clear()
+	assert index["console_scripts"]
+
+	distro_index = distributions.DistributionIndex(fake_virtualenv)
+	assert entry_points.EntryPointIndex(distro_index).get_all_entry_points() == index.get_all_entry_points()
+
+
+def _age_files(fake_virtualenv: List[PathPlus], timestamp: int) -> None:
+	# Set the modification time of the directories and entry_points.txt files far enough in the past
+	# that the index isn't rebuilt for fear of missing changes.
+
+	for directory in fake_virtualenv:
+		for ep_file in directory.glob("*.dist-info/entry_points.txt"):
+			os.utime(ep_file, ns=(timestamp, timestamp))
+
+		os.utime(directory, ns=(timestamp, timestamp))
+
+
+@requires_cache
+def test_entry_point_index_cache(fake_virtualenv: List[PathPlus], tmp_pathplus: PathPlus):
+	_age_files(fake_virtualenv, 1_000_000_000)
+
+	index = entry_points._get_index(fake_virtualenv)
+	assert entry_points._get_index(fake_virtualenv) is index
+	assert entry_points._get_index(map(str, fake_virtualenv)) is index
+	assert "foo_group" not in index
+
+	# Install a new distribution with entry points
+	dist_info = fake_virtualenv[0] / "foo-1.2.3.dist-info"
+	dist_info.mkdir()
+	(dist_info / "METADATA").write_lines(["Metadata-Version: 2.1", "Name: foo", "Version: 1.2.3"])
+	(dist_info / "entry_points.txt").write_lines(["[foo_group]", "foo = foo:main"])
+	_age_files(fake_virtualenv, 2_000_000_000)
+
+	new_index = entry_points._get_index(fake_virtualenv)
+	assert new_index is not index
+	assert [ep.value for ep in entry_points.get_entry_points("foo_group", path=fake_virtualenv)] == ["foo:main"]
+	assert entry_points._get_index(fake_virtualenv) is new_index
+
+	# Modify the entry_points.txt file in place
+	(dist_info / "entry_points.txt").write_lines(["[foo_group]", "foo = foo:cli"])
+	os.utime(dist_info / "entry_points.txt", ns=(3_000_000_000, 3_000_000_000))
+	assert [ep.value for ep in entry_points.get_entry_points("foo_group", path=fake_virtualenv)] == ["foo:cli"]
+	new_index = entry_points._get_index(fake_virtualenv)
+
+	# The directory has just been modified, so the scan may have missed changes and the index isn't reused.
+	os.utime(fake_virtualenv[0])
+	racy_index = entry_points._get_index(fake_virtualenv)
+	assert racy_index is not new_index
+	assert entry_points._get_index(fake_virtualenv) is not racy_index
+
+
+def test_entry_point_index_snapshot(fake_virtualenv: List[PathPlus], tmp_pathplus: PathPlus):
+	_age_files(fake_virtualenv, 1_000_000_000)
+
+	snapshot_file = tmp_pathplus / "entry_points.json"
+	folders = tuple(os.path.abspath(folder) for folder in fake_virtualenv)
+
+	index = entry_points.EntryPointIndex(fake_virtualenv)
+	index.save(snapshot_file)
+
+	loaded = entry_points.EntryPointIndex._from_snapshot(snapshot_file, folders)
+	assert loaded is not None
+	assert loaded.get_all_entry_points() == index.get_all_entry_points()
+	assert list(loaded) == list(index)
+
+	# Different path
+	assert entry_points.EntryPointIndex._from_snapshot(snapshot_file, folders[1:]) is None
+
+	# Missing or corrupt
+	assert entry_points.EntryPointIndex._from_snapshot(tmp_pathplus / "missing.json", folders) is None
+	(tmp_pathplus / "corrupt.json").write_text("{")
+	assert entry_points.EntryPointIndex._from_snapshot(tmp_pathplus / "corrupt.json", folders) is None
+
+	# Modified entry_points.txt
+	ep_file = next(iter(index.values()))[0].distro.path / "entry_points.txt"
+	ep_file.write_text(ep_file.read_text())
+	os.utime(ep_file, ns=(3_000_000_000, 3_000_000_000))
+	assert entry_points.EntryPointIndex._from_snapshot(snapshot_file, folders) is None
+
+	# get_entry_points() rewrites the stale snapshot
+	assert entry_points._get_index(fake_virtualenv, snapshot_file=snapshot_file) is not None
+	entry_points._index_cache.cache_clear()
+	assert entry_points.EntryPointIndex._from_snapshot(snapshot_file, folders) is not None
+	eps = entry_points.get_all_entry_points(fake_virtualenv, snapshot_file=snapshot_file)
+	assert eps == index.get_all_entry_points()
+
+	# New distribution
+	dist_info = fake_virtualenv[0] / "foo-1.2.3.dist-info"
+	dist_info.mkdir()
+	(dist_info / "METADATA").write_lines(["Metadata-Version: 2.1", "Name: foo", "Version: 1.2.3"])
+	(dist_info / "entry_points.txt").write_lines(["[foo_group]", "foo = foo:main"])
+	_age_files(fake_virtualenv, 2_000_000_000)
+	assert entry_points.EntryPointIndex._from_snapshot(snapshot_file, folders) is None
+
+	entry_points._index_cache.cache_clear()
+	eps_iter = entry_points.get_entry_points("foo_group", fake_virtualenv, snapshot_file=snapshot_file)
+	assert [ep.value for ep in eps_iter] == ["foo:main"]
+
+	loaded = entry_points.EntryPointIndex._from_snapshot(snapshot_file, folders)
+	assert loaded is not None
+	assert loaded["foo_group"][0].distro.name == "foo"
+	assert str(loaded["foo_group"][0].distro.version) == "1.2.3"
+
+
+def _set_distribution_field(idx: int, value: object) -> Callable[[Dict], None]:
+
+	def corrupt(data: Dict) -> None:
+		data["distributions"][0][idx] = value
+
+	return corrupt
+
+
+@pytest.mark.parametrize(
+		"corrupt",
+		[
+				pytest.param(lambda data: data.pop("folders"), id="no_folders"),
+				pytest.param(lambda data: data.update(folders=None), id="folders_not_a_list"),
+				pytest.param(lambda data: data.update(folders=[None] * len(data["folders"])), id="folder_not_a_list"),
+				pytest.param(lambda data: data.pop("distributions"), id="no_distributions"),
+				pytest.param(lambda data: data.update(distributions=1), id="distributions_not_a_list"),
+				pytest.param(lambda data: data["distributions"][0].pop(), id="short_distribution"),
+				pytest.param(_set_distribution_field(0, None), id="bad_name"),
+				pytest.param(_set_distribution_field(1, "not a version"), id="bad_version"),
+				pytest.param(_set_distribution_field(1, []), id="version_not_a_string"),
+				pytest.param(_set_distribution_field(2, None), id="bad_path"),
+				pytest.param(_set_distribution_field(4, []), id="eps_not_a_dict"),
+				pytest.param(_set_distribution_field(4, {"console_scripts": []}), id="group_not_a_dict"),
+				pytest.param(_set_distribution_field(4, {"console_scripts": {"foo": 1}}), id="bad_entry_point"),
+				]
+		)
+def test_entry_point_index_snapshot_malformed(
+		fake_virtualenv: List[PathPlus],
+		tmp_pathplus: PathPlus,
+		corrupt: Callable[[Dict], None],
+		):
+	_age_files(fake_virtualenv, 1_000_000_000)
+
+	snapshot_file = tmp_pathplus / "entry_points.json"
+	folders = tuple(os.path.abspath(folder) for folder in fake_virtualenv)
+
+	index = entry_points.EntryPointIndex(fake_virtualenv)
+	index.save(snapshot_file)
+
+	data = snapshot_file.load_json()
+	corrupt(data)
+	snapshot_file.dump_json(data)
+	assert entry_points.EntryPointIndex._from_snapshot(snapshot_file, folders) is None
+
+	# The malformed snapshot is rebuilt
+	entry_points._index_cache.cache_clear()
+	assert entry_points.get_all_entry_points(fake_virtualenv, snapshot_file=snapshot_file) == index.get_all_entry_points()
+	assert entry_points.EntryPointIndex._from_snapshot(snapshot_file, folders) is not None
+
+
+def test_entry_point_index_snapshot_distribution_index(fake_virtualenv: List[PathPlus], tmp_pathplus: PathPlus):
+	index = entry_points.EntryPointIndex(distributions.DistributionIndex(fake_virtualenv))
+
+	with pytest.raises(ValueError, match="Cannot save an EntryPointIndex constructed from a DistributionIndex."):
+		index.save(tmp_pathplus / "entry_points.json")
+
+
 def test_get_all_entry_points(
 		fake_virtualenv: List[PathPlus],
 		tmp_pathplus: PathPlus,
@@ -0,0 +1,265 @@
+# stdlib
+import hashlib
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+# 3rd party
+import pytest
+from domdf_python_tools.paths import PathPlus
+
+# this package
+from dist_meta.distributions import Distribution
+from dist_meta.integrity import (
+		FileError,
+		HashMismatch,
+		MissingFile,
+		SizeMismatch,
+		VerificationCache,
+		verify_distribution,
+		verify_distributions,
+		verify_record
+		)
+from dist_meta.record import FileHash, RecordEntry
+
+_FILES: Dict[str, bytes] = {
+		"foo/__init__.py": b"print('hello world')\n",
+		"foo/data.bin": bytes(range(256)) * 8192,
+		"foo/py.typed": b'',
+		}
+
+
+@pytest.fixture()
+def distro(tmp_pathplus: PathPlus) -> Distribution:
+	site_packages = tmp_pathplus / "site-packages"
+	dist_info = site_packages / "foo-1.2.3.dist-info"
+	dist_info.maybe_make(parents=True)
+	(dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: foo\nVersion: 1.2.3\n")
+
+	record: List[str] = []
+
+	for filename, content in _FILES.items():
+		(site_packages / filename).parent.maybe_make()
+		(site_packages / filename).write_bytes(content)
+		file_hash = FileHash.from_hash(hashlib.sha256(content))
+		record.append(f"{filename},{file_hash.to_string()},{len(content)}")
+
+	record.append("foo-1.2.3.dist-info/RECORD,,")
+	(dist_info / "RECORD").write_lines(record)
+
+	return Distribution.from_path(dist_info)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_verify_distribution(distro: Distribution, workers: int):
+	report = verify_distribution(distro, workers=workers)
+	assert report.ok
+	assert report.checked == 4
+
+	site_packages = distro.path.parent
+	(site_packages / "foo/__init__.py").write_bytes(b"print('HELLO world')\n")
+	(site_packages / "foo/py.typed").write_bytes(b"partial\n")
+	(site_packages / "foo/data.bin").unlink()
+
+	report = verify_distribution(distro, workers=workers)
+	assert not report.ok
+	assert report.checked == 4
+
+	assert report.missing == [MissingFile(RecordEntry("foo/data.bin"))]
+
+	assert report.size_mismatches == [SizeMismatch(RecordEntry("foo/py.typed"), 0, 8)]
+
+	assert len(report.hash_mismatches) == 2
+	assert report.hash_mismatches[0].entry == RecordEntry("foo/__init__.py")
+	assert report.hash_mismatches[0].actual == FileHash.from_hash(hashlib.sha256(b"print('HELLO world')\n"))
+	assert report.hash_mismatches[1] == HashMismatch(
+			RecordEntry("foo/py.typed"),
+			FileHash.from_hash(hashlib.sha256(b'')),
+			FileHash.from_hash(hashlib.sha256(b"partial\n")),
+			)
+
+
+def test_verify_record_process_pool(distro: Distribution):
+	(distro.path.parent / "foo/data.bin").write_bytes(bytes(range(256)) * 8191 + b'\0' * 256)
+
+	with ProcessPoolExecutor(max_workers=2) as executor:
+		report = verify_record(distro.get_record(), distro.path.parent, executor=executor)  # type: ignore[arg-type]
+
+	assert report.checked == 4
+	assert [mismatch.entry for mismatch in report.hash_mismatches] == [RecordEntry("foo/data.bin")]
+	assert not report.size_mismatches
+	assert not report.missing
+
+
+def test_verify_distribution_modes(distro: Distribution):
+	site_packages = distro.path.parent
+	(site_packages / "foo/__init__.py").write_bytes(b"print('HELLO world')\n")
+	(site_packages / "foo/data.bin").write_bytes(b"truncated")
+	(site_packages / "foo/py.typed").unlink()
+
+	report = verify_distribution(distro, mode="hash")
+	assert [m.entry for m in report.hash_mismatches] == [RecordEntry("foo/__init__.py"), RecordEntry("foo/data.bin")]
+	assert [m.entry for m in report.size_mismatches] == [RecordEntry("foo/data.bin")]
+	assert report.missing == [MissingFile(RecordEntry("foo/py.typed"))]
+
+	# The modified file has the same size, so goes unnoticed
+	report = verify_distribution(distro, mode="size")
+	assert report.hash_mismatches == []
+	assert report.size_mismatches == [SizeMismatch(RecordEntry("foo/data.bin"), 256 * 8192, 9)]
+	assert report.missing == [MissingFile(RecordEntry("foo/py.typed"))]
+
+	report = verify_distribution(distro, mode="size-then-hash")
+	assert [m.entry for m in report.hash_mismatches] == [RecordEntry("foo/__init__.py")]
+	assert report.size_mismatches == [SizeMismatch(RecordEntry("foo/data.bin"), 256 * 8192, 9)]
+	assert report.missing == [MissingFile(RecordEntry("foo/py.typed"))]
+
+	with pytest.raises(ValueError, match="Unknown verification mode 'fast'"):
+		verify_distribution(distro, mode="fast")
+
+
+def test_verify_distribution_no_record(distro: Distribution):
+	(distro.path / "RECORD").unlink()
+
+	with pytest.raises(FileNotFoundError, match="RECORD$"):
+		verify_distribution(distro)
+
+	with pytest.raises(FileNotFoundError, match="RECORD$"):
+		verify_distributions([distro])
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_verify_record_errors(distro: Distribution, workers: int):
+	site_packages = distro.path.parent
+	entries = [
+			RecordEntry("foo/__init__.py/bar", FileHash.from_hash(hashlib.sha256(b''))),
+			RecordEntry("foo", FileHash.from_hash(hashlib.sha256(b''))),
+			RecordEntry("foo/py.typed", FileHash("md7", "AAAA")),
+			RecordEntry("foo/data.bin"),
+			]
+
+	report = verify_record(entries, site_packages, workers=workers)
+
+	assert not report.ok
+	assert report.checked == 4
+	assert report.missing == [MissingFile(entries[0])]
+	assert [error.entry for error in report.errors] == entries[1:3]
+	assert report.errors[0].error.startswith("IsADirectoryError: ")
+	assert isinstance(report.errors[1], FileError)
+	assert report.errors[1].error.startswith("ValueError: ")
+	assert not report.hash_mismatches
+	assert not report.size_mismatches
+
+
+def test_verify_distributions_malformed_hash(distro: Distribution, tmp_pathplus: PathPlus):
+	other_dist_info = tmp_pathplus / "other-site-packages" / "foo-1.2.3.dist-info"
+	shutil.copytree(distro.path.parent, other_dist_info.parent)
+	other = Distribution.from_path(other_dist_info)
+
+	record_file = other.path / "RECORD"
+	lines = record_file.read_lines()
+	lines[0] = "foo/__init__.py,sha256=abcde,21"
+	record_file.write_lines(lines)
+
+	for mode in ("hash", "size-then-hash"):
+		first, second = verify_distributions([distro, other], mode=mode)
+		assert first.ok
+		assert not second.ok
+		assert second.errors == [
+				FileError(RecordEntry("foo/__init__.py"), "Malformed hash in RECORD: 'sha256=abcde'"),
+				]
+		assert not second.hash_mismatches
+		assert not second.size_mismatches
+
+	# The hash isn't used when only checking sizes.
+	assert verify_distribution(other, mode="size").ok
+
+	with VerificationCache(tmp_pathplus / "cache.json") as cache:
+		report = verify_distribution(other, cache=cache)
+		assert [error.entry for error in report.errors] == [RecordEntry("foo/__init__.py")]
+
+
+def test_verify_distributions(distro: Distribution, tmp_pathplus: PathPlus):
+	other_dist_info = tmp_pathplus / "other-site-packages" / "foo-1.2.3.dist-info"
+	shutil.copytree(distro.path.parent, other_dist_info.parent)
+	other = Distribution.from_path(other_dist_info)
+	(other.path.parent / "foo/py.typed").write_bytes(b"partial\n")
+
+	reports = verify_distributions([distro, other, distro], workers=4)
+	assert [report.ok for report in reports] == [True, False, True]
+
+	with ProcessPoolExecutor(max_workers=2) as executor:
+		first, second = verify_distributions([distro, other], executor=executor, mode="size")
+
+	assert first.ok
+	assert second.size_mismatches == [SizeMismatch(RecordEntry("foo/py.typed"), 0, 8)]
+
+	with pytest.raises(ValueError, match="Unknown verification mode 'fast'"):
+		verify_distributions([distro], mode="fast")
+
+
+def test_verification_cache(distro: Distribution, tmp_pathplus: PathPlus):
+	site_packages = distro.path.parent
+	init_file = site_packages / "foo/__init__.py"
+	cache_file = tmp_pathplus / "cache.json"
+
+	for filename in _FILES:
+		os.utime(site_packages / filename, ns=(1_000_000_000, 1_000_000_000))
+
+	with VerificationCache(cache_file) as cache:
+		assert verify_distribution(distro, cache=cache).ok
+
+	assert cache_file.is_file()
+
+	# Modify the file without changing its size or mtime. The cached hash is used.
+	init_file.write_bytes(b"print('HELLO world')\n")
+	os.utime(init_file, ns=(1_000_000_000, 1_000_000_000))
+
+	cache = VerificationCache(cache_file)
+	assert verify_distribution(distro, cache=cache).ok
+	assert not cache.changed
+
+	# The stat-only mode never consults the cache.
+	assert verify_distribution(distro, cache=cache, mode="size").ok
+
+	# Changing the mtime invalidates the cached hash.
+	os.utime(init_file, ns=(2_000_000_000, 2_000_000_000))
+	report = verify_distribution(distro, cache=cache)
+	assert [m.entry for m in report.hash_mismatches] == [RecordEntry("foo/__init__.py")]
+	assert cache.changed
+	cache.save()
+
+	# Changing RECORD invalidates every cached hash for the distribution.
+	(distro.path / "RECORD").write_text((distro.path / "RECORD").read_text().replace(",21\n", ",21 \n"))
+	os.utime(init_file, ns=(1_000_000_000, 1_000_000_000))
+	cache = VerificationCache(cache_file)
+	report = verify_distribution(distro, cache=cache)
+	assert [m.entry for m in report.hash_mismatches] == [RecordEntry("foo/__init__.py")]
+
+
+def test_verification_cache_upgrade(distro: Distribution, tmp_pathplus: PathPlus):
+	cache_file = tmp_pathplus / "cache.json"
+
+	with VerificationCache(cache_file) as cache:
+		assert verify_distribution(distro, cache=cache).ok
+
+	# Upgrade the distribution
+	new_dist_info = distro.path.parent / "Foo-1.2.4.dist-info"
+	distro.path.rename(new_dist_info)
+	(new_dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: Foo\nVersion: 1.2.4\n")
+	(new_dist_info / "RECORD").write_text((new_dist_info / "RECORD").read_text().replace("foo-1.2.3", "Foo-1.2.4"))
+	upgraded = Distribution.from_path(new_dist_info)
+
+	with VerificationCache(cache_file) as cache:
+		assert verify_distribution(upgraded, cache=cache).ok
+
+	distributions = json.loads(cache_file.read_text())["distributions"]
+	assert list(distributions) == [os.path.join(os.path.abspath(distro.path.parent), "foo")]
+
+
+def test_verification_cache_corrupt(distro: Distribution, tmp_pathplus: PathPlus):
+	(tmp_pathplus / "cache.json").write_text("{not json")
+
+	with VerificationCache(tmp_pathplus / "cache.json") as cache:
+		assert verify_record(distro.get_record(), distro.path.parent, cache=cache).ok  # type: ignore[arg-type]
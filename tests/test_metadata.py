@@ -9,7 +9,7 @@ from domdf_python_tools.paths import PathPlus
 # this package
 from dist_meta import metadata
 from dist_meta.metadata import MissingFieldError
-from dist_meta.metadata_mapping import MetadataMapping
+from dist_meta.metadata_mapping import MetadataMapping, _LazyValue
 
 
 @pytest.fixture()
@@ -98,6 +98,92 @@ def test_load(
 	advanced_file_regression.check(fields["Description"])
 
 
+@pytest.mark.parametrize(
+		"newline",
+		[
+				pytest.param('\n', id="lf"),
+				pytest.param("\r\n", id="crlf"),
+				],
+		)
+def test_loads_headers_only(example_metadata: str, newline: str):
+	full = metadata.loads(example_metadata.replace('\n', newline))
+	fields = metadata.loads(example_metadata.replace('\n', newline), headers_only=True)
+
+	assert "Description" in full
+	assert "Description" not in fields
+	assert fields.items() == [(k, v) for k, v in full.items() if k != "Description"]
+
+
+def test_load_headers_only(example_metadata: str, tmp_pathplus: PathPlus):
+	(tmp_pathplus / "METADATA").write_text(example_metadata)
+	fields = metadata.load(tmp_pathplus / "METADATA", headers_only=True)
+
+	assert "Description" not in fields
+	assert fields["Name"] == "cawdrey"
+	assert fields.get_all("Requires-Dist") == ["domdf-python-tools (>=1.1.0)", "typing-extensions (>=3.7.4.3)"]
+
+
+def test_loads_headers_only_description_as_key():
+	fields = metadata.loads(
+			'\n'.join([
+					"Metadata-Version: 2.1",
+					"Name: BeagleVote",
+					"Description: This project provides powerful math functions",
+					"        |For example, you can use `sum()` to sum numbers:",
+					"        |",
+					"version: 1.0a2",
+					]),
+			headers_only=True,
+			)
+
+	assert fields.keys() == ["Metadata-Version", "Name", "version"]
+
+
+def test_loads_description_lazy(example_metadata: str):
+	fields = metadata.loads(example_metadata)
+
+	# Not computed yet
+	assert isinstance(dict(fields._fields)["Description"], _LazyValue)
+	assert "Description" in fields
+	assert "Description" in fields.keys()
+
+	expected = metadata.dumps(metadata.loads(example_metadata))
+	assert metadata.dumps(fields) == expected
+	assert isinstance(dict(fields._fields)["Description"], _LazyValue)
+
+	description = fields["Description"]
+	assert description.startswith("==========\nCawdrey\n==========\n")
+	assert description.endswith('\n')
+	assert dict(fields._fields)["Description"] is description
+	assert metadata.dumps(fields) == expected
+
+
+@pytest.mark.parametrize(
+		"body",
+		[
+				"Hello\r\nWorld\r\n",
+				"\n\n  Hello\n\n    indented\n\n\n",
+				"Hello   \nWorld\n   \n",
+				],
+		)
+def test_dumps_description_unaccessed(body: str):
+	rawtext = f"Metadata-Version: 2.1\nName: foo\nVersion: 1.2.3\n\n{body}"
+
+	fields = metadata.loads(rawtext)
+	lazy_value = dict(fields._fields)["Description"]
+	assert isinstance(lazy_value, _LazyValue)
+
+	# Only the body is kept, not the whole file.
+	assert lazy_value.raw == body
+	assert lazy_value.factory.args == (body, )  # type: ignore[attr-defined]
+
+	unaccessed = metadata.dumps(fields)
+	assert isinstance(dict(fields._fields)["Description"], _LazyValue)
+
+	fields["Description"]
+	assert metadata.dumps(fields) == unaccessed
+
+
 def test_load_no_version(tmp_pathplus: PathPlus):
 	(tmp_pathplus / "METADATA").write_lines([
 			"Generator: bdist_wheel (0.36.2)",
@@ -181,3 +181,60 @@ def test_get_all():
 	msg["From"] = "Alan"
 
 	assert msg.get_all("From", ["foo@bar.com", "Alan"])
+
+
+def test_set_lazy():
+	calls = []
+
+	def factory() -> str:
+		calls.append(1)
+		return "Lazy value"
+
+	h = MetadataMapping()
+	h["Name"] = "foo"
+	h.set_lazy("Description", factory)
+
+	assert "Description" in h
+	assert "description" in h
+	assert h.keys() == ["Name", "Description"]
+	assert len(h) == 2
+	assert not calls
+
+	assert h["Description"] == "Lazy value"
+	assert h.get("description") == "Lazy value"
+	assert h.get_all("Description") == ["Lazy value"]
+	assert h.values() == ["foo", "Lazy value"]
+	assert h.items() == [("Name", "foo"), ("Description", "Lazy value")]
+	assert len(calls) == 1
+
+	h.set_lazy("Other", factory)
+	assert repr(h) == "<MetadataMapping({'Name': 'foo', 'Description': 'Lazy value', 'Other': 'Lazy value'})>"
+	assert len(calls) == 2
+
+	del h["Description"]
+	assert "Description" not in h
+
+
+def test_delitem_reindexes():
+	h = MetadataMapping()
+	h["Name"] = "foo"
+	h["Classifier"] = "A"
+	h["Version"] = "1.2.3"
+	h["classifier"] = "B"
+	h["Requires-Dist"] = "bar"
+
+	del h["CLASSIFIER"]
+	del h["Missing"]
+
+	assert h.keys() == ["Name", "Version", "Requires-Dist"]
+	assert h["version"] == "1.2.3"
+	assert h["requires-dist"] == "bar"
+	assert h.get_all("Classifier") is None
+
+	h["Classifier"] = "C"
+	h.replace("VERSION", "4.5.6")
+	assert h.items() == [("Name", "foo"), ("VERSION", "4.5.6"), ("Requires-Dist", "bar"), ("Classifier", "C")]
+	assert h.get_all("classifier") == ["C"]
+
+	with pytest.raises(KeyError, match="123"):
+		h[123]  # type: ignore[index]  # pylint: disable=pointless-statement
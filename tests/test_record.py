@@ -1,5 +1,7 @@
 # stdlib
+import hashlib
 import pathlib
+import pickle
 
 # 3rd party
 import handy_archives
@@ -10,8 +12,9 @@ from domdf_python_tools.typing import PathLike
 from shippinglabel.checksum import get_sha256_hash
 
 # this package
+from dist_meta import record
 from dist_meta.distributions import Distribution
-from dist_meta.record import FileHash, RecordEntry
+from dist_meta.record import FileHash, RecordEntry, RecordTable
 
 
 def test_file_hash(tmp_pathplus: PathPlus):
@@ -28,6 +31,72 @@ def test_file_hash(tmp_pathplus: PathPlus):
 	assert FileHash.from_hash(sha256_hash) == fh
 
 
+def test_file_hash_from_file(tmp_pathplus: PathPlus):
+	(tmp_pathplus / "LICENSE").write_text("Do what you want,")
+
+	fh = FileHash.from_file(tmp_pathplus / "LICENSE")
+	assert fh == FileHash("sha256", "WUk2cO6oqWOYz3wqsKUFJi432cyMjFrMjiucuBR3K4E")
+
+	fh = FileHash.from_file(tmp_pathplus / "LICENSE", algorithm="md5")
+	assert fh == FileHash.from_hash(hashlib.md5(b"Do what you want,"))  # nosec: B324
+
+	with pytest.raises(ValueError, match="unsupported hash type"):
+		FileHash.from_file(tmp_pathplus / "LICENSE", algorithm="foo")
+
+
+def test_record_entry_from_file(tmp_pathplus: PathPlus):
+	(tmp_pathplus / "foo").mkdir()
+	content = bytes(range(256)) * 8192
+	(tmp_pathplus / "foo" / "data.bin").write_bytes(content)
+
+	entry = RecordEntry.from_file(tmp_pathplus / "foo" / "data.bin", tmp_pathplus)
+	assert entry == RecordEntry("foo/data.bin")
+	assert entry.size == len(content)
+	assert entry.hash == FileHash.from_hash(hashlib.sha256(content))
+	assert entry.distro is None
+
+	assert RecordEntry.from_file("foo/data.bin", tmp_pathplus).as_record_entry() == entry.as_record_entry()
+
+	entry = RecordEntry.from_file("foo/data.bin", tmp_pathplus, algorithm="sha512")
+	assert entry.hash == FileHash.from_hash(hashlib.sha512(content))
+
+	with pytest.raises(ValueError, match="RecordEntry paths cannot be absolute"):
+		RecordEntry.from_file(tmp_pathplus / "foo" / "data.bin")
+
+
+def test_record_entry_from_file_absolute_not_hashed(tmp_pathplus: PathPlus, monkeypatch):
+
+	def fail(*args, **kwargs):  # noqa: MAN002
+		raise AssertionError("The file should not be hashed")
+
+	monkeypatch.setattr(record, "_hash_file", fail)
+
+	with pytest.raises(ValueError, match="RecordEntry paths cannot be absolute"):
+		RecordEntry.from_file(tmp_pathplus / "data.bin")
+
+
+def test_file_hash_matches():
+	fh = FileHash("sha256", "WUk2cO6oqWOYz3wqsKUFJi432cyMjFrMjiucuBR3K4E")
+	the_hash = hashlib.sha256(b"Do what you want,")
+
+	assert fh.matches(the_hash)
+	assert fh.matches(the_hash.digest())
+	assert fh.matches(bytearray(the_hash.digest()))
+	assert fh.matches(FileHash.from_hash(the_hash))
+	assert fh.verify_bytes(b"Do what you want,")
+
+	assert not fh.matches(hashlib.sha256(b"Do what you like,"))
+	assert not fh.matches(b"Do what you want,")
+	assert not fh.verify_bytes(b"Do what you like,")
+
+	# The algorithm must match too
+	assert not fh.matches(hashlib.sha512(b"Do what you want,"))
+	assert not fh.matches(FileHash("sha512", fh.value))
+
+	with pytest.raises(ValueError, match="unsupported hash type"):
+		FileHash("foo", fh.value).verify_bytes(b'')
+
+
 def test_record_entry(
 		wheel_directory: PathPlus,
 		tmp_pathplus: PathPlus,
@@ -193,6 +262,130 @@ def test_record_entry_absolute(path: PathLike):
 		RecordEntry(path)
 
 
+def test_record_entry_pickle():
+	entry = RecordEntry(
+			"foo/__init__.py",
+			hash=FileHash("sha256", "WUk2cO6oqWOYz3wqsKUFJi432cyMjFrMjiucuBR3K4E"),
+			size=17,
+			)
+
+	unpickled = pickle.loads(pickle.dumps(entry))  # nosec: B301
+	assert unpickled == entry
+	assert unpickled.hash == entry.hash
+	assert unpickled.size == 17
+	assert unpickled.distro is None
+
+
 def test_coercion_windows():
 	assert str(RecordEntry(pathlib.PureWindowsPath("a/b/c"))) == "a/b/c"
 	assert str(RecordEntry(pathlib.PureWindowsPath(r"a\b\c"))) == "a/b/c"
+
+
+def test_record_table():
+	entries = [
+			RecordEntry("foo/__init__.py", hash=FileHash("sha256", "WUk2cO6oqWOYz3wqsKUFJi432cyMjFrMjiucuBR3K4E"), size=17),
+			RecordEntry("foo/data.bin", hash=FileHash("md5", "1B2M2Y8AsgTpgAmY7PhCfg"), size=0),
+			RecordEntry("foo-1.2.3.dist-info/RECORD"),
+			]
+
+	table = RecordTable(entries)
+	assert len(table) == 3
+	assert list(table) == entries
+	assert [e.hash for e in table] == [e.hash for e in entries]
+	assert [e.size for e in table] == [e.size for e in entries]
+	assert table[-1] == entries[-1]
+	assert table[-1].hash is None
+	assert table[-1].size is None
+	assert table[1:] == entries[1:]
+	assert repr(table) == "<RecordTable(3 entries)>"
+
+	with pytest.raises(IndexError, match="RecordTable index out of range"):
+		table[3]
+
+	table.append(
+			RecordEntry("foo/py.typed", hash=FileHash("sha256", "47DEQpj8HBSa-_TImW-5JCeuQeRkm5NMpJWZG3hSuFU"), size=0),
+			)
+	assert len(table) == 4
+	assert table[3].hash == FileHash("sha256", "47DEQpj8HBSa-_TImW-5JCeuQeRkm5NMpJWZG3hSuFU")
+	assert table._algorithms == ['', "sha256", "md5"]
+
+	unpickled = pickle.loads(pickle.dumps(table))  # nosec: B301
+	assert list(unpickled) == list(table)
+	assert [e.hash for e in unpickled] == [e.hash for e in table]
+
+
+def test_record_table_malformed_hash(tmp_pathplus: PathPlus):
+	rows = [
+			["foo/__init__.py", "sha256=WUk2cO6oqWOYz3wqsKUFJi432cyMjFrMjiucuBR3K4E", "17"],
+			["foo/bad.py", "sha256=abcde", "1"],
+			["foo-1.2.3.dist-info/RECORD", '', ''],
+			]
+
+	table = RecordTable._from_rows(rows)
+	assert len(table) == 3
+	assert table[0].hash == FileHash("sha256", "WUk2cO6oqWOYz3wqsKUFJi432cyMjFrMjiucuBR3K4E")
+	assert table[1].hash == FileHash("sha256", "abcde")
+	assert table[1].size == 1
+	assert table[2].hash is None
+	assert record.dumps(table) == ''.join(f"{','.join(row)}\n" for row in rows)
+
+	table.append(RecordEntry("foo/other.py", hash=FileHash("sha256", "x"), size=2))
+	assert table[3].hash == FileHash("sha256", "x")
+
+	dist_info = tmp_pathplus / "foo-1.2.3.dist-info"
+	dist_info.mkdir()
+	(dist_info / "METADATA").write_lines(["Metadata-Version: 2.1", "Name: foo", "Version: 1.2.3"])
+	(dist_info / "RECORD").write_lines(','.join(row) for row in rows)
+
+	distro = Distribution.from_path(dist_info)
+	assert list(distro.get_record_table()) == distro.get_record()  # type: ignore[arg-type]
+
+
+def test_dumps_loads(tmp_pathplus: PathPlus):
+	entries = [
+			RecordEntry("foo/__init__.py", hash=FileHash("sha256", "WUk2cO6oqWOYz3wqsKUFJi432cyMjFrMjiucuBR3K4E"), size=17),
+			RecordEntry("foo/a,b.txt", hash=FileHash("sha256", "47DEQpj8HBSa-_TImW-5JCeuQeRkm5NMpJWZG3hSuFU"), size=0),
+			RecordEntry("foo-1.2.3.dist-info/RECORD"),
+			]
+
+	expected = (
+			"foo/__init__.py,sha256=WUk2cO6oqWOYz3wqsKUFJi432cyMjFrMjiucuBR3K4E,17\n"
+			'"foo/a,b.txt",sha256=47DEQpj8HBSa-_TImW-5JCeuQeRkm5NMpJWZG3hSuFU,0\n'
+			"foo-1.2.3.dist-info/RECORD,,\n"
+			)
+
+	assert record.dumps(entries) == expected
+	assert record.dumps(RecordTable(entries)) == expected
+	assert record.dumps([]) == ''
+
+	loaded = record.loads(expected)
+	assert loaded == entries
+	assert [e.hash for e in loaded] == [e.hash for e in entries]
+	assert [e.size for e in loaded] == [e.size for e in entries]
+
+	assert record.dump(entries, tmp_pathplus / "RECORD") == len(expected)
+	assert (tmp_pathplus / "RECORD").read_bytes() == expected.encode("UTF-8")
+	assert record.load(tmp_pathplus / "RECORD") == entries
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_build(tmp_pathplus: PathPlus, workers: int):
+	(tmp_pathplus / "foo" / "sub").mkdir(parents=True)
+	(tmp_pathplus / "foo-1.2.3.dist-info").mkdir()
+	(tmp_pathplus / "foo" / "__init__.py").write_text("Do what you want,")
+	(tmp_pathplus / "foo" / "sub" / "RECORD").write_text("Not a RECORD file")
+	(tmp_pathplus / "foo-1.2.3.dist-info" / "METADATA").write_text("Name: foo\nVersion: 1.2.3\n")
+	(tmp_pathplus / "foo-1.2.3.dist-info" / "RECORD.jws").write_text("{}")
+
+	entries = record.build(tmp_pathplus, workers=workers)
+
+	assert [e.as_record_entry() for e in entries] == [
+			"foo-1.2.3.dist-info/METADATA,sha256=TwF7QI6IFFY1HXo-dslmGF9bp0AD5GigfGB_7Ale0gw,25",
+			"foo-1.2.3.dist-info/RECORD,,",
+			"foo-1.2.3.dist-info/RECORD.jws,,",
+			"foo/__init__.py,sha256=WUk2cO6oqWOYz3wqsKUFJi432cyMjFrMjiucuBR3K4E,17",
+			"foo/sub/RECORD,sha256=Aiy0bHwyV6b1u2jaG2kU9pwCZTFVVLs8zCOPslztVH0,17",
+			]
+
+	record.dump(entries, tmp_pathplus / "foo-1.2.3.dist-info" / "RECORD")
+	assert [e.as_record_entry() for e in record.build(tmp_pathplus)] == [e.as_record_entry() for e in entries]
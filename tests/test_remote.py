@@ -0,0 +1,148 @@
+# stdlib
+import io
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Tuple
+
+# 3rd party
+import pytest
+from domdf_python_tools.paths import PathPlus
+
+# this package
+from dist_meta.distributions import WheelDistribution
+from dist_meta.remote import HTTPRangeReader, RangeReader, wheel_from_url
+
+_range_re = re.compile(r"^bytes=(\d+)-(\d+)$")
+
+
+class _Server(ThreadingHTTPServer):
+	files: Dict[str, bytes]
+	bytes_sent: int
+
+
+class _RangeRequestHandler(BaseHTTPRequestHandler):
+	server: _Server
+
+	def log_message(self, format, *args) -> None:  # noqa: A002  # pylint: disable=redefined-builtin
+		pass
+
+	def do_HEAD(self) -> None:
+		content = self.server.files.get(self.path)
+		if content is None:
+			self.send_error(404)
+			return
+
+		self.send_response(200)
+		self.send_header("Content-Length", str(len(content)))
+		self.send_header("Accept-Ranges", "bytes")
+		self.end_headers()
+
+	def do_GET(self) -> None:
+		content = self.server.files.get(self.path)
+		if content is None:
+			self.send_error(404)
+			return
+
+		match = _range_re.match(self.headers.get("Range", ''))
+		if match is None or self.path.endswith("no-ranges-1.0.0-py3-none-any.whl"):
+			self.send_response(200)
+		else:
+			content = content[int(match.group(1)):int(match.group(2)) + 1]
+			self.send_response(206)
+
+		self.send_header("Content-Length", str(len(content)))
+		self.end_headers()
+		self.wfile.write(content)
+		self.server.bytes_sent += len(content)
+
+
+@pytest.fixture()
+def server(wheel_directory: PathPlus) -> Iterator[_Server]:
+	httpd = _Server(("127.0.0.1", 0), _RangeRequestHandler)
+	httpd.files = {
+			"/Babel-2.9.1-py2.py3-none-any.whl": (wheel_directory / "Babel-2.9.1-py2.py3-none-any.whl").read_bytes(),
+			"/no-ranges-1.0.0-py3-none-any.whl": b"Not a zip file",
+			}
+	httpd.bytes_sent = 0
+
+	thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+	thread.start()
+
+	try:
+		yield httpd
+	finally:
+		httpd.shutdown()
+		httpd.server_close()
+
+
+def test_range_reader():
+	content = bytes(range(256)) * 40
+	calls: List[Tuple[int, int]] = []
+
+	def fetch(start: int, length: int) -> bytes:
+		calls.append((start, length))
+		return content[start:start + length]
+
+	reader = RangeReader(fetch, len(content), block_size=1000)
+	assert reader.size == len(content)
+	assert reader.seekable()
+	assert reader.readable()
+
+	assert reader.seek(-10, io.SEEK_END) == len(content) - 10
+	assert reader.read() == content[-10:]
+	assert calls == [(10000, 240)]
+
+	reader.seek(995)
+	assert reader.read(10) == content[995:1005]
+	assert calls[1:] == [(0, 2000)]
+
+	# Already cached
+	reader.seek(0)
+	assert reader.read(2000) == content[:2000]
+	assert len(calls) == 2
+
+	reader.seek(-20, io.SEEK_CUR)
+	assert reader.tell() == 1980
+	assert reader.read(5000) == content[1980:6980]
+	assert calls[2:] == [(2000, 5000)]
+
+	reader.seek(100_000)
+	assert reader.read() == b''
+
+	with pytest.raises(ValueError, match="Negative seek position -1"):
+		reader.seek(-1)
+
+
+def test_range_reader_short_read():
+	reader = RangeReader(lambda start, length: b"abc", 100, block_size=10)
+
+	with pytest.raises(OSError, match="Expected 10 bytes from offset 0, got 3"):
+		reader.read(5)
+
+
+@pytest.mark.parametrize("metadata_only", [True, False])
+def test_wheel_from_url(server: _Server, wheel_directory: PathPlus, metadata_only: bool):
+	url = f"http://127.0.0.1:{server.server_port}/Babel-2.9.1-py2.py3-none-any.whl"
+
+	with wheel_from_url(url, metadata_only=metadata_only) as wd:
+		assert wd.name == "Babel"
+		assert wd.path == PathPlus("Babel-2.9.1-py2.py3-none-any.whl")
+
+		with WheelDistribution.from_path(wheel_directory / "Babel-2.9.1-py2.py3-none-any.whl") as local:
+			assert wd.get_metadata() == local.get_metadata()
+			assert wd.get_wheel() == local.get_wheel()
+			assert wd.get_entry_points() == local.get_entry_points()
+			assert wd.has_file("RECORD")
+			assert wd.get_record() == local.get_record()
+
+	# Only a small fraction of the wheel was downloaded.
+	assert server.bytes_sent < len(server.files["/Babel-2.9.1-py2.py3-none-any.whl"]) / 10
+
+
+def test_http_range_reader_no_range_support(server: _Server):
+	reader = HTTPRangeReader(f"http://127.0.0.1:{server.server_port}/no-ranges-1.0.0-py3-none-any.whl")
+	assert reader.size == 14
+
+	with pytest.raises(OSError, match="The server does not support range requests"):
+		reader.read()